@@ -0,0 +1,121 @@
+"""
+Benchmark: local JWT verification vs. remote /auth/v1/user validation.
+
+Starts a stub Supabase auth server on localhost (with a configurable
+simulated network latency) and times get_current_user with remote
+validation (cache cleared before each call), remote validation served from
+the token cache, and local verification.
+
+Usage (from backend/):
+    python -m benchmarks.bench_auth [--requests 200] [--latency-ms 50]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+JWT_SECRET = "benchmark-secret-benchmark-secret-0123"
+USER_ID = str(uuid.uuid4())
+
+
+def _start_stub_auth_server(latency_ms: float) -> ThreadingHTTPServer:
+    """Serve GET /auth/v1/user like Supabase does, after an artificial delay."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency_ms / 1000)
+            body = json.dumps({"id": USER_ID}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _summarize(samples):
+    samples = sorted(samples)
+    return {
+        "mean_ms": statistics.mean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+async def _time_calls(get_current_user, credentials, settings, n, before_each=None):
+    samples = []
+    for _ in range(n):
+        if before_each:
+            before_each()
+        start = time.perf_counter()
+        await get_current_user(credentials, settings)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    server = _start_stub_auth_server(args.latency_ms)
+    os.environ["SUPABASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+    os.environ["SUPABASE_JWT_SECRET"] = JWT_SECRET
+
+    # Import after the environment is set so Settings picks it up
+    from fastapi.security import HTTPAuthorizationCredentials
+    from jose import jwt
+    from config import Settings
+    from middleware.auth import get_current_user, token_cache
+    from services.http_client import http_clients
+
+    token = jwt.encode(
+        {"sub": USER_ID, "aud": "authenticated", "exp": int(time.time()) + 3600},
+        JWT_SECRET,
+        algorithm="HS256"
+    )
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    remote = Settings()
+    remote.AUTH_VERIFICATION_MODE = "remote"
+    local = Settings()
+    local.AUTH_VERIFICATION_MODE = "local"
+
+    async def run_all():
+        results = {}
+        results["remote"] = _summarize(
+            await _time_calls(get_current_user, credentials, remote, args.requests, before_each=token_cache.clear)
+        )
+        results["cached"] = _summarize(await _time_calls(get_current_user, credentials, remote, args.requests))
+        results["local"] = _summarize(await _time_calls(get_current_user, credentials, local, args.requests))
+        pool_stats = http_clients.stats()
+        await http_clients.close()
+        return results, pool_stats
+
+    results, pool_stats = asyncio.run(run_all())
+
+    server.shutdown()
+
+    print(f"{args.requests} sequential calls, simulated auth server latency {args.latency_ms:.0f} ms")
+    for mode, stats in results.items():
+        print(f"  {mode:<7} mean {stats['mean_ms']:8.3f} ms   p50 {stats['p50_ms']:8.3f} ms   p95 {stats['p95_ms']:8.3f} ms")
+    print(f"  saved per request by local verification (mean): {results['remote']['mean_ms'] - results['local']['mean_ms']:.3f} ms")
+    print(f"  token cache: {token_cache.stats()}")
+    print(f"  http pool: {pool_stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: event-loop blocking vs. DB thread-pool offload.
+
+Starts a stub PostgREST server on localhost that answers every query after a
+simulated round-trip latency, then issues N concurrent UserService calls
+from a single event loop:
+
+  blocking   calls the sync service directly from a coroutine (the old route behavior)
+  offloaded  awaits run_in_db_pool, as the routes do now
+
+Usage (from backend/):
+    python -m benchmarks.bench_concurrency [--latency-ms 20] [--calls 64]
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+USER_ROW = {
+    "id": str(uuid.uuid4()),
+    "full_name": "Benchmark User",
+    "role": "mentee",
+    "created_at": "2025-01-01T00:00:00+00:00",
+    "updated_at": "2025-01-01T00:00:00+00:00",
+}
+
+
+def _start_stub_postgrest(latency_ms: float) -> ThreadingHTTPServer:
+    """Answer any PostgREST GET with a single user_profiles row."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency_ms / 1000)
+            body = json.dumps([USER_ROW]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(call, concurrency: int, total: int) -> float:
+    """Issue total calls with at most concurrency in flight; return calls/second."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--calls", type=int, default=64)
+    args = parser.parse_args()
+
+    server = _start_stub_postgrest(args.latency_ms)
+    os.environ["SUPABASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+
+    # Import after the environment is set so Settings picks it up
+    from services.database import run_in_db_pool, db_limiter
+    from services.user import UserService
+
+    user_id = uuid.UUID(USER_ROW["id"])
+
+    async def blocking():
+        UserService.get_user_profile(user_id)
+
+    async def offloaded():
+        await run_in_db_pool(UserService.get_user_profile, user_id)
+
+    async def run_all():
+        rows = []
+        for concurrency in (1, 2, 4, 8, 16, 32):
+            rows.append((
+                concurrency,
+                await _run(blocking, concurrency, args.calls),
+                await _run(offloaded, concurrency, args.calls),
+            ))
+        return rows
+
+    rows = asyncio.run(run_all())
+    server.shutdown()
+
+    print(f"{args.calls} calls per level, simulated DB latency {args.latency_ms:.0f} ms, "
+          f"DB pool size {db_limiter.total_tokens:.0f}")
+    print(f"  {'in-flight':>9}  {'blocking (req/s)':>17}  {'offloaded (req/s)':>18}")
+    for concurrency, blocking_rps, offloaded_rps in rows:
+        print(f"  {concurrency:>9}  {blocking_rps:>17.1f}  {offloaded_rps:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
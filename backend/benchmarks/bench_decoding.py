@@ -0,0 +1,146 @@
+"""
+Benchmark: row decoding for the request and mentor list paths.
+
+Decodes synthetic PostgREST rows into response models two ways:
+
+  two-pass   build the domain model field by field (fromisoformat, UUID(),
+             enum lookups), then Response.from_model(cls(**model.dict()))
+             -- the previous service code
+  one-pass   services.decoding (precompiled pydantic-core validators)
+
+Usage (from backend/):
+    python -m benchmarks.bench_decoding [--rows 1000] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:1")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+
+from models.common import HelpType, RequestStatus  # noqa: E402
+from models.interest import Interest  # noqa: E402
+from models.mentor import MentorProfile  # noqa: E402
+from models.request import MentorshipRequest  # noqa: E402
+from schemas.mentor import MentorProfileResponse  # noqa: E402
+from schemas.request import MentorshipRequestResponse  # noqa: E402
+from services.decoding import decode_mentor, decode_requests  # noqa: E402
+
+HELP_TYPES = [ht.value for ht in HelpType]
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _request_rows(count, rng):
+    return [{
+        "id": str(uuid.uuid4()),
+        "mentee_id": str(uuid.uuid4()),
+        "mentor_id": str(uuid.uuid4()),
+        "help_type": rng.choice(HELP_TYPES),
+        "context": "Looking for feedback on my resume before applying to internships.",
+        "key_questions": ["Is my project section strong enough?", "Should I add coursework?"],
+        "status": rng.choice(["pending", "accepted", "declined"]),
+        "created_at": (START + timedelta(seconds=i)).isoformat(),
+        "responded_at": (START + timedelta(seconds=i, hours=5)).isoformat() if i % 2 else None,
+    } for i in range(count)]
+
+
+def _mentor_rows(count, interests, rng):
+    return [({
+        "id": str(uuid.uuid4()),
+        "user_id": str(uuid.uuid4()),
+        "industry": "Engineering",
+        "job_title": "Senior Software Engineer",
+        "help_types_offered": rng.sample(HELP_TYPES, 2),
+        "max_requests_per_week": 3,
+        "profile_picture_url": None,
+        "is_active": True,
+        "pending_requests": 1,
+        "created_at": (START + timedelta(minutes=i)).isoformat(),
+        "updated_at": (START + timedelta(minutes=i)).isoformat(),
+    }, rng.sample(interests, 4)) for i in range(count)]
+
+
+def _two_pass_requests(rows):
+    out = []
+    for data in rows:
+        request = MentorshipRequest(
+            id=uuid.UUID(data["id"]),
+            mentee_id=uuid.UUID(data["mentee_id"]),
+            mentor_id=uuid.UUID(data["mentor_id"]),
+            help_type=HelpType(data["help_type"]),
+            context=data["context"],
+            key_questions=data.get("key_questions") or [],
+            status=RequestStatus(data["status"]),
+            created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
+            responded_at=datetime.fromisoformat(data["responded_at"].replace("Z", "+00:00")) if data.get("responded_at") else None
+        )
+        out.append(MentorshipRequestResponse.from_model(request))
+    return out
+
+
+def _two_pass_mentors(rows):
+    out = []
+    for data, interests in rows:
+        mentor_profile = MentorProfile(
+            id=uuid.UUID(data["id"]),
+            user_id=uuid.UUID(data["user_id"]),
+            industry=data.get("industry"),
+            job_title=data.get("job_title"),
+            help_types_offered=[HelpType(ht) for ht in data.get("help_types_offered", [])],
+            max_requests_per_week=data["max_requests_per_week"],
+            interests=interests,
+            profile_picture_url=data.get("profile_picture_url"),
+            is_active=data.get("is_active", True),
+            created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
+            updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
+        )
+        out.append(MentorProfileResponse.from_model(mentor_profile))
+    return out
+
+
+def _one_pass_mentors(rows):
+    return [decode_mentor(data, interests) for data, interests in rows]
+
+
+def _best_of(fn, rows, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    interests = [
+        Interest(id=uuid.uuid4(), name=f"interest {i}", category="technology", created_at=START)
+        for i in range(60)
+    ]
+    request_rows = _request_rows(args.rows, rng)
+    mentor_rows = _mentor_rows(args.rows, interests, rng)
+
+    # Both paths must produce identical responses
+    assert _two_pass_requests(request_rows[:50]) == decode_requests(request_rows[:50])
+    assert _two_pass_mentors(mentor_rows[:50]) == _one_pass_mentors(mentor_rows[:50])
+
+    print(f"{'path':<10} {'two-pass us/row':>16} {'one-pass us/row':>16} {'speedup':>8}")
+    for name, old, new, rows in (
+        ("requests", _two_pass_requests, decode_requests, request_rows),
+        ("mentors", _two_pass_mentors, _one_pass_mentors, mentor_rows),
+    ):
+        before = _best_of(old, rows, args.repeat)
+        after = _best_of(new, rows, args.repeat)
+        print(f"{name:<10} {before:>16.2f} {after:>16.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""
+Benchmark: end-to-end latency, throughput and DB round trips per endpoint.
+
+Runs the real FastAPI app from main.py in-process (ASGI, lifespan included)
+against benchmarks.fake_postgrest, an in-memory PostgREST stand-in plugged
+into the real supabase client. Auth is stubbed: get_current_user is
+overridden to read the caller's user ID from an X-Bench-User header.
+
+For every dataset size a fresh fake is seeded with that many mentors and
+mentees (plus interests, interest links, request history and connections),
+then every scenario below is issued sequentially:
+
+  users            GET/PUT /api/users/me
+  interests        GET /api/interests (all, by category)
+  mentors          GET/PUT/POST /api/mentors/me, browse, detail
+  mentees          GET/PUT/POST /api/mentees/me, browse
+  requests         create, list (mentee/mentor), export, detail,
+                   accept, decline, batch accept/decline
+  recommendations  GET /api/recommendations
+  ai               POST /api/ai/rewrite-request
+
+Per scenario it reports latency percentiles, sequential throughput, DB
+round trips per request (exact: counted by the fake) and the time spent
+inside the fake ("db_ms"; grows with dataset size because the fake scans
+Python lists, so compare app_ms = latency - db_ms across versions).
+Results can be written as JSON and compared against an earlier run.
+
+Usage (from backend/):
+    python -m benchmarks.bench_endpoints [--sizes 100 1000 5000] [--iterations 100]
+        [--db-latency-ms 0] [--output results.json] [--baseline old.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+os.environ.setdefault("SUPABASE_URL", "http://fake-postgrest.local")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+
+import httpx  # noqa: E402
+
+from benchmarks.fake_postgrest import FakePostgREST  # noqa: E402
+from models.common import HelpType  # noqa: E402
+from services import database  # noqa: E402
+from services.query_stats import QueryStatsTransport  # noqa: E402
+
+INTEREST_CATEGORIES = ["technology", "arts", "sports", "business", "science", "lifestyle"]
+INTEREST_COUNT = 60
+HELP_TYPES = [ht.value for ht in HelpType]
+# Mentors whose inbox is pre-filled with pending requests for the accept/decline scenarios
+INBOX_MENTORS = 10
+BATCH_SIZE = 5
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# One request to issue: (caller user ID, method, path, JSON body)
+Call = Tuple[str, str, str, Optional[dict]]
+
+
+class Scenario(NamedTuple):
+    name: str
+    router: str
+    next_call: Callable[[int], Call]
+
+
+class Dataset:
+    """Seeded fake plus the ID pools the scenarios draw from."""
+
+    def __init__(self, size: int, calls_per_scenario: int, seed: int):
+        self.size = size
+        self.rng = random.Random(seed)
+        self.fake = FakePostgREST()
+        rng = self.rng
+
+        self.interests = [
+            {
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "name": f"interest-{i:02d}",
+                "category": INTEREST_CATEGORIES[i % len(INTEREST_CATEGORIES)],
+                "created_at": START.isoformat(),
+            }
+            for i in range(INTEREST_COUNT)
+        ]
+        self.mentor_users = self._users(size)
+        self.mentee_users = self._users(size)
+        # Users without a profile yet, consumed by the create-profile scenarios
+        self.fresh_mentor_users = self._users(calls_per_scenario)
+        self.fresh_mentee_users = self._users(calls_per_scenario)
+
+        self.mentor_profiles = [self._mentor_profile(user, i) for i, user in enumerate(self.mentor_users)]
+        self.mentee_profiles = [self._mentee_profile(user, i) for i, user in enumerate(self.mentee_users)]
+        mentor_links = [
+            {"mentor_profile_id": profile["id"], "interest_id": interest["id"]}
+            for profile in self.mentor_profiles
+            for interest in rng.sample(self.interests, rng.randint(3, 6))
+        ]
+        mentee_links = [
+            {"mentee_profile_id": profile["id"], "interest_id": interest["id"]}
+            for profile in self.mentee_profiles
+            for interest in rng.sample(self.interests, rng.randint(2, 5))
+        ]
+
+        requests, connections = self._request_history()
+        self.pending_pairs = {(r["mentee_id"], r["mentor_id"]) for r in requests if r["status"] == "pending"}
+        self.inbox: Dict[str, List[str]] = {}
+        # accept + decline + batch scenarios, plus slack so every batch finds BATCH_SIZE in one inbox
+        requests += self._inbox_requests(calls_per_scenario * (2 + BATCH_SIZE) + INBOX_MENTORS * BATCH_SIZE)
+        self.request_ids = [r["id"] for r in requests]
+        self.request_participants = {r["id"]: r["mentee_id"] for r in requests}
+
+        fake = self.fake
+        fake.insert_rows("interests", self.interests)
+        fake.insert_rows("user_profiles", [
+            {"id": user, "full_name": f"User {i}", "role": role}
+            for role, users in (
+                ("mentor", self.mentor_users + self.fresh_mentor_users),
+                ("mentee", self.mentee_users + self.fresh_mentee_users),
+            )
+            for i, user in enumerate(users)
+        ])
+        fake.insert_rows("mentor_profiles", self.mentor_profiles)
+        fake.insert_rows("mentee_profiles", self.mentee_profiles)
+        fake.insert_rows("mentor_interests", mentor_links)
+        fake.insert_rows("mentee_interests", mentee_links)
+        fake.insert_rows("mentorship_requests", requests)
+        fake.insert_rows("connections", connections)
+        fake.rpc_functions["reconcile_pending_request_counts"]({})
+
+    def row_counts(self) -> Dict[str, int]:
+        return {table: len(rows) for table, rows in sorted(self.fake.tables.items())}
+
+    def _users(self, count: int) -> List[str]:
+        return [str(uuid.UUID(int=self.rng.getrandbits(128))) for _ in range(count)]
+
+    def _mentor_profile(self, user_id: str, i: int) -> dict:
+        rng = self.rng
+        return {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "user_id": user_id,
+            "industry": rng.choice(["Engineering", "Design", "Finance", "Healthcare"]),
+            "job_title": "Senior Engineer",
+            "help_types_offered": rng.sample(HELP_TYPES, rng.randint(1, len(HELP_TYPES))),
+            "max_requests_per_week": 1000,
+            "is_active": rng.random() > 0.1,
+            "created_at": (START + timedelta(minutes=i)).isoformat(),
+        }
+
+    def _mentee_profile(self, user_id: str, i: int) -> dict:
+        rng = self.rng
+        return {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "user_id": user_id,
+            "industry": rng.choice(["Engineering", "Design", "Finance", "Healthcare"]),
+            "goals": "Grow as an engineer",
+            "help_needed": rng.sample(HELP_TYPES, rng.randint(1, 2)),
+            "created_at": (START + timedelta(minutes=i)).isoformat(),
+        }
+
+    def _request(self, mentee: str, mentor: str, status: str, minute: int) -> dict:
+        return {
+            "id": str(uuid.UUID(int=self.rng.getrandbits(128))),
+            "mentee_id": mentee,
+            "mentor_id": mentor,
+            "help_type": self.rng.choice(HELP_TYPES),
+            "context": "Would love your advice on my job search.",
+            "key_questions": ["How do I prepare?"],
+            "status": status,
+            "created_at": (START + timedelta(minutes=minute)).isoformat(),
+            "responded_at": None if status == "pending" else (START + timedelta(minutes=minute + 60)).isoformat(),
+        }
+
+    def _request_history(self) -> Tuple[List[dict], List[dict]]:
+        """Two past requests per mentee; accepted ones come with a connection."""
+        rng = self.rng
+        requests, connections, seen = [], [], set()
+        for i, mentee in enumerate(self.mentee_users):
+            for mentor in rng.sample(self.mentor_users[INBOX_MENTORS:], 2):
+                if (mentee, mentor) in seen:
+                    continue
+                seen.add((mentee, mentor))
+                status = rng.choice(["pending", "accepted", "declined"])
+                request = self._request(mentee, mentor, status, i)
+                requests.append(request)
+                if status == "accepted":
+                    connections.append({"mentor_id": mentor, "mentee_id": mentee, "request_id": request["id"]})
+        return requests, connections
+
+    def _inbox_requests(self, count: int) -> List[dict]:
+        """Pending requests to the inbox mentors, each from a distinct mentee per mentor."""
+        requests = []
+        mentors = self.mentor_users[:INBOX_MENTORS]
+        for k in range(count):
+            mentor = mentors[k % len(mentors)]
+            mentee = self.mentee_users[(k // len(mentors)) % len(self.mentee_users)]
+            request = self._request(mentee, mentor, "pending", k)
+            requests.append(request)
+            self.inbox.setdefault(mentor, []).append(request["id"])
+        return requests
+
+    def next_request_pair(self) -> Tuple[str, str]:
+        """A (mentee, mentor) pair without a pending request yet."""
+        while True:
+            pair = (self.rng.choice(self.mentee_users), self.rng.choice(self.mentor_users[INBOX_MENTORS:]))
+            if pair not in self.pending_pairs:
+                self.pending_pairs.add(pair)
+                return pair
+
+    def pop_inbox(self, k: int, count: int) -> Tuple[str, List[str]]:
+        """count pending request IDs owned by one inbox mentor (the fullest inbox)."""
+        mentor = max(self.mentor_users[:INBOX_MENTORS], key=lambda m: len(self.inbox[m]))
+        return mentor, [self.inbox[mentor].pop() for _ in range(count)]
+
+
+def _scenarios(data: Dataset) -> List[Scenario]:
+    rng = data.rng
+    mentee = lambda: rng.choice(data.mentee_users)  # noqa: E731
+    mentor = lambda: rng.choice(data.mentor_users)  # noqa: E731
+    mentor_profile_id = lambda: rng.choice(data.mentor_profiles)["id"]  # noqa: E731
+    interest_ids = lambda n: [i["id"] for i in rng.sample(data.interests, n)]  # noqa: E731
+
+    def create_mentor(k):
+        return data.fresh_mentor_users[k], "POST", "/api/mentors/me", {
+            "industry": "Engineering", "job_title": "Staff Engineer", "help_types_offered": ["resume_review"],
+            "max_requests_per_week": 3, "interest_ids": interest_ids(4),
+        }
+
+    def create_mentee(k):
+        return data.fresh_mentee_users[k], "POST", "/api/mentees/me", {
+            "industry": "Engineering", "goals": "Land an internship", "help_needed": ["mock_interview"],
+            "interest_ids": interest_ids(3),
+        }
+
+    def create_request(k):
+        mentee_user, mentor_user = data.next_request_pair()
+        return mentee_user, "POST", "/api/requests", {
+            "mentor_id": mentor_user, "help_type": "career_advice", "context": "Can we chat about career paths?",
+        }
+
+    def get_request(k):
+        request_id = rng.choice(data.request_ids)
+        return data.request_participants[request_id], "GET", f"/api/requests/{request_id}", None
+
+    def respond(action):
+        def call(k):
+            mentor_user, (request_id,) = data.pop_inbox(k, 1)
+            return mentor_user, "PATCH", f"/api/requests/{request_id}/{action}", None
+        return call
+
+    def respond_batch(k):
+        mentor_user, request_ids = data.pop_inbox(k, BATCH_SIZE)
+        decisions = [{"request_id": rid, "action": rng.choice(["accept", "decline"])} for rid in request_ids]
+        return mentor_user, "PATCH", "/api/requests/batch", {"decisions": decisions}
+
+    return [
+        Scenario("GET /api/users/me", "users", lambda k: (mentee(), "GET", "/api/users/me", None)),
+        Scenario("PUT /api/users/me", "users", lambda k: (mentee(), "PUT", "/api/users/me", {"full_name": f"Renamed {k}"})),
+        Scenario("GET /api/interests", "interests", lambda k: (mentee(), "GET", "/api/interests", None)),
+        Scenario("GET /api/interests?category", "interests",
+                 lambda k: (mentee(), "GET", "/api/interests?category=technology", None)),
+        Scenario("GET /api/mentors/me", "mentors", lambda k: (mentor(), "GET", "/api/mentors/me", None)),
+        Scenario("PUT /api/mentors/me", "mentors",
+                 lambda k: (mentor(), "PUT", "/api/mentors/me", {"job_title": f"Title {k}", "interest_ids": interest_ids(4)})),
+        Scenario("POST /api/mentors/me", "mentors", create_mentor),
+        Scenario("GET /api/mentors", "mentors", lambda k: (mentee(), "GET", "/api/mentors?limit=20", None)),
+        Scenario("GET /api/mentors/{id}", "mentors",
+                 lambda k: (mentee(), "GET", f"/api/mentors/{mentor_profile_id()}", None)),
+        Scenario("GET /api/mentees/me", "mentees", lambda k: (mentee(), "GET", "/api/mentees/me", None)),
+        Scenario("PUT /api/mentees/me", "mentees",
+                 lambda k: (mentee(), "PUT", "/api/mentees/me", {"goals": f"Goal {k}", "interest_ids": interest_ids(3)})),
+        Scenario("POST /api/mentees/me", "mentees", create_mentee),
+        Scenario("GET /api/mentees", "mentees", lambda k: (mentor(), "GET", "/api/mentees?limit=20", None)),
+        Scenario("POST /api/requests", "requests", create_request),
+        Scenario("GET /api/requests (mentee)", "requests", lambda k: (mentee(), "GET", "/api/requests", None)),
+        Scenario("GET /api/requests (mentor)", "requests",
+                 lambda k: (rng.choice(data.mentor_users[:INBOX_MENTORS]), "GET", "/api/requests", None)),
+        Scenario("GET /api/requests/export", "requests",
+                 lambda k: (rng.choice(data.mentor_users[:INBOX_MENTORS]), "GET", "/api/requests/export", None)),
+        Scenario("GET /api/requests/{id}", "requests", get_request),
+        Scenario("PATCH /api/requests/{id}/accept", "requests", respond("accept")),
+        Scenario("PATCH /api/requests/{id}/decline", "requests", respond("decline")),
+        Scenario(f"PATCH /api/requests/batch ({BATCH_SIZE})", "requests", respond_batch),
+        Scenario("GET /api/recommendations", "recommendations",
+                 lambda k: (mentee(), "GET", "/api/recommendations?limit=10", None)),
+        Scenario("POST /api/ai/rewrite-request", "ai", lambda k: (mentee(), "POST", "/api/ai/rewrite-request", {
+            "original_text": "hi can you help me with my resume", "questions": ["What should I fix first?"],
+        })),
+    ]
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def _run_scenario(client: httpx.AsyncClient, fake: FakePostgREST, scenario: Scenario,
+                        iterations: int, warmup: int) -> dict:
+    latencies, db_times, round_trips, statuses = [], [], [], Counter()
+    tables: Counter = Counter()
+    elapsed = 0.0
+    for k in range(warmup + iterations):
+        user_id, method, path, body = scenario.next_call(k)
+        fake.reset_counters()
+        started = time.perf_counter()
+        response = await client.request(method, path, json=body, headers={"X-Bench-User": user_id})
+        latency = time.perf_counter() - started
+        if k < warmup:
+            continue
+        elapsed += latency
+        latencies.append(latency * 1000)
+        db_times.append(fake.busy_seconds * 1000)
+        round_trips.append(fake.request_count)
+        tables.update(fake.requests_by_table)
+        statuses[str(response.status_code)] += 1
+
+    ordered = sorted(latencies)
+    app_times = sorted(latency - db for latency, db in zip(latencies, db_times))
+    return {
+        "router": scenario.router,
+        "requests": iterations,
+        "status_codes": dict(statuses),
+        "latency_ms": {
+            "p50": round(_percentile(ordered, 0.50), 3),
+            "p90": round(_percentile(ordered, 0.90), 3),
+            "p99": round(_percentile(ordered, 0.99), 3),
+            "mean": round(statistics.fmean(ordered), 3),
+            "max": round(ordered[-1], 3),
+        },
+        "app_ms_p50": round(_percentile(app_times, 0.50), 3),
+        "db_ms_mean": round(statistics.fmean(db_times), 3),
+        "throughput_rps": round(iterations / elapsed, 1),
+        "db_round_trips": {
+            "mean": round(statistics.fmean(round_trips), 2),
+            "max": max(round_trips),
+            "by_table": {table: round(count / iterations, 2) for table, count in sorted(tables.items())},
+        },
+    }
+
+
+async def _run_dataset(app, lifespan, data: Dataset, iterations: int, warmup: int) -> dict:
+    from services.recommendation_index import recommendation_index
+
+    # Point the shared supabase client at this dataset's fake
+    database.supabase.options.httpx_client = httpx.Client(transport=QueryStatsTransport(data.fake.transport()))
+    database.supabase._postgrest = None
+
+    started = time.time()
+    async with lifespan(app):
+        # Wait for the startup index build so the feed is measured on its fast path
+        while recommendation_index.built_at is None or recommendation_index.built_at < started:
+            await asyncio.sleep(0.01)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            results = {}
+            for scenario in _scenarios(data):
+                results[scenario.name] = await _run_scenario(client, data.fake, scenario, iterations, warmup)
+                print(_format_row(scenario.name, results[scenario.name]), flush=True)
+    return {"size": data.size, "rows": data.row_counts(), "endpoints": results}
+
+
+def _format_row(name: str, result: dict, baseline: Optional[dict] = None) -> str:
+    latency = result["latency_ms"]
+    row = (
+        f"  {name:<36} p50 {latency['p50']:>8.2f}  p90 {latency['p90']:>8.2f}  p99 {latency['p99']:>8.2f} ms"
+        f"  {result['throughput_rps']:>8.0f} req/s  db {result['db_round_trips']['mean']:>5.2f} trips"
+        f"  app p50 {result['app_ms_p50']:>7.2f} ms"
+    )
+    errors = {code: n for code, n in result["status_codes"].items() if code >= "400"}
+    if errors:
+        row += f"  errors {errors}"
+    if baseline is not None:
+        before = baseline["app_ms_p50"]
+        change = (result["app_ms_p50"] - before) / before * 100 if before else 0.0
+        trips = result["db_round_trips"]["mean"] - baseline["db_round_trips"]["mean"]
+        row += f"  | vs baseline: app p50 {change:+.1f}%, trips {trips:+.2f}"
+    return row
+
+
+def _compare(results: dict, baseline: dict) -> None:
+    baseline_sets = {dataset["size"]: dataset for dataset in baseline["datasets"]}
+    for dataset in results["datasets"]:
+        old = baseline_sets.get(dataset["size"])
+        if old is None:
+            continue
+        print(f"\nsize {dataset['size']} vs baseline")
+        for name, result in dataset["endpoints"].items():
+            if name in old["endpoints"]:
+                print(_format_row(name, result, old["endpoints"][name]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="Mentors (and mentees) per seeded dataset")
+    parser.add_argument("--iterations", type=int, default=100, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per scenario")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0,
+                        help="Simulated network latency added to every fake PostgREST request")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Earlier --output file to compare against")
+    args = parser.parse_args()
+
+    import main as app_module
+    from middleware.auth import get_current_user
+    from fastapi import Request
+
+    async def bench_user(request: Request) -> uuid.UUID:
+        return uuid.UUID(request.headers["X-Bench-User"])
+
+    app_module.app.dependency_overrides[get_current_user] = bench_user
+
+    async def run() -> List[dict]:
+        datasets = []
+        for size in args.sizes:
+            data = Dataset(size, args.warmup + args.iterations, args.seed)
+            data.fake.latency_ms = args.db_latency_ms
+            print(f"\nsize {size}: {data.row_counts()}")
+            datasets.append(await _run_dataset(
+                app_module.app, app_module.lifespan, data, args.iterations, args.warmup
+            ))
+        return datasets
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "db_latency_ms": args.db_latency_ms,
+            "seed": args.seed,
+        },
+        "datasets": asyncio.run(run()),
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            _compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
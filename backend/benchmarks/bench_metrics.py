@@ -0,0 +1,105 @@
+"""
+Benchmark: per-request overhead of the metrics middleware.
+
+Calls a trivial ASGI endpoint directly (no HTTP client in the loop) with
+and without MetricsMiddleware and reports the added time per request,
+then times a /metrics scrape once the histogram holds a realistic number
+of series. Exits with status 1 when either number is over budget, so it
+can gate changes to services/metrics.py and middleware/metrics.py.
+
+Budgets:
+  request overhead   OVERHEAD_BUDGET_US per request
+  scrape             SCRAPE_BUDGET_MS for --routes x methods x statuses series
+
+Usage (from backend/):
+    python -m benchmarks.bench_metrics [--requests 50000] [--routes 40]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:1")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+
+from middleware.metrics import MetricsMiddleware  # noqa: E402
+from services.metrics import registry, http_request_duration  # noqa: E402
+
+OVERHEAD_BUDGET_US = 15.0
+SCRAPE_BUDGET_MS = 25.0
+
+_START = {"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"2")]}
+_BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+class _Route:
+    path_format = "/api/mentors/{mentor_id}"
+
+
+async def _endpoint(scope, receive, send):
+    # What the router leaves in the scope for a matched route
+    scope["route"] = _Route
+    await send(_START)
+    await send(_BODY)
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+async def _per_request_us(app, total: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/api/mentors/123", "headers": []}
+    for _ in range(1000):
+        await app(dict(scope), _receive, _send)
+    start = time.perf_counter()
+    for _ in range(total):
+        await app(dict(scope), _receive, _send)
+    return (time.perf_counter() - start) / total * 1e6
+
+
+def _scrape_ms(routes: int) -> float:
+    for index in range(routes):
+        for method in ("GET", "POST", "PUT", "PATCH"):
+            for status in ("200", "201", "400", "404", "500"):
+                http_request_duration.observe(0.01 * (index % 7), method, f"/api/route{index}", status)
+    registry.render()
+    start = time.perf_counter()
+    rounds = 20
+    for _ in range(rounds):
+        registry.render()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+async def _run(args) -> bool:
+    # Best of three to keep scheduler noise out of a sub-microsecond difference
+    bare = min([await _per_request_us(_endpoint, args.requests) for _ in range(3)])
+    wrapped = min([await _per_request_us(MetricsMiddleware(_endpoint), args.requests) for _ in range(3)])
+    overhead = wrapped - bare
+    scrape = _scrape_ms(args.routes)
+    series = args.routes * 4 * 5
+
+    print(f"bare endpoint          {bare:8.2f} us/request")
+    print(f"with MetricsMiddleware {wrapped:8.2f} us/request")
+    print(f"overhead               {overhead:8.2f} us/request   (budget {OVERHEAD_BUDGET_US} us)")
+    print(f"/metrics render        {scrape:8.2f} ms for {series} histogram series   (budget {SCRAPE_BUDGET_MS} ms)")
+
+    within = overhead <= OVERHEAD_BUDGET_US and scrape <= SCRAPE_BUDGET_MS
+    print("within budget" if within else "OVER BUDGET")
+    return within
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--routes", type=int, default=40, help="Route templates in the scraped histogram")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(_run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: vectorized recommendation index vs. per-mentor Python scoring.
+
+Fills the in-memory recommendation index with synthetic mentors (no
+database involved), then ranks random mentees against the whole catalog:
+
+  python   set intersection per mentor + full sort (the old scoring loop,
+           applied to every mentor instead of a limit*2 window)
+  index    RecommendationIndex.top_k (bitset AND + popcount + argpartition)
+
+Usage (from backend/):
+    python -m benchmarks.bench_recommendations [--mentors 10000 100000] [--queries 200]
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:1")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+
+from models.common import HelpType  # noqa: E402
+from services.recommendation_index import RecommendationIndex  # noqa: E402
+
+INTEREST_COUNT = 60
+HELP_TYPES = [ht.value for ht in HelpType]
+
+
+def _synthetic_mentors(count: int, interest_ids, rng: random.Random):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        yield {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "user_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "help_types_offered": rng.sample(HELP_TYPES, rng.randint(1, len(HELP_TYPES))),
+            "is_active": rng.random() > 0.1,
+            "created_at": (start + timedelta(minutes=i)).isoformat(),
+            "mentor_interests": [{"interest_id": iid} for iid in rng.sample(interest_ids, rng.randint(1, 8))],
+        }
+
+
+def _python_top_k(mentors, mentee_interests, help_type, limit):
+    scored = []
+    for mentor in mentors:
+        if not mentor["is_active"] or help_type not in mentor["help_types_offered"]:
+            continue
+        mentor_interests = {link["interest_id"] for link in mentor["mentor_interests"]}
+        scored.append((len(mentee_interests & mentor_interests), mentor["created_at"], mentor["id"]))
+    scored.sort(reverse=True)
+    return [mentor_id for _, _, mentor_id in scored[:limit]]
+
+
+def _timed(fn, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(*query)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mentors", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    interest_ids = [str(uuid.uuid4()) for _ in range(INTEREST_COUNT)]
+
+    print(f"{'mentors':>8} {'build ms':>9} {'python p50':>11} {'python p99':>11} {'index p50':>10} {'index p99':>10}")
+    for count in args.mentors:
+        mentors = list(_synthetic_mentors(count, interest_ids, rng))
+        index = RecommendationIndex()
+
+        start = time.perf_counter()
+        for row in mentors:
+            index.upsert(row)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        queries = [
+            (set(rng.sample(interest_ids, rng.randint(1, 6))), HelpType(rng.choice(HELP_TYPES)))
+            for _ in range(args.queries)
+        ]
+
+        # Both implementations must agree on the ranking
+        for mentee_interests, help_type in queries[:5]:
+            expected = _python_top_k(mentors, mentee_interests, help_type.value, args.limit)
+            assert index.top_k(mentee_interests, help_type, (), args.limit) == expected
+
+        python_p50, python_p99 = _timed(
+            lambda interests, ht: _python_top_k(mentors, interests, ht.value, args.limit), queries
+        )
+        index_p50, index_p99 = _timed(
+            lambda interests, ht: index.top_k(interests, ht, (), args.limit), queries
+        )
+        print(f"{count:>8} {build_ms:>9.0f} {python_p50:>11.2f} {python_p99:>11.2f} {index_p50:>10.3f} {index_p99:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
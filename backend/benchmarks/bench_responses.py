@@ -0,0 +1,99 @@
+"""
+Benchmark: JSON response paths for the list endpoints.
+
+Serves the same pre-built response models from three minimal in-process
+FastAPI apps and measures sequential request throughput over ASGI:
+
+  response_model   return the models; FastAPI re-validates and serializes them
+  orjson           the same, with default_response_class=ORJSONResponse
+                   (skipped when orjson is not installed)
+  trusted          return routes.responses.trusted_json(...) as the routers do
+
+Usage (from backend/):
+    python -m benchmarks.bench_responses [--requests 2000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+import uuid
+import warnings
+from typing import List
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1:1")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-service-role-key")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from benchmarks.bench_decoding import START, _mentor_rows, _request_rows  # noqa: E402
+from models.interest import Interest  # noqa: E402
+from routes.responses import trusted_json  # noqa: E402
+from schemas.mentor import MentorProfileResponse  # noqa: E402
+from schemas.request import MentorshipRequestListResponse  # noqa: E402
+from services.decoding import decode_mentor, decode_requests  # noqa: E402
+
+
+def _build_app(mentors, requests, trusted: bool = False, response_class=None) -> FastAPI:
+    app = FastAPI(default_response_class=response_class) if response_class else FastAPI()
+
+    @app.get("/mentors", response_model=List[MentorProfileResponse])
+    async def mentors_route():
+        return trusted_json(mentors, List[MentorProfileResponse]) if trusted else mentors
+
+    @app.get("/requests", response_model=MentorshipRequestListResponse)
+    async def requests_route():
+        return trusted_json(requests, MentorshipRequestListResponse) if trusted else requests
+
+    return app
+
+
+async def _throughput(app: FastAPI, path: str, total: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(total):
+            await client.get(path)
+        return total / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--mentors", type=int, default=50, help="Mentors per /mentors page")
+    parser.add_argument("--rows", type=int, default=200, help="Requests per /requests page")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    interests = [
+        Interest(id=uuid.uuid4(), name=f"interest {i}", category="technology", created_at=START)
+        for i in range(60)
+    ]
+    mentors = [decode_mentor(data, links) for data, links in _mentor_rows(args.mentors, interests, rng)]
+    requests = MentorshipRequestListResponse(
+        requests=decode_requests(_request_rows(args.rows, rng)), total=args.rows
+    )
+
+    variants = [("response_model", _build_app(mentors, requests))]
+    try:
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            variants.append(("orjson", _build_app(mentors, requests, response_class=ORJSONResponse)))
+    except ImportError:
+        pass
+    variants.append(("trusted", _build_app(mentors, requests, trusted=True)))
+
+    print(f"{'path':<16} {'/mentors req/s':>15} {'/requests req/s':>16}")
+    for name, app in variants:
+        mentors_rps = asyncio.run(_throughput(app, "/mentors", args.requests))
+        requests_rps = asyncio.run(_throughput(app, "/requests", args.requests))
+        print(f"{name:<16} {mentors_rps:>15.0f} {requests_rps:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
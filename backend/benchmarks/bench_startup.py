@@ -0,0 +1,108 @@
+"""
+Benchmark: cold import time of the app (python -X importtime).
+
+Imports main in fresh interpreters without any Supabase credentials in the
+environment, the way a new container or a test run first touches the code,
+and reports:
+
+  import main         median cumulative import time of main (-X importtime)
+  process             median wall time of `python -c "import main"`
+  slowest modules     top-level imports by cumulative time (last run)
+
+It also checks that importing the app stays lazy: the supabase package
+must not be imported until the client is first used (services.database).
+Exits with status 1 if the import is over IMPORT_BUDGET_MS or the check
+fails.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup [--runs 7] [--top 15]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Cumulative import time budget for `import main` on a cold interpreter
+IMPORT_BUDGET_MS = 500.0
+
+# Imported on first use / in the lifespan, never by `import main`
+LAZY_MODULES = ("supabase", "postgrest._sync.client", "gotrue", "supabase_auth", "storage3")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _clean_env() -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("SUPABASE_")}
+    env["PYTHONPATH"] = str(BACKEND_DIR)
+    return env
+
+
+def _import_once() -> Tuple[float, List[Tuple[int, int, str]]]:
+    """Return (wall seconds, [(cumulative us, depth, module)]) for one cold import."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, env=_clean_env(), capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(f"import main failed:\n{result.stderr[-2000:]}")
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+    return wall, modules
+
+
+def _interpreter_baseline(runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], env=_clean_env(), check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15, help="Slowest top-level imports to list")
+    args = parser.parse_args()
+
+    walls, main_times, modules = [], [], []
+    for _ in range(args.runs):
+        wall, modules = _import_once()
+        walls.append(wall)
+        main_times.append(next(us for us, _, name in modules if name == "main") / 1000)
+
+    import_ms = statistics.median(main_times)
+    baseline = _interpreter_baseline(args.runs)
+    loaded = {name for _, _, name in modules}
+    eager = [name for name in LAZY_MODULES if name in loaded]
+
+    print(f"import main     {import_ms:8.1f} ms   (budget {IMPORT_BUDGET_MS:.0f} ms, median of {args.runs})")
+    print(f"process         {statistics.median(walls) * 1000:8.1f} ms   (interpreter alone {baseline * 1000:.1f} ms)")
+    print(f"modules loaded  {len(loaded):8d}")
+    print("\nslowest imports under main (cumulative):")
+    # importtime indents each nesting level by two spaces; `main` itself has one
+    children = sorted((entry for entry in modules if entry[1] == 3), reverse=True)
+    for us, _, name in children[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    ok = import_ms <= IMPORT_BUDGET_MS and not eager
+    if eager:
+        print(f"\nimported eagerly (should be lazy): {', '.join(eager)}")
+    print("\nwithin budget" if ok else "\nOVER BUDGET")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
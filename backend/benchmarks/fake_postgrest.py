@@ -0,0 +1,714 @@
+"""
+In-memory stand-in for Supabase's PostgREST API.
+
+FakePostgREST implements the subset of the PostgREST HTTP protocol this
+backend uses (filters, ordering, offset/limit, embedded resources, inserts,
+updates, deletes, upserts and the RPC functions in database/*.sql) over
+plain Python lists, and plugs into the real supabase client as an
+httpx.MockTransport. Requests therefore go through the same client code,
+URL building and JSON (de)serialization as in production, minus the
+network. Every request is counted so callers can report round trips.
+"""
+import json
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote
+
+import httpx
+
+# Foreign keys used to resolve embedded resources: (table, column) -> referenced table
+FOREIGN_KEYS = {
+    ("mentor_interests", "mentor_profile_id"): "mentor_profiles",
+    ("mentor_interests", "interest_id"): "interests",
+    ("mentee_interests", "mentee_profile_id"): "mentee_profiles",
+    ("mentee_interests", "interest_id"): "interests",
+}
+
+# Columns filled in on insert when not provided
+DEFAULTS: Dict[str, Dict[str, Callable[[], Any]]] = {
+    "interests": {"category": lambda: None},
+    "mentor_profiles": {
+        "industry": lambda: None,
+        "job_title": lambda: None,
+        "help_types_offered": list,
+        "max_requests_per_week": lambda: 3,
+        "is_active": lambda: True,
+        "profile_picture_url": lambda: None,
+        "pending_requests": lambda: 0,
+    },
+    "mentee_profiles": {
+        "industry": lambda: None,
+        "goals": lambda: None,
+        "help_needed": list,
+        "background": lambda: None,
+        "profile_picture_url": lambda: None,
+    },
+    "mentorship_requests": {
+        "key_questions": list,
+        "status": lambda: "pending",
+        "responded_at": lambda: None,
+    },
+    "connections": {"request_id": lambda: None},
+}
+
+# Unique keys enforced on insert: table -> list of column tuples
+UNIQUE_KEYS = {
+    "user_profiles": [("id",)],
+    "interests": [("id",), ("name",)],
+    "mentor_profiles": [("id",), ("user_id",)],
+    "mentee_profiles": [("id",), ("user_id",)],
+    "mentor_interests": [("mentor_profile_id", "interest_id")],
+    "mentee_interests": [("mentee_profile_id", "interest_id")],
+    "mentorship_requests": [("id",)],
+    "connections": [("id",), ("mentor_id", "mentee_id")],
+}
+
+PRIMARY_KEY_TABLES = {"mentor_interests", "mentee_interests"}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _embedded_relations(select: str) -> set:
+    """Names of the resources embedded in a select expression."""
+    return {
+        item.split("(", 1)[0].rpartition(":")[2].split("!")[0].strip()
+        for item in _split_top_level(unquote(select))
+        if "(" in item
+    }
+
+
+def _split_top_level(text: str, sep: str = ",") -> List[str]:
+    """Split on sep, ignoring separators nested inside parentheses."""
+    parts, depth, current = [], 0, ""
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == sep and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _parse_list(value: str) -> List[str]:
+    """Parse '(a,b,"c")' or '{a,b}' into a list of strings."""
+    inner = value[1:-1]
+    if not inner:
+        return []
+    return [item.strip().strip('"') for item in inner.split(",")]
+
+
+def _coerce(value: str) -> Any:
+    if value == "true":
+        return True
+    if value == "false":
+        return False
+    if value == "null":
+        return None
+    return value
+
+
+def _compare(a: Any, b: Any) -> Tuple[Any, Any]:
+    """Make a DB value and a filter literal comparable."""
+    if isinstance(a, bool):
+        return a, _coerce(b) if isinstance(b, str) else b
+    if isinstance(a, (int, float)) and isinstance(b, str):
+        try:
+            return a, type(a)(b)
+        except ValueError:
+            return str(a), b
+    return (str(a) if a is not None else None), b
+
+
+def _matches(row: dict, column: str, expression: str) -> bool:
+    negate = False
+    if expression.startswith("not."):
+        negate = True
+        expression = expression[4:]
+    op, _, raw = expression.partition(".")
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        raw = raw[1:-1]
+    value = row.get(column)
+
+    if op == "eq":
+        a, b = _compare(value, raw)
+        result = a == b
+    elif op == "neq":
+        a, b = _compare(value, raw)
+        result = a != b
+    elif op in ("gt", "gte", "lt", "lte"):
+        if value is None:
+            result = False
+        else:
+            a, b = _compare(value, raw)
+            result = {"gt": a > b, "gte": a >= b, "lt": a < b, "lte": a <= b}[op]
+    elif op == "in":
+        options = _parse_list(raw)
+        result = value is not None and _compare(value, options[0] if options else "")[0] in options
+    elif op == "cs":
+        result = set(_parse_list(raw)).issubset(set(value or []))
+    elif op in ("ilike", "like"):
+        pattern = re.escape(raw).replace("\\*", ".*").replace("%", ".*")
+        flags = re.IGNORECASE if op == "ilike" else 0
+        result = value is not None and re.fullmatch(pattern, str(value), flags) is not None
+    elif op == "is":
+        result = value is _coerce(raw)
+    else:
+        raise ValueError(f"Unsupported filter operator: {op}")
+
+    return not result if negate else result
+
+
+def _matches_or(row: dict, expression: str) -> bool:
+    """Evaluate an or=(a.op.v,b.op.v) / and(...) filter group."""
+    for clause in _split_top_level(expression[1:-1]):
+        if clause.startswith("and("):
+            if all(_match_clause(row, part) for part in _split_top_level(clause[4:-1])):
+                return True
+        elif _match_clause(row, clause):
+            return True
+    return False
+
+
+def _match_clause(row: dict, clause: str) -> bool:
+    column, _, expression = clause.partition(".")
+    return _matches(row, column, expression)
+
+
+class FakePostgREST:
+    """In-memory tables served over the PostgREST HTTP protocol."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.tables: Dict[str, List[dict]] = {}
+        self.rpc_functions: Dict[str, Callable[[dict], Any]] = {}
+        self.latency_ms = latency_ms
+        self.request_count = 0
+        self.requests_by_table: Counter = Counter()
+        # Seconds spent inside handle(), so callers can separate app time from "database" time
+        self.busy_seconds = 0.0
+        self._lock = threading.RLock()
+        # Hash indexes on *_id columns, kept up to date by _append/_remove; an
+        # update that re-keys rows bumps the table's version to force a rebuild.
+        # Positions only need to be increasing in table order, so removals
+        # leave gaps instead of renumbering.
+        self._table_versions: Counter = Counter()
+        self._next_position: Counter = Counter()
+        self._indexes: Dict[Tuple[str, str], Tuple[int, Dict[str, List[Tuple[int, dict]]]]] = {}
+        self._register_rpc_functions()
+
+    # ----- setup -----
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def insert_rows(self, table: str, rows: List[dict]) -> None:
+        """Load seed rows directly (not counted as requests)."""
+        with self._lock:
+            target = self.tables.setdefault(table, [])
+            for row in rows:
+                target.append(self._with_defaults(table, dict(row)))
+            self._table_versions[table] += 1
+
+    def reset_counters(self) -> None:
+        self.request_count = 0
+        self.requests_by_table.clear()
+        self.busy_seconds = 0.0
+
+    # ----- HTTP entry point -----
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        started = time.perf_counter()
+        try:
+            return self._handle(request)
+        finally:
+            self.busy_seconds += time.perf_counter() - started
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        match = re.match(r"^/rest/v1/(rpc/)?([\w]+)$", path)
+        if not match:
+            return httpx.Response(404, json={"message": f"Unknown path {path}"})
+
+        is_rpc, name = bool(match.group(1)), match.group(2)
+        params = parse_qsl(request.url.query.decode(), keep_blank_values=True)
+        body = json.loads(request.content) if request.content else None
+
+        with self._lock:
+            self.request_count += 1
+            self.requests_by_table["rpc:" + name if is_rpc else name] += 1
+            if request.method == "PATCH" and any(k == "id" or k.endswith("_id") for k in body or {}):
+                self._table_versions[name] += 1
+            try:
+                if is_rpc:
+                    return self._rpc(name, body)
+                return self._table_request(request, name, params, body)
+            except ConflictError as e:
+                return httpx.Response(409, json={"code": "23505", "message": str(e), "details": None, "hint": None})
+            except RPCError as e:
+                return httpx.Response(400, json={"code": e.code, "message": str(e), "details": None, "hint": None})
+
+    def _table_request(self, request: httpx.Request, table: str, params, body) -> httpx.Response:
+        select, filters, order, offset, limit, on_conflict = "*", [], None, 0, None, None
+        for key, value in params:
+            if key == "select":
+                select = value
+            elif key == "order":
+                order = value
+            elif key == "offset":
+                offset = int(value)
+            elif key == "limit":
+                limit = int(value)
+            elif key == "on_conflict":
+                on_conflict = value
+            elif key == "columns":
+                continue
+            else:
+                filters.append((key, value))
+
+        prefer = request.headers.get("prefer", "")
+        wants_object = "vnd.pgrst.object" in request.headers.get("accept", "")
+        rows_table = self.tables.setdefault(table, [])
+
+        if request.method in ("GET", "HEAD"):
+            relations = _embedded_relations(select)
+            embedded = [(c, e) for c, e in filters if c.split(".", 1)[0] in relations]
+            rows = self._filter(table, rows_table, [(c, e) for c, e in filters if (c, e) not in embedded])
+            rows = self._filter_embedded(table, rows, embedded, select)
+            total = len(rows)
+            if order:
+                rows = self._order(rows, order)
+            rows = rows[offset: offset + limit if limit is not None else None]
+            result = [self._project(table, row, select, embedded) for row in rows]
+            headers = {}
+            if "count=exact" in prefer:
+                headers["content-range"] = f"{offset}-{offset + len(result) - 1}/{total}" if result else f"*/{total}"
+            return self._respond(result, wants_object, headers)
+
+        if request.method == "POST":
+            payload = body if isinstance(body, list) else [body]
+            upsert = "resolution=merge-duplicates" in prefer or "resolution=ignore-duplicates" in prefer
+            ignore = "resolution=ignore-duplicates" in prefer
+            inserted = []
+            for item in payload:
+                row = self._with_defaults(table, dict(item))
+                existing = self._find_conflict(table, row, on_conflict)
+                if existing is not None:
+                    if not upsert:
+                        raise ConflictError(f'duplicate key value violates unique constraint on "{table}"')
+                    if not ignore:
+                        existing.update({k: v for k, v in item.items()})
+                        inserted.append(existing)
+                    continue
+                self._append(table, row)
+                inserted.append(row)
+                self._after_write(table, None, row)
+            result = [self._project(table, row, select) for row in inserted]
+            return self._respond(result if "return=minimal" not in prefer else [], wants_object, status=201)
+
+        if request.method == "PATCH":
+            rows = self._filter(table, rows_table, filters)
+            for row in rows:
+                before = dict(row)
+                row.update(body)
+                self._after_write(table, before, row)
+            return self._respond([self._project(table, row, select) for row in rows], wants_object)
+
+        if request.method == "DELETE":
+            rows = self._filter(table, rows_table, filters)
+            self._remove(table, rows)
+            self._cascade_delete(table, rows)
+            for row in rows:
+                self._after_write(table, row, None)
+            return self._respond([self._project(table, row, select) for row in rows], wants_object)
+
+        return httpx.Response(405)
+
+    def _respond(self, result, wants_object: bool, headers=None, status: int = 200) -> httpx.Response:
+        if wants_object:
+            if len(result) != 1:
+                return httpx.Response(406, json={
+                    "code": "PGRST116",
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                    "details": f"The result contains {len(result)} rows",
+                    "hint": None
+                })
+            return httpx.Response(status, json=result[0], headers=headers)
+        return httpx.Response(status, json=result, headers=headers)
+
+    # ----- query helpers -----
+
+    def _filter(self, table: str, rows: List[dict], filters) -> List[dict]:
+        if not filters:
+            return list(rows)
+        if rows is self.tables.get(table):
+            rows = self._indexed_candidates(table, filters, rows)
+        out = []
+        for row in rows:
+            ok = True
+            for column, expression in filters:
+                if column == "or":
+                    ok = _matches_or(row, expression)
+                else:
+                    ok = _matches(row, column, expression)
+                if not ok:
+                    break
+            if ok:
+                out.append(row)
+        return out
+
+    def _filter_embedded(self, table: str, rows: List[dict], embedded, select: str) -> List[dict]:
+        """Embedded filters only drop parents when the relation is embedded with !inner."""
+        inner = {
+            item.split("(", 1)[0].rpartition(":")[2].split("!")[0]
+            for item in _split_top_level(unquote(select))
+            if "!inner(" in item
+        }
+        out = []
+        for row in rows:
+            ok = True
+            for column, expression in embedded:
+                relation, _, child_column = column.partition(".")
+                if not child_column:
+                    # mentor_interests=is.null: the (filtered) embed is empty
+                    child_filters = [(c.split(".", 1)[1], e) for c, e in embedded if c.startswith(relation + ".")]
+                    children = self._filter(relation, self._children(table, row, relation), child_filters)
+                    ok = _matches({relation: children or None}, relation, expression)
+                elif relation in inner:
+                    children = self._children(table, row, relation)
+                    ok = any(_matches(child, child_column, expression) for child in children)
+                if not ok:
+                    break
+            if ok:
+                out.append(row)
+        return out
+
+    @staticmethod
+    def _order(rows: List[dict], order: str) -> List[dict]:
+        for term in reversed(order.split(",")):
+            parts = term.split(".")
+            column = parts[0]
+            descending = "desc" in parts[1:]
+            present = [r for r in rows if r.get(column) is not None]
+            missing = [r for r in rows if r.get(column) is None]
+            present.sort(key=lambda r: r[column], reverse=descending)
+            rows = present + missing if descending is False else missing + present
+        return rows
+
+    def _project(self, table: str, row: dict, select: str, embedded=()) -> dict:
+        out: Dict[str, Any] = {}
+        for item in _split_top_level(unquote(select)):
+            item = item.strip()
+            if item == "*":
+                out.update(row)
+                continue
+            if "(" not in item:
+                out[item] = row.get(item)
+                continue
+            head, inner = item.split("(", 1)
+            inner = inner[:-1]
+            alias, _, relation = head.rpartition(":")
+            relation = relation.split("!")[0]
+            key = alias or relation
+            referenced = self._referenced_row(table, row, relation)
+            if referenced is not _NO_RELATION:
+                out[key] = self._project(relation, referenced, inner) if referenced else None
+            else:
+                child_filters = [
+                    (column.split(".", 1)[1], expression)
+                    for column, expression in embedded
+                    if column.startswith(relation + ".")
+                ]
+                children = self._filter(relation, self._children(table, row, relation), child_filters)
+                out[key] = [self._project(relation, child, inner) for child in children]
+        return out
+
+    def _referenced_row(self, table: str, row: dict, relation: str):
+        """Many-to-one: table has a FK column pointing at relation."""
+        for (fk_table, column), referenced in FOREIGN_KEYS.items():
+            if fk_table == table and referenced == relation:
+                target = row.get(column)
+                for candidate in self.tables.get(relation, []):
+                    if candidate.get("id") == target:
+                        return candidate
+                return None
+        return _NO_RELATION
+
+    def _children(self, table: str, row: dict, relation: str) -> List[dict]:
+        """One-to-many: relation has a FK column pointing at table."""
+        for (fk_table, column), referenced in FOREIGN_KEYS.items():
+            if fk_table == relation and referenced == table:
+                return [child for _, child in self._index(relation, column).get(str(row.get("id")), [])]
+        raise ValueError(f"No relationship between {table} and {relation}")
+
+    def _index(self, table: str, column: str) -> Dict[str, List[Tuple[int, dict]]]:
+        """column value -> [(position, row)] for table, cached until the next write."""
+        version = self._table_versions[table]
+        cached = self._indexes.get((table, column))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        rows = self.tables.get(table, [])
+        base = self._next_position[table]
+        self._next_position[table] = base + len(rows)
+        index: Dict[str, List[Tuple[int, dict]]] = {}
+        for position, row in enumerate(rows, start=base):
+            index.setdefault(str(row.get(column)), []).append((position, row))
+        self._indexes[(table, column)] = (version, index)
+        return index
+
+    def _append(self, table: str, row: dict) -> None:
+        """Append a row and add it to the table's current indexes."""
+        self.tables.setdefault(table, []).append(row)
+        position = self._next_position[table]
+        self._next_position[table] += 1
+        for column, index in self._current_indexes(table):
+            index.setdefault(str(row.get(column)), []).append((position, row))
+
+    def _remove(self, table: str, removed: List[dict]) -> None:
+        """Delete rows (by identity) from a table and its current indexes."""
+        if not removed:
+            return
+        ids = {id(row) for row in removed}
+        self.tables[table] = [row for row in self.tables.get(table, []) if id(row) not in ids]
+        for column, index in self._current_indexes(table):
+            for key in {str(row.get(column)) for row in removed}:
+                remaining = [entry for entry in index.get(key, []) if id(entry[1]) not in ids]
+                if remaining:
+                    index[key] = remaining
+                else:
+                    index.pop(key, None)
+
+    def _current_indexes(self, table: str) -> List[Tuple[str, Dict[str, List[Tuple[int, dict]]]]]:
+        version = self._table_versions[table]
+        return [
+            (column, index)
+            for (indexed_table, column), (index_version, index) in self._indexes.items()
+            if indexed_table == table and index_version == version
+        ]
+
+    def _rows_with(self, table: str, column: str, value: Any) -> List[dict]:
+        """Rows whose column equals value (indexed for ID columns)."""
+        if column == "id" or column.endswith("_id"):
+            return [row for _, row in self._index(table, column).get(str(value), [])]
+        return [row for row in self.tables.get(table, []) if str(row.get(column)) == str(value)]
+
+    def _indexed_candidates(self, table: str, filters, rows: List[dict]) -> List[dict]:
+        """Narrow a full-table scan with the first eq/in filter on an ID column (order preserved)."""
+        for column, expression in filters:
+            if column != "id" and not column.endswith("_id"):
+                continue
+            op, _, raw = expression.partition(".")
+            if op == "eq":
+                values = [raw.strip('"')]
+            elif op == "in":
+                values = _parse_list(raw)
+            else:
+                continue
+            index = self._index(table, column)
+            matches = sorted(
+                (entry for value in dict.fromkeys(values) for entry in index.get(value, [])),
+                key=lambda entry: entry[0]
+            )
+            return [row for _, row in matches]
+        return rows
+
+    def _cascade_delete(self, table: str, deleted: List[dict]) -> None:
+        deleted_ids = {row.get("id") for row in deleted}
+        for (fk_table, column), referenced in FOREIGN_KEYS.items():
+            if referenced == table and fk_table in self.tables:
+                self._remove(fk_table, [r for r in self.tables[fk_table] if r.get(column) in deleted_ids])
+
+    def _with_defaults(self, table: str, row: dict) -> dict:
+        if table not in PRIMARY_KEY_TABLES:
+            row.setdefault("id", str(uuid.uuid4()))
+        if table not in PRIMARY_KEY_TABLES and table != "interests":
+            row.setdefault("created_at", _now())
+        if table in ("user_profiles", "mentor_profiles", "mentee_profiles"):
+            row.setdefault("updated_at", row.get("created_at") or _now())
+        if table == "interests":
+            row.setdefault("created_at", _now())
+            row.setdefault("updated_at", row["created_at"])
+        for column, default in DEFAULTS.get(table, {}).items():
+            row.setdefault(column, default())
+        return row
+
+    def _find_conflict(self, table: str, row: dict, on_conflict: Optional[str]) -> Optional[dict]:
+        keys = [tuple(on_conflict.split(","))] if on_conflict else UNIQUE_KEYS.get(table, [])
+        for columns in keys:
+            if any(row.get(c) is None for c in columns):
+                continue
+            for existing in self._rows_with(table, columns[0], row[columns[0]]):
+                if all(str(existing.get(c)) == str(row.get(c)) for c in columns):
+                    return existing
+        if table == "mentorship_requests" and row.get("status") == "pending":
+            # Partial unique index idx_no_duplicate_pending
+            for existing in self._rows_with(table, "mentee_id", row["mentee_id"]):
+                if (existing["status"] == "pending" and existing["mentee_id"] == row["mentee_id"]
+                        and existing["mentor_id"] == row["mentor_id"]):
+                    return existing
+        return None
+
+    # ----- RPC -----
+
+    def _rpc(self, name: str, body: Optional[dict]) -> httpx.Response:
+        function = self.rpc_functions.get(name)
+        if function is None:
+            return httpx.Response(404, json={"code": "PGRST202", "message": f"Could not find the function {name}"})
+        return httpx.Response(200, json=function(body or {}))
+
+    # ----- triggers and functions -----
+
+    def _after_write(self, table: str, old: Optional[dict], new: Optional[dict]) -> None:
+        """Row-level triggers (database/*.sql)."""
+        if table == "mentorship_requests":
+            # trg_pending_request_count
+            if old is not None and old.get("status") == "pending":
+                self._adjust_pending(old["mentor_id"], -1)
+            if new is not None and new.get("status") == "pending":
+                self._adjust_pending(new["mentor_id"], 1)
+        elif table == "interests" and old is not None and new is not None:
+            # trg_interest_updated_at
+            new["updated_at"] = _now()
+
+    def _adjust_pending(self, mentor_user_id: str, delta: int) -> None:
+        for profile in self.tables.get("mentor_profiles", []):
+            if profile.get("user_id") == mentor_user_id:
+                profile["pending_requests"] = max(profile.get("pending_requests", 0) + delta, 0)
+
+    def _register_rpc_functions(self) -> None:
+        """Python equivalents of the SQL functions in database/*.sql."""
+        self.rpc_functions["reconcile_pending_request_counts"] = self._reconcile_pending_request_counts
+        self.rpc_functions["respond_to_request"] = self._respond_to_request
+        self.rpc_functions["respond_to_requests"] = self._respond_to_requests
+        self.rpc_functions["import_mentor_profiles"] = lambda params: self._import_profiles("mentor", params)
+        self.rpc_functions["import_mentee_profiles"] = lambda params: self._import_profiles("mentee", params)
+        self.rpc_functions["sync_mentor_interests"] = lambda params: self._sync_interests("mentor", params)
+        self.rpc_functions["sync_mentee_interests"] = lambda params: self._sync_interests("mentee", params)
+
+    def _respond_to_request(self, params: dict) -> dict:
+        if params["p_status"] not in ("accepted", "declined"):
+            raise RPCError(f"Invalid response status: {params['p_status']}", "22023")
+        request = next(
+            (r for r in self.tables.get("mentorship_requests", []) if r["id"] == params["p_request_id"]),
+            None
+        )
+        if request is None:
+            raise RPCError("Mentorship request not found", "P0002")
+        if request["mentor_id"] != params["p_mentor_id"]:
+            raise RPCError("Only the mentor can respond to this request", "42501")
+        if request["status"] != "pending":
+            raise RPCError("Request has already been responded to", "P0001")
+
+        before = dict(request)
+        request.update(status=params["p_status"], responded_at=_now())
+        self._after_write("mentorship_requests", before, request)
+        if params["p_status"] == "accepted":
+            connection = self._with_defaults("connections", {
+                "mentor_id": request["mentor_id"],
+                "mentee_id": request["mentee_id"],
+                "request_id": request["id"],
+            })
+            if self._find_conflict("connections", connection, "mentor_id,mentee_id") is None:
+                self._append("connections", connection)
+        return dict(request)
+
+    def _respond_to_requests(self, params: dict) -> List[dict]:
+        requests = {r["id"]: r for r in self.tables.get("mentorship_requests", [])}
+        results = []
+        seen = set()
+        for item in params["p_items"]:
+            if item["request_id"] in seen:
+                continue
+            seen.add(item["request_id"])
+            request = requests.get(item["request_id"])
+            if item["status"] not in ("accepted", "declined"):
+                outcome = "invalid_status"
+            elif request is None:
+                outcome = "not_found"
+            elif request["mentor_id"] != params["p_mentor_id"]:
+                outcome = "forbidden"
+            elif request["status"] != "pending":
+                outcome = "already_responded"
+            else:
+                outcome = item["status"]
+            if outcome not in ("accepted", "declined"):
+                results.append({"request_id": item["request_id"], "outcome": outcome, "request": None})
+                continue
+            before = dict(request)
+            request.update(status=outcome, responded_at=_now())
+            self._after_write("mentorship_requests", before, request)
+            if outcome == "accepted":
+                connection = self._with_defaults("connections", {
+                    "mentor_id": request["mentor_id"],
+                    "mentee_id": request["mentee_id"],
+                    "request_id": request["id"],
+                })
+                if self._find_conflict("connections", connection, "mentor_id,mentee_id") is None:
+                    self._append("connections", connection)
+            results.append({"request_id": item["request_id"], "outcome": outcome, "request": dict(request)})
+        return results
+
+    def _sync_interests(self, profile_type: str, params: dict) -> int:
+        table, column = f"{profile_type}_interests", f"{profile_type}_profile_id"
+        wanted = set(params["p_interest_ids"])
+        current = self._rows_with(table, column, params["p_profile_id"])
+        removed = [r for r in current if r["interest_id"] not in wanted]
+        existing = {r["interest_id"] for r in current}
+        self._remove(table, removed)
+        added = [{column: params["p_profile_id"], "interest_id": iid} for iid in wanted - existing]
+        for row in added:
+            self._append(table, row)
+        return len(removed) + len(added)
+
+    def _import_profiles(self, profile_type: str, params: dict) -> List[dict]:
+        table, link_table = f"{profile_type}_profiles", f"{profile_type}_interests"
+        created = []
+        for item in params["p_profiles"]:
+            row = self._with_defaults(table, {k: v for k, v in item.items() if k != "interest_ids"})
+            if self._find_conflict(table, row, "user_id") is not None:
+                continue
+            self._append(table, row)
+            created.append(row)
+            for interest_id in dict.fromkeys(item.get("interest_ids") or []):
+                self._append(link_table, {f"{profile_type}_profile_id": row["id"], "interest_id": interest_id})
+        return [dict(row) for row in created]
+
+    def _reconcile_pending_request_counts(self, params: dict) -> int:
+        actual = Counter(
+            r["mentor_id"] for r in self.tables.get("mentorship_requests", []) if r.get("status") == "pending"
+        )
+        corrected = 0
+        for profile in self.tables.get("mentor_profiles", []):
+            pending = actual.get(profile.get("user_id"), 0)
+            if profile.get("pending_requests") != pending:
+                profile["pending_requests"] = pending
+                corrected += 1
+        return corrected
+
+
+class ConflictError(Exception):
+    """Unique constraint violation (HTTP 409 / SQLSTATE 23505)."""
+
+
+class RPCError(Exception):
+    """Error raised by a fake RPC function (mirrors RAISE EXCEPTION)."""
+
+    def __init__(self, message: str, code: str = "P0001"):
+        super().__init__(message)
+        self.code = code
+
+
+_NO_RELATION = object()
@@ -1,5 +1,6 @@
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 from dotenv import load_dotenv
 
 # Load variables from .env file
@@ -7,25 +8,108 @@ load_dotenv()
 
 
 class Settings:
-    """Application settings loaded from environment variables."""
-    
-    # Supabase
-    SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
-    SUPABASE_SERVICE_ROLE_KEY: str = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
-    SUPABASE_JWT_SECRET: Optional[str] = os.getenv("SUPABASE_JWT_SECRET", None)
+    """
+    Application settings, read from the environment when instantiated.
+
+    Use get_settings() for the shared instance (a FastAPI dependency, so
+    tests can override it); Settings() builds an independent one.
+    """
     
     def __init__(self):
-        """Validate required settings on initialization."""
-        self._validate_settings()
+        # Supabase
+        self.SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
+        self.SUPABASE_SERVICE_ROLE_KEY: str = os.getenv("SUPABASE_SERVICE_ROLE_KEY", "")
+        self.SUPABASE_JWT_SECRET: Optional[str] = os.getenv("SUPABASE_JWT_SECRET", None)
+        
+        # Auth token verification
+        # "local" verifies JWTs in-process and only calls /auth/v1/user when it has to,
+        # "remote" always validates against the Supabase user endpoint
+        self.AUTH_VERIFICATION_MODE: str = os.getenv("AUTH_VERIFICATION_MODE", "local")
+        self.SUPABASE_JWT_AUDIENCE: str = os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated")
+        self.SUPABASE_JWKS_URL: Optional[str] = os.getenv("SUPABASE_JWKS_URL", None)
+        self.JWKS_CACHE_TTL_SECONDS: int = int(os.getenv("JWKS_CACHE_TTL_SECONDS", "600"))
+        # Cache for tokens validated remotely (entries never outlive the token's exp)
+        self.AUTH_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+        self.AUTH_CACHE_MAX_SIZE: int = int(os.getenv("AUTH_CACHE_MAX_SIZE", "10000"))
+        
+        # Shared outbound HTTP client pool
+        self.HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+        self.HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+        self.HTTP_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+        self.HTTP_KEEPALIVE_EXPIRY_SECONDS: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30"))
+        self.HTTP_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_TIMEOUT_SECONDS", "5"))
+        self.HTTP_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "2"))
+        
+        # Max concurrent blocking Supabase calls per worker (thread pool size)
+        self.DB_THREAD_POOL_SIZE: int = int(os.getenv("DB_THREAD_POOL_SIZE", "20"))
+        
+        # In-memory interest catalog: seconds between version checks
+        self.INTEREST_CATALOG_TTL_SECONDS: int = int(os.getenv("INTEREST_CATALOG_TTL_SECONDS", "300"))
+        
+        # In-memory recommendation index: seconds between full rebuilds (0 = build once at startup)
+        self.RECOMMENDATION_INDEX_REFRESH_SECONDS: int = int(os.getenv("RECOMMENDATION_INDEX_REFRESH_SECONDS", "600"))
+        
+        # Seconds between pending request counter reconciliations run by the API (0 = disabled;
+        # prefer the pg_cron schedule in database/add_pending_request_counters.sql)
+        self.PENDING_COUNTER_RECONCILE_SECONDS: int = int(os.getenv("PENDING_COUNTER_RECONCILE_SECONDS", "0"))
+        
+        # Cached mentor/mentee profile-ID resolution per user
+        self.ROLE_CACHE_TTL_SECONDS: int = int(os.getenv("ROLE_CACHE_TTL_SECONDS", "60"))
+        self.ROLE_CACHE_MAX_SIZE: int = int(os.getenv("ROLE_CACHE_MAX_SIZE", "10000"))
+        
+        # Admin endpoints: comma-separated auth user IDs allowed to call /api/admin/*
+        self.ADMIN_USER_IDS: List[str] = [uid.strip().lower() for uid in os.getenv("ADMIN_USER_IDS", "").split(",") if uid.strip()]
+        # Profiles inserted per round trip by the admin bulk import
+        self.PROFILE_IMPORT_CHUNK_SIZE: int = int(os.getenv("PROFILE_IMPORT_CHUNK_SIZE", "500"))
+        
+        # Per-request DB query accounting: Server-Timing header and a warning above N queries (0 = no warning)
+        self.DB_SERVER_TIMING_ENABLED: bool = os.getenv("DB_SERVER_TIMING_ENABLED", "true").lower() == "true"
+        self.DB_QUERY_WARNING_THRESHOLD: int = int(os.getenv("DB_QUERY_WARNING_THRESHOLD", "20"))
+        
+        # Prometheus metrics at /metrics (request latency histograms, auth/DB counters, cache gauges)
+        self.METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+        
+        # Opt-in request profiling (admin "X-Profile" header or random sampling); off = no middleware at all
+        self.PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+        self.PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+        # "sample" (folded stacks for flame graphs) or "cprofile" (pstats)
+        self.PROFILING_MODE: str = os.getenv("PROFILING_MODE", "sample")
+        self.PROFILING_INTERVAL_MS: float = float(os.getenv("PROFILING_INTERVAL_MS", "1"))
+        self.PROFILING_OUTPUT_DIR: str = os.getenv("PROFILING_OUTPUT_DIR", "profiles")
+        
+        # Readiness probe: background Supabase/auth checks (the probe reads the cached result)
+        self.HEALTH_CHECK_INTERVAL_SECONDS: float = float(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "15"))
+        self.HEALTH_CHECK_TIMEOUT_SECONDS: float = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "3"))
+        # Only report ready once the interest catalog and recommendation index are loaded
+        self.READINESS_REQUIRE_WARM_CACHES: bool = os.getenv("READINESS_REQUIRE_WARM_CACHES", "true").lower() == "true"
+        
+        # Discovery feed sessions: seconds a shuffled candidate list is kept, max cached sessions
+        self.DISCOVERY_SESSION_TTL_SECONDS: int = int(os.getenv("DISCOVERY_SESSION_TTL_SECONDS", "900"))
+        self.DISCOVERY_SESSION_MAX_SIZE: int = int(os.getenv("DISCOVERY_SESSION_MAX_SIZE", "1000"))
     
-    def _validate_settings(self) -> None:
-        """Ensure all required environment variables are set."""
+    def validate(self) -> None:
+        """
+        Ensure all required environment variables are set.
+
+        Called when the app starts and before the Supabase client is created,
+        not at import, so modules can be imported without credentials.
+        """
         if not self.SUPABASE_URL:
             raise ValueError("SUPABASE_URL environment variable is required")
         if not self.SUPABASE_SERVICE_ROLE_KEY:
             raise ValueError("SUPABASE_SERVICE_ROLE_KEY environment variable is required")
+        if self.AUTH_VERIFICATION_MODE not in ("local", "remote"):
+            raise ValueError("AUTH_VERIFICATION_MODE must be 'local' or 'remote'")
+        if self.PROFILING_MODE not in ("sample", "cprofile"):
+            raise ValueError("PROFILING_MODE must be 'sample' or 'cprofile'")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Shared Settings instance; also a FastAPI dependency (override it in tests)."""
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
+# Global settings instance for module-level readers (same object as get_settings())
+settings = get_settings()
 
@@ -0,0 +1,28 @@
+-- Change tracking for the interests catalog
+-- Run this SQL in Supabase SQL Editor after schema.sql
+--
+-- The API keeps the interests in memory and polls a cheap version,
+-- (row count, newest updated_at), to decide when to reload them (see
+-- services/interest_catalog.py). created_at alone misses rows edited in
+-- place (renamed or recategorized), so updated_at is bumped by a trigger on
+-- every UPDATE, however the row is changed.
+
+ALTER TABLE interests
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW();
+
+CREATE OR REPLACE FUNCTION set_interest_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_interest_updated_at ON interests;
+CREATE TRIGGER trg_interest_updated_at
+    BEFORE UPDATE ON interests
+    FOR EACH ROW
+    EXECUTE FUNCTION set_interest_updated_at();
+
+-- The version probe reads the newest row by updated_at
+CREATE INDEX IF NOT EXISTS idx_interests_updated_at ON interests(updated_at DESC);
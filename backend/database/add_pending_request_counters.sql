@@ -0,0 +1,112 @@
+-- Maintained per-mentor pending request counters
+-- Run this SQL in Supabase SQL Editor after schema.sql
+--
+-- mentor_profiles.pending_requests is kept in sync by a trigger on
+-- mentorship_requests, so every code path that creates, accepts, declines or
+-- deletes a request updates it in the same transaction. Availability checks
+-- read the column instead of counting request rows.
+
+-- ============================================
+-- 1. Counter column
+-- ============================================
+ALTER TABLE mentor_profiles
+ADD COLUMN IF NOT EXISTS pending_requests INTEGER NOT NULL DEFAULT 0;
+
+-- ============================================
+-- 2. Trigger keeping the counter up to date
+-- ============================================
+-- Note: mentorship_requests.mentor_id is the mentor's user_id
+CREATE OR REPLACE FUNCTION update_pending_request_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'pending' THEN
+        UPDATE mentor_profiles
+        SET pending_requests = GREATEST(pending_requests - 1, 0)
+        WHERE user_id = OLD.mentor_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'pending' THEN
+        UPDATE mentor_profiles
+        SET pending_requests = pending_requests + 1
+        WHERE user_id = NEW.mentor_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_pending_request_count ON mentorship_requests;
+CREATE TRIGGER trg_pending_request_count
+    AFTER INSERT OR DELETE OR UPDATE OF status, mentor_id ON mentorship_requests
+    FOR EACH ROW
+    EXECUTE FUNCTION update_pending_request_count();
+
+-- ============================================
+-- 3. Reconciliation
+-- ============================================
+-- Recomputes every counter from mentorship_requests and fixes drifted rows
+-- (e.g. requests created before the mentor profile existed, manual edits).
+-- Returns the number of corrected mentors.
+--
+-- The mentor rows are locked before counting. A trigger that already
+-- changed a locked row has committed by then, and the UPDATE (a new
+-- statement, so a new snapshot) sees its request; a trigger that has not
+-- runs after this transaction and applies its +1/-1 to the corrected value.
+-- Counting first and updating afterwards would let a stale count overwrite
+-- a concurrent trigger's change. SKIP LOCKED leaves rows a request
+-- transaction is holding to the next run instead of waiting on them (and
+-- possibly deadlocking with a multi-row batch response).
+--
+-- Only one run at a time does any work: a concurrent call returns 0.
+CREATE OR REPLACE FUNCTION reconcile_pending_request_counts()
+RETURNS INTEGER AS $$
+DECLARE
+    locked_ids UUID[];
+    corrected INTEGER;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('reconcile_pending_request_counts')) THEN
+        RETURN 0;
+    END IF;
+
+    SELECT array_agg(id) INTO locked_ids
+    FROM (
+        SELECT id FROM mentor_profiles
+        ORDER BY id
+        FOR UPDATE SKIP LOCKED
+    ) locked;
+
+    UPDATE mentor_profiles mp
+    SET pending_requests = actual.pending
+    FROM (
+        SELECT mp2.id, (
+            SELECT COUNT(*)::INTEGER
+            FROM mentorship_requests mr
+            WHERE mr.mentor_id = mp2.user_id AND mr.status = 'pending'
+        ) AS pending
+        FROM mentor_profiles mp2
+        WHERE mp2.id = ANY(locked_ids)
+    ) actual
+    WHERE mp.id = actual.id
+      AND mp.pending_requests IS DISTINCT FROM actual.pending;
+
+    GET DIAGNOSTICS corrected = ROW_COUNT;
+    RETURN corrected;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Backfill existing data
+SELECT reconcile_pending_request_counts();
+
+-- ============================================
+-- 4. Schedule (optional)
+-- ============================================
+-- Run the reconciliation from one place, not from every API worker. With
+-- pg_cron (Supabase: Database > Extensions) this runs it hourly:
+--
+-- SELECT cron.schedule(
+--     'reconcile-pending-request-counts',
+--     '0 * * * *',
+--     'SELECT reconcile_pending_request_counts()'
+-- );
+--
+-- Without pg_cron, set PENDING_COUNTER_RECONCILE_SECONDS on the API instead.
@@ -0,0 +1,13 @@
+-- Indexes for keyset pagination of GET /api/requests
+-- Run this SQL in Supabase SQL Editor after schema.sql
+--
+-- Requests are listed per mentor (or mentee) ordered by (created_at, id)
+-- descending and paged with WHERE (created_at, id) < (cursor). These
+-- composite indexes let Postgres walk each user's history in order and stop
+-- after one page, instead of combining idx_requests_created with a filter.
+
+CREATE INDEX IF NOT EXISTS idx_requests_mentor_keyset
+    ON mentorship_requests(mentor_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_requests_mentee_keyset
+    ON mentorship_requests(mentee_id, created_at DESC, id DESC);
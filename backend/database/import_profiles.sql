@@ -0,0 +1,62 @@
+-- Bulk profile import
+-- Run this SQL in Supabase SQL Editor after schema.sql and add_profile_pictures.sql
+--
+-- import_mentor_profiles() / import_mentee_profiles() insert one chunk of
+-- the admin bulk import (services/profile_import.py) together with the
+-- profiles' interest links, in one statement and one transaction (called
+-- via supabase.rpc). Either every profile of the chunk and its links are
+-- written or nothing is, so a failed chunk can simply be uploaded again.
+--
+-- p_profiles is a JSON array of profile objects, each with an extra
+-- "interest_ids" array. Users that already have a profile are skipped
+-- (ON CONFLICT (user_id) DO NOTHING); the created rows are returned.
+
+CREATE OR REPLACE FUNCTION import_mentor_profiles(p_profiles JSONB)
+RETURNS SETOF mentor_profiles AS $$
+    WITH created AS (
+        INSERT INTO mentor_profiles (
+            user_id, industry, job_title, help_types_offered,
+            max_requests_per_week, profile_picture_url, is_active
+        )
+        SELECT
+            user_id, industry, job_title, help_types_offered,
+            max_requests_per_week, profile_picture_url, is_active
+        FROM jsonb_populate_recordset(NULL::mentor_profiles, p_profiles)
+        ON CONFLICT (user_id) DO NOTHING
+        RETURNING *
+    ),
+    links AS (
+        INSERT INTO mentor_interests (mentor_profile_id, interest_id)
+        SELECT DISTINCT created.id, interest_id::UUID
+        FROM created
+        JOIN jsonb_array_elements(p_profiles) AS profile
+            ON (profile->>'user_id')::UUID = created.user_id
+        CROSS JOIN LATERAL jsonb_array_elements_text(profile->'interest_ids') AS interest_id
+        ON CONFLICT (mentor_profile_id, interest_id) DO NOTHING
+    )
+    SELECT * FROM created;
+$$ LANGUAGE sql;
+
+CREATE OR REPLACE FUNCTION import_mentee_profiles(p_profiles JSONB)
+RETURNS SETOF mentee_profiles AS $$
+    WITH created AS (
+        INSERT INTO mentee_profiles (
+            user_id, industry, goals, help_needed, background, profile_picture_url
+        )
+        SELECT
+            user_id, industry, goals, help_needed, background, profile_picture_url
+        FROM jsonb_populate_recordset(NULL::mentee_profiles, p_profiles)
+        ON CONFLICT (user_id) DO NOTHING
+        RETURNING *
+    ),
+    links AS (
+        INSERT INTO mentee_interests (mentee_profile_id, interest_id)
+        SELECT DISTINCT created.id, interest_id::UUID
+        FROM created
+        JOIN jsonb_array_elements(p_profiles) AS profile
+            ON (profile->>'user_id')::UUID = created.user_id
+        CROSS JOIN LATERAL jsonb_array_elements_text(profile->'interest_ids') AS interest_id
+        ON CONFLICT (mentee_profile_id, interest_id) DO NOTHING
+    )
+    SELECT * FROM created;
+$$ LANGUAGE sql;
@@ -0,0 +1,60 @@
+-- Atomic accept/decline of a mentorship request
+-- Run this SQL in Supabase SQL Editor after schema.sql
+--
+-- respond_to_request() performs the whole state transition in one
+-- transaction and one round trip (called via supabase.rpc):
+--   1. UPDATE ... WHERE status = 'pending' flips the status. The row lock
+--      serializes concurrent responses; a second accept re-checks the
+--      WHERE clause after the first commits and updates nothing.
+--   2. On accept, the connection is inserted in the same transaction.
+--   3. The updated request row is returned.
+--
+-- Errors (SQLSTATE, mapped to HTTP status by RequestService):
+--   P0002  request not found
+--   42501  caller is not the request's mentor
+--   P0001  request has already been responded to
+
+CREATE OR REPLACE FUNCTION respond_to_request(
+    p_request_id UUID,
+    p_mentor_id UUID,
+    p_status TEXT
+)
+RETURNS mentorship_requests AS $$
+DECLARE
+    updated mentorship_requests;
+    current_mentor UUID;
+BEGIN
+    IF p_status NOT IN ('accepted', 'declined') THEN
+        RAISE EXCEPTION 'Invalid response status: %', p_status USING ERRCODE = '22023';
+    END IF;
+
+    UPDATE mentorship_requests
+    SET status = p_status, responded_at = NOW()
+    WHERE id = p_request_id
+      AND mentor_id = p_mentor_id
+      AND status = 'pending'
+    RETURNING * INTO updated;
+
+    IF NOT FOUND THEN
+        SELECT mentor_id INTO current_mentor
+        FROM mentorship_requests
+        WHERE id = p_request_id;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'Mentorship request not found' USING ERRCODE = 'P0002';
+        ELSIF current_mentor <> p_mentor_id THEN
+            RAISE EXCEPTION 'Only the mentor can respond to this request' USING ERRCODE = '42501';
+        ELSE
+            RAISE EXCEPTION 'Request has already been responded to' USING ERRCODE = 'P0001';
+        END IF;
+    END IF;
+
+    IF p_status = 'accepted' THEN
+        INSERT INTO connections (mentor_id, mentee_id, request_id)
+        VALUES (updated.mentor_id, updated.mentee_id, updated.id)
+        ON CONFLICT (mentor_id, mentee_id) DO NOTHING;
+    END IF;
+
+    RETURN updated;
+END;
+$$ LANGUAGE plpgsql;
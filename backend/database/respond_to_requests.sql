@@ -0,0 +1,64 @@
+-- Batch accept/decline of mentorship requests
+-- Run this SQL in Supabase SQL Editor after schema.sql
+--
+-- respond_to_requests() is the batch counterpart of respond_to_request()
+-- (respond_to_request.sql). It is one SQL statement, run in one transaction
+-- and one round trip (called via supabase.rpc):
+--   1. One read of all requested rows classifies items that cannot be
+--      applied (not found, not the caller's, already responded).
+--   2. One UPDATE flips every still-pending request owned by the caller to
+--      its requested status. As in respond_to_request(), concurrent
+--      responses to the same request serialize on the row lock and only the
+--      first one matches status = 'pending'.
+--   3. One INSERT creates the connections for all accepted requests.
+--
+-- p_items is a JSON array of {"request_id": UUID, "status": "accepted" | "declined"}.
+-- Returns one row per item: the outcome ('accepted', 'declined',
+-- 'not_found', 'forbidden', 'already_responded' or 'invalid_status') and,
+-- when applied, the updated request row.
+
+CREATE OR REPLACE FUNCTION respond_to_requests(
+    p_mentor_id UUID,
+    p_items JSONB
+)
+RETURNS TABLE (request_id UUID, outcome TEXT, request JSONB) AS $$
+    WITH items AS (
+        SELECT DISTINCT ON (i.request_id) i.request_id, i.status
+        FROM jsonb_to_recordset(p_items) AS i(request_id UUID, status TEXT)
+    ),
+    existing AS (
+        SELECT mr.id, mr.mentor_id
+        FROM mentorship_requests mr
+        JOIN items ON mr.id = items.request_id
+    ),
+    updated AS (
+        UPDATE mentorship_requests mr
+        SET status = items.status, responded_at = NOW()
+        FROM items
+        WHERE mr.id = items.request_id
+          AND mr.mentor_id = p_mentor_id
+          AND mr.status = 'pending'
+          AND items.status IN ('accepted', 'declined')
+        RETURNING mr.*
+    ),
+    inserted AS (
+        INSERT INTO connections (mentor_id, mentee_id, request_id)
+        SELECT updated.mentor_id, updated.mentee_id, updated.id
+        FROM updated
+        WHERE updated.status = 'accepted'
+        ON CONFLICT (mentor_id, mentee_id) DO NOTHING
+    )
+    SELECT
+        items.request_id,
+        CASE
+            WHEN updated.id IS NOT NULL THEN updated.status
+            WHEN items.status NOT IN ('accepted', 'declined') THEN 'invalid_status'
+            WHEN existing.id IS NULL THEN 'not_found'
+            WHEN existing.mentor_id <> p_mentor_id THEN 'forbidden'
+            ELSE 'already_responded'
+        END,
+        CASE WHEN updated.id IS NOT NULL THEN to_jsonb(updated) END
+    FROM items
+    LEFT JOIN existing ON existing.id = items.request_id
+    LEFT JOIN updated ON updated.id = items.request_id;
+$$ LANGUAGE sql;
@@ -0,0 +1,57 @@
+-- Diff-based profile interest updates
+-- Run this SQL in Supabase SQL Editor after schema.sql
+--
+-- sync_mentor_interests() / sync_mentee_interests() replace a profile's
+-- interest set with p_interest_ids in one transaction and one round trip
+-- (called via supabase.rpc). Only the difference is written: links no
+-- longer wanted are deleted and missing ones inserted, so unchanged links
+-- are never touched and concurrent readers see either the old or the new
+-- set, never an empty one.
+--
+-- Returns the number of rows written (deleted + inserted).
+
+CREATE OR REPLACE FUNCTION sync_mentor_interests(
+    p_profile_id UUID,
+    p_interest_ids UUID[]
+)
+RETURNS INTEGER AS $$
+DECLARE
+    deleted INTEGER;
+    inserted INTEGER;
+BEGIN
+    DELETE FROM mentor_interests
+    WHERE mentor_profile_id = p_profile_id
+      AND interest_id <> ALL(p_interest_ids);
+    GET DIAGNOSTICS deleted = ROW_COUNT;
+
+    INSERT INTO mentor_interests (mentor_profile_id, interest_id)
+    SELECT DISTINCT p_profile_id, unnest(p_interest_ids)
+    ON CONFLICT (mentor_profile_id, interest_id) DO NOTHING;
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+
+    RETURN deleted + inserted;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_mentee_interests(
+    p_profile_id UUID,
+    p_interest_ids UUID[]
+)
+RETURNS INTEGER AS $$
+DECLARE
+    deleted INTEGER;
+    inserted INTEGER;
+BEGIN
+    DELETE FROM mentee_interests
+    WHERE mentee_profile_id = p_profile_id
+      AND interest_id <> ALL(p_interest_ids);
+    GET DIAGNOSTICS deleted = ROW_COUNT;
+
+    INSERT INTO mentee_interests (mentee_profile_id, interest_id)
+    SELECT DISTINCT p_profile_id, unnest(p_interest_ids)
+    ON CONFLICT (mentee_profile_id, interest_id) DO NOTHING;
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+
+    RETURN deleted + inserted;
+END;
+$$ LANGUAGE plpgsql;
@@ -1,14 +1,65 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Dict
 
-from routes import users, mentors, mentees, requests, recommendations, ai, interests
+from middleware.metrics import MetricsMiddleware
+from middleware.profiling import ProfilingMiddleware
+from middleware.request_scope import LoaderScopeMiddleware, QueryStatsMiddleware
+from routes import users, mentors, mentees, requests, recommendations, ai, interests, admin
+from services.health import health_checker
+from services.http_client import http_clients
+from services.interest_catalog import interest_catalog
+from services.recommendation_index import recommendation_index
+from services.metrics import registry as metrics_registry, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from services.request_counters import maintain_pending_request_counts
+from config import settings
+from services.database import run_in_db_pool, get_supabase
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown."""
+    # Fail fast on missing credentials (importing the app no longer checks them)
+    settings.validate()
+    # Supabase client (created lazily; build it now so the first request doesn't pay for it)
+    await run_in_db_pool(get_supabase)
+    # Pooled outbound HTTP clients (auth validation, JWKS, future integrations)
+    await http_clients.start()
+    # Interest catalog; if the DB is unreachable the health checker retries until it loads
+    try:
+        await run_in_db_pool(interest_catalog.load)
+    except Exception as e:
+        logger.warning("Interest catalog not loaded at startup: %s", e)
+    # Recommendation index builds in the background (retried by the health checker if it fails);
+    # the feed falls back to DB ranking until ready
+    index_task = asyncio.create_task(
+        recommendation_index.maintain(settings.RECOMMENDATION_INDEX_REFRESH_SECONDS)
+    )
+    # Periodic repair of the trigger-maintained pending request counters
+    counters_task = asyncio.create_task(
+        maintain_pending_request_counts(settings.PENDING_COUNTER_RECONCILE_SECONDS)
+    )
+    # Dependency checks cached for the readiness probe
+    health_task = asyncio.create_task(health_checker.maintain())
+    yield
+    index_task.cancel()
+    counters_task.cancel()
+    health_task.cancel()
+    await http_clients.close()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="ReallyConnect API",
     description="Mentorship matching platform API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -28,6 +79,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request batch loaders for profile/interest/user lookups
+app.add_middleware(LoaderScopeMiddleware)
+
+# Per-request Supabase query count/time (Server-Timing header, N+1 warnings)
+app.add_middleware(QueryStatsMiddleware)
+
+# Opt-in per-request profiling (admin X-Profile header or PROFILING_SAMPLE_RATE)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Request latency histograms and in-flight gauge for /metrics (outermost, so it times everything)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(interests.router, prefix="/api/interests", tags=["interests"])
@@ -36,6 +101,7 @@ app.include_router(mentees.router, prefix="/api/mentees", tags=["mentees"])
 app.include_router(requests.router, prefix="/api/requests", tags=["requests"])
 app.include_router(recommendations.router, prefix="/api/recommendations", tags=["recommendations"])
 app.include_router(ai.router, prefix="/api/ai", tags=["ai"])
+app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 
 
 @app.get("/")
@@ -44,23 +110,44 @@ async def root() -> Dict[str, str]:
     return {
         "message": "ReallyConnect API",
         "docs": "/docs",
-        "health": "/health"
+        "health": "/health",
+        "ready": "/health/ready"
     }
 
 
 @app.get("/health")
+@app.get("/health/live")
 async def health_check() -> Dict[str, str]:
-    """Health check endpoint for monitoring."""
+    """Liveness probe: the process is up and serving (no dependency checks)."""
     return {"status": "healthy"}
 
+
+@app.get("/health/ready")
+async def readiness_check() -> JSONResponse:
+    """
+    Readiness probe: 200 once Supabase and auth are reachable and the caches are warm, else 503.
+
+    Reads the result cached by the background health checker, so probes never
+    cause a query.
+    """
+    report = health_checker.readiness()
+    return JSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Prometheus scrape endpoint."""
+        return Response(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
 # TESTING SUPABASE CONNECTION
-from services.database import supabase
+from services.database import supabase, execute_async
 
 @app.get("/test-supabase")
 async def test_supabase():
     try:
         # Try to query the interests table
-        result = supabase.table("interests").select("*").limit(1).execute()
+        result = await execute_async(supabase.table("interests").select("*").limit(1))
         return {
             "status": "connected",
             "message": "Successfully connected to Supabase!",
@@ -1,84 +1,217 @@
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
 from uuid import UUID
-import sys
-from pathlib import Path
+import asyncio
+import hashlib
+import time
 import httpx
-from config import settings
-
-# BACKEND DIR FOR IMPORTING CONFIG
-backend_dir = Path(__file__).parent.parent
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
+from jose import jwt
+from jose.exceptions import JWTError
+from config import Settings, get_settings
+from services.cache import TTLCache
+from services.http_client import http_clients
+from services.metrics import auth_validations
 
 
 security = HTTPBearer()
 
+# Algorithms Supabase signs access tokens with
+SYMMETRIC_ALGORITHMS = {"HS256"}
+ASYMMETRIC_ALGORITHMS = {"RS256", "ES256"}
+
+# JWKS cache shared by all requests (keys rotate rarely)
+_jwks_keys: dict = {}
+_jwks_fetched_at: Optional[float] = None
+_jwks_lock = asyncio.Lock()
+JWKS_MIN_REFRESH_SECONDS = 30
+
+# Tokens validated against /auth/v1/user, keyed by SHA-256 of the token
+token_cache = TTLCache(
+    max_size=get_settings().AUTH_CACHE_MAX_SIZE,
+    ttl_seconds=get_settings().AUTH_CACHE_TTL_SECONDS
+)
+
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    settings: Settings = Depends(get_settings)
 ) -> UUID:
     """
     FastAPI dependency to verify JWT token and extract user ID.
-    
-    Uses Supabase's User API endpoint to validate the token - this is the
-    recommended approach for backend services as it doesn't require JWK endpoints
-    and works with all Supabase auth methods (email, OAuth, etc.).
-    
+
+    In "local" mode (the default) the token signature and claims are checked
+    in-process: HS256 tokens against SUPABASE_JWT_SECRET, asymmetric tokens
+    against the project's JWKS. The Supabase User API endpoint is only called
+    when the token cannot be verified locally (no secret configured, JWKS
+    unreachable, unknown algorithm) or when AUTH_VERIFICATION_MODE is "remote".
+
     Args:
         credentials: Bearer token from Authorization header
-        
+        settings: Application settings
+
     Returns:
         UUID: The authenticated user's ID
-        
+
     Raises:
         HTTPException: If token is invalid, expired, or missing
     """
-    token = credentials.credentials
-    
+    return await authenticate_token(credentials.credentials, settings)
+
+
+async def authenticate_token(token: str, settings: Settings) -> UUID:
+    """
+    Verify a raw bearer token as get_current_user does (for non-dependency callers).
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    path = "local"
+
+    try:
+        if settings.AUTH_VERIFICATION_MODE == "local":
+            user_id = await verify_token_locally(token, settings)
+            if user_id is not None:
+                auth_validations.inc(path, "ok")
+                return user_id
+
+        path = "remote"
+        user_id = await verify_token_remotely_cached(token, settings)
+    except HTTPException:
+        auth_validations.inc(path, "rejected")
+        raise
+
+    auth_validations.inc(path, "ok")
+    return user_id
+
+
+async def require_admin(
+    user_id: UUID = Depends(get_current_user),
+    settings: Settings = Depends(get_settings)
+) -> UUID:
+    """
+    FastAPI dependency restricting an endpoint to the users in ADMIN_USER_IDS.
+
+    Returns:
+        UUID: The authenticated admin's user ID
+
+    Raises:
+        HTTPException: 403 if the caller is not an admin
+    """
+    if not is_admin(user_id, settings):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return user_id
+
+
+def is_admin(user_id: UUID, settings: Settings) -> bool:
+    """Whether user_id is listed in ADMIN_USER_IDS."""
+    return str(user_id) in settings.ADMIN_USER_IDS
+
+
+async def verify_token_locally(token: str, settings: Settings) -> Optional[UUID]:
+    """
+    Verify a Supabase access token without calling the auth server.
+
+    Args:
+        token: Raw bearer token
+        settings: Application settings (JWT secret, audience, JWKS location)
+
+    Returns:
+        UUID of the user, or None if the token can't be verified locally
+        and the caller should fall back to remote validation
+
+    Raises:
+        HTTPException: If the token is definitively invalid or expired
+    """
+    try:
+        header = jwt.get_unverified_header(token)
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired authentication token"
+        )
+
+    algorithm = header.get("alg")
+
+    if algorithm in SYMMETRIC_ALGORITHMS:
+        if not settings.SUPABASE_JWT_SECRET:
+            return None
+        key = settings.SUPABASE_JWT_SECRET
+    elif algorithm in ASYMMETRIC_ALGORITHMS:
+        key = await _get_signing_key(header.get("kid"), settings)
+        if key is None:
+            return None
+    else:
+        return None
+
+    try:
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=settings.SUPABASE_JWT_AUDIENCE
+        )
+    except JWTError:
+        # Bad signature, expired, wrong audience, malformed claims
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired authentication token"
+        )
+
+    return _user_id_from_claim(claims.get("sub"))
+
+
+async def verify_token_remotely_cached(token: str, settings: Settings) -> UUID:
+    """
+    Remote validation through the bounded token cache.
+
+    A validated token is reused for at most AUTH_CACHE_TTL_SECONDS and never
+    past its own exp claim. Concurrent requests carrying the same uncached
+    token share a single call to the auth server. Rejections are not cached.
+    """
+    cache_key = hashlib.sha256(token.encode()).hexdigest()
+    return await token_cache.get_or_load(
+        cache_key,
+        lambda: verify_token_remotely(token, settings),
+        ttl_for=lambda _: _seconds_until_expiry(token)
+    )
+
+
+async def verify_token_remotely(token: str, settings: Settings) -> UUID:
+    """
+    Verify a token by calling Supabase's User API endpoint.
+
+    Works with every Supabase auth method and also rejects tokens whose
+    session has been revoked, at the cost of one HTTP round trip.
+    """
     try:
         # Verify token by calling Supabase's user endpoint
         # This validates the token and returns user info if valid
         user_url = f"{settings.SUPABASE_URL}/auth/v1/user"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                user_url,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "apikey": settings.SUPABASE_SERVICE_ROLE_KEY
-                },
-                timeout=5.0
+
+        response = await http_clients.get("supabase").get(
+            user_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "apikey": settings.SUPABASE_SERVICE_ROLE_KEY
+            }
+        )
+
+        if response.status_code == 401:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired authentication token"
             )
-            
-            if response.status_code == 401:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid or expired authentication token"
-                )
-            
-            response.raise_for_status()
-            user_data = response.json()
-            
-            # Extract user ID from response
-            user_id_str = user_data.get("id")
-            if not user_id_str:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token missing user ID claim"
-                )
-            
-            # Convert to UUID
-            try:
-                user_id = UUID(user_id_str)
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid user ID format in token"
-                )
-            
-            return user_id
-            
+
+        response.raise_for_status()
+        user_data = response.json()
+
+        # Extract user ID from response
+        return _user_id_from_claim(user_data.get("id"))
+
     except HTTPException:
         raise
     except httpx.HTTPStatusError as e:
@@ -91,3 +224,72 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Authentication error: {str(e)}"
         )
+
+
+def _seconds_until_expiry(token: str) -> Optional[float]:
+    """Seconds left before the token's exp claim, or None if it has none."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return 0
+    if exp is None:
+        return None
+    return exp - time.time()
+
+
+def _user_id_from_claim(user_id_str: Optional[str]) -> UUID:
+    """Convert the user ID from a token/user payload to a UUID."""
+    if not user_id_str:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token missing user ID claim"
+        )
+
+    try:
+        return UUID(user_id_str)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid user ID format in token"
+        )
+
+
+async def _get_signing_key(kid: Optional[str], settings: Settings) -> Optional[dict]:
+    """
+    Look up a public signing key from the project's JWKS.
+
+    Keys are cached for JWKS_CACHE_TTL_SECONDS. An unknown kid triggers an
+    early refresh so rotated keys are picked up without waiting for the TTL.
+    Returns None if the JWKS can't be fetched or has no matching key.
+    """
+    global _jwks_keys, _jwks_fetched_at
+
+    if not _jwks_refresh_due(kid, settings):
+        return _jwks_keys.get(kid)
+
+    async with _jwks_lock:
+        # Another request may have refreshed while we waited
+        if _jwks_refresh_due(kid, settings):
+            jwks_url = settings.SUPABASE_JWKS_URL or f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json"
+            try:
+                response = await http_clients.get("supabase").get(jwks_url)
+                response.raise_for_status()
+                keys = response.json().get("keys", [])
+                _jwks_keys = {key.get("kid"): key for key in keys}
+            except (httpx.HTTPError, ValueError):
+                # Keep serving the last known keys; remote validation covers the rest
+                pass
+            _jwks_fetched_at = time.monotonic()
+
+    return _jwks_keys.get(kid)
+
+
+def _jwks_refresh_due(kid: Optional[str], settings: Settings) -> bool:
+    """Whether the JWKS should be re-fetched before looking up kid."""
+    if _jwks_fetched_at is None:
+        return True
+    age = time.monotonic() - _jwks_fetched_at
+    if age > settings.JWKS_CACHE_TTL_SECONDS:
+        return True
+    # Unknown kid: allow a refresh, but rate-limit it so bogus tokens can't hammer the endpoint
+    return kid not in _jwks_keys and age > JWKS_MIN_REFRESH_SECONDS
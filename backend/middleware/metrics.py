@@ -0,0 +1,112 @@
+import time
+
+from middleware.auth import token_cache
+from middleware.request_scope import route_template
+from services.database import db_limiter
+from services.discovery_service import feed_sessions
+from services.health import health_checker
+from services.http_client import http_clients
+from services.interest_catalog import interest_catalog
+from services.metrics import registry, http_request_duration, http_requests_in_flight
+from services.recommendation_index import recommendation_index
+from services.role_resolver import role_resolver
+
+# Route label for requests no route matched (keeps 404 scans from adding series)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency and in-flight requests.
+
+    Latency is observed into http_request_duration_seconds labelled with the
+    route template (not the raw path), method and response status. A request
+    that raises before starting a response is recorded as a 500.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route_template(scope, unmatched=UNMATCHED_ROUTE),
+                str(status_code)
+            )
+
+
+def _cache_sizes():
+    return {
+        ("auth_tokens",): len(token_cache),
+        ("user_roles",): len(role_resolver.cache),
+        ("interest_catalog",): len(interest_catalog),
+        ("recommendation_index",): len(recommendation_index),
+        ("discovery_sessions",): len(feed_sessions),
+    }
+
+
+def _http_client_stat(key):
+    return lambda: {(name,): stats[key] for name, stats in http_clients.stats().items()}
+
+
+# Gauges read from the owning objects at scrape time
+registry.callback(
+    "cache_entries",
+    "Entries held by in-process caches and indexes.",
+    _cache_sizes,
+    ("cache",)
+)
+registry.callback(
+    "auth_token_cache_hits_total",
+    "Remote token validations answered from the token cache.",
+    lambda: token_cache.stats()["hits"],
+    type_name="counter"
+)
+registry.callback(
+    "auth_token_cache_misses_total",
+    "Remote token validations that called the Supabase auth server.",
+    lambda: token_cache.stats()["misses"],
+    type_name="counter"
+)
+registry.callback(
+    "db_thread_pool_in_use",
+    "DB thread pool slots currently running a blocking Supabase call.",
+    lambda: db_limiter.borrowed_tokens
+)
+registry.callback(
+    "http_client_in_flight_requests",
+    "Outbound requests in flight per shared HTTP client.",
+    _http_client_stat("in_flight_requests"),
+    ("client",)
+)
+registry.callback(
+    "http_client_connections",
+    "Pooled connections per shared HTTP client.",
+    _http_client_stat("connections"),
+    ("client",)
+)
+registry.callback(
+    "health_check_up",
+    "Result of the last background dependency check (1 = up).",
+    lambda: {(name,): int(result.ok) for name, result in health_checker.results.items()},
+    ("check",)
+)
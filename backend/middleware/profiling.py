@@ -0,0 +1,112 @@
+import logging
+import random
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import anyio.to_thread
+from fastapi import HTTPException
+
+from config import Settings, get_settings
+from middleware.auth import authenticate_token, is_admin
+from services.profiling import PROFILE_MODES, RequestProfile
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling single requests on demand (see services.profiling).
+
+    A request is profiled when an admin sends "X-Profile: 1" (or names a mode:
+    "X-Profile: sample" / "X-Profile: cprofile"), or when it is picked by
+    PROFILING_SAMPLE_RATE. The profile is written to PROFILING_OUTPUT_DIR and
+    its file name returned in the X-Profile-File response header. The header
+    is ignored for everyone else.
+
+    main.py only installs this middleware when PROFILING_ENABLED is set, so
+    it costs nothing otherwise.
+    """
+
+    def __init__(self, app, settings: Optional[Settings] = None):
+        self.app = app
+        self.settings = settings or get_settings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mode = await self._requested_mode(scope)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(mode, self.settings.PROFILING_INTERVAL_MS / 1000)
+        if not profile.start():
+            # Another request is being profiled
+            await self.app(scope, receive, send)
+            return
+
+        filename = _profile_filename(scope, profile.suffix)
+
+        async def send_with_profile(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-file", filename.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            profile.stop()
+            path = Path(self.settings.PROFILING_OUTPUT_DIR) / filename
+            try:
+                await anyio.to_thread.run_sync(profile.write, path)
+                logger.info(
+                    "Profiled %s %s (%s, %.1f ms) -> %s",
+                    scope["method"], scope["path"], mode, profile.duration * 1000, path
+                )
+            except Exception as e:
+                logger.warning("Could not write profile %s: %s", path, e)
+
+    async def _requested_mode(self, scope) -> Optional[str]:
+        """Profiler to use for this request, or None to run it unprofiled."""
+        requested = None
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                requested = value.decode("latin-1").strip().lower()
+            elif name == b"authorization":
+                authorization = value.decode("latin-1")
+
+        settings = self.settings
+        if requested is not None and await _is_admin_request(authorization, settings):
+            if requested in PROFILE_MODES:
+                return requested
+            return settings.PROFILING_MODE
+
+        if settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE:
+            return settings.PROFILING_MODE
+        return None
+
+
+async def _is_admin_request(authorization: Optional[str], settings: Settings) -> bool:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        return is_admin(await authenticate_token(token.strip(), settings), settings)
+    except HTTPException:
+        return False
+
+
+def _profile_filename(scope, suffix: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_")[:80] or "root"
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    return f"{stamp}-{scope['method']}-{slug}-{uuid.uuid4().hex[:8]}{suffix}"
@@ -0,0 +1,112 @@
+import json
+import logging
+from typing import Optional
+
+from config import Settings, get_settings
+from services.loaders import begin_request_scope, end_request_scope
+from services.metrics import db_queries, db_query_seconds
+from services.query_stats import begin_query_stats, end_query_stats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+def route_template(scope, unmatched: Optional[str] = None) -> str:
+    """
+    Path template of the route that handled a request ("/api/mentors/{mentor_id}").
+
+    When no route matched (404s) returns unmatched, or the raw path if
+    unmatched is None. Routes of included routers only know their path
+    relative to the router, so the full template comes from FastAPI's
+    effective route context when set.
+    """
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    if context is not None:
+        return context.path
+    template = getattr(scope.get("route"), "path_format", None)
+    if template:
+        return template
+    return scope["path"] if unmatched is None else unmatched
+
+
+class LoaderScopeMiddleware:
+    """
+    ASGI middleware giving every HTTP request its own batch loaders.
+
+    Rows fetched through services.loaders are cached for the lifetime of the
+    request only, so lookups repeated within a request are de-duplicated while
+    nothing is shared between requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_request_scope()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_request_scope(token)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware reporting the Supabase queries made by every HTTP request.
+
+    Adds a Server-Timing header (total DB time and query count, then one
+    metric per table) and logs one line per request that queried the
+    database. Requests making more than DB_QUERY_WARNING_THRESHOLD queries
+    are logged as warnings.
+    """
+
+    def __init__(self, app, settings: Optional[Settings] = None):
+        self.app = app
+        self.settings = settings or get_settings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_query_stats()
+        stats = current_query_stats()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.settings.DB_SERVER_TIMING_ENABLED and stats.count:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_query_stats(token)
+            if stats.count:
+                for table, entry in stats.by_table.items():
+                    db_queries.inc(table, amount=entry["count"])
+                    db_query_seconds.inc(table, amount=entry["seconds"])
+                self._log(scope, status_code, stats)
+
+    def _log(self, scope, status_code, stats) -> None:
+        summary = {
+            "method": scope["method"],
+            "path": route_template(scope),
+            "status": status_code,
+            **stats.summary(),
+        }
+        threshold = self.settings.DB_QUERY_WARNING_THRESHOLD
+        if threshold and stats.count > threshold:
+            logger.warning(
+                "Request exceeded %d DB queries: %s", threshold, json.dumps(summary),
+                extra={"db_stats": summary}
+            )
+        else:
+            logger.info("DB queries: %s", json.dumps(summary), extra={"db_stats": summary})
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Literal, Optional
+from uuid import UUID
+
+from config import Settings, get_settings
+from middleware.auth import require_admin
+from schemas.profile_import import ProfileImportResult
+from services.profile_import import ProfileImporter
+
+router = APIRouter()
+
+# Content-Type -> import format when ?format= is not given
+_CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+_IMPORT_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string"}},
+            "application/x-ndjson": {"schema": {"type": "string"}},
+        },
+    }
+}
+
+
+@router.post("/import/{kind}", response_model=ProfileImportResult, openapi_extra=_IMPORT_BODY)
+async def import_profiles(
+    kind: Literal["mentors", "mentees"],
+    request: Request,
+    import_format: Optional[Literal["csv", "ndjson"]] = Query(
+        None, alias="format", description="Upload format (defaults from Content-Type)"
+    ),
+    admin_id: UUID = Depends(require_admin),
+    settings: Settings = Depends(get_settings)
+):
+    """
+    Bulk-import mentor or mentee profiles from a streamed CSV or NDJSON upload (admin only).
+
+    Rows reference existing users by user_id and interests by name. Invalid
+    rows are reported per line; the rest are imported.
+    """
+    if import_format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        import_format = _CONTENT_TYPE_FORMATS.get(content_type)
+        if import_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Send Content-Type text/csv or application/x-ndjson, or pass ?format=csv|ndjson"
+            )
+
+    importer = ProfileImporter(kind, import_format, settings.PROFILE_IMPORT_CHUNK_SIZE)
+    return await importer.run(request.stream())
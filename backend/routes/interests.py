@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response, status
 from typing import List, Optional
 
 from models.interest import Interest
-from services.interest import InterestService
+from services.interest_catalog import interest_catalog
+from services.database import run_in_db_pool
+from routes.responses import TrustedJSONResponse
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[Interest])
 async def get_all_interests(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by interest category")
 ):
     """
@@ -16,6 +19,27 @@ async def get_all_interests(
     
     Public endpoint - no authentication required.
     Returns master list of all interests for use in dropdowns/autocomplete.
+    Served from the in-memory catalog with a strong ETag; clients sending a
+    matching If-None-Match get 304 Not Modified.
     """
-    return InterestService.get_all_interests(category)
+    if interest_catalog.needs_refresh():
+        await run_in_db_pool(interest_catalog.refresh_if_stale)
+    
+    etag = interest_catalog.etag
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if etag and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
+    # Body is serialized once per catalog load and reused until it changes
+    return TrustedJSONResponse(interest_catalog.to_json(category), headers=cache_headers)
+
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
@@ -6,6 +6,8 @@ from middleware.auth import get_current_user
 from schemas.mentee import MenteeProfileCreate, MenteeProfileUpdate, MenteeProfileResponse
 from models.common import HelpType
 from services.mentee import MenteeService
+from services.database import run_in_db_pool
+from routes.responses import trusted_json
 
 router = APIRouter()
 
@@ -15,7 +17,7 @@ async def get_my_mentee_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Get current user's mentee profile."""
-    return MenteeService.get_mentee_profile(user_id)
+    return await run_in_db_pool(MenteeService.get_mentee_profile, user_id)
 
 
 @router.post("/me", response_model=MenteeProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -24,7 +26,7 @@ async def create_mentee_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Create mentee profile for current user."""
-    return MenteeService.create_mentee_profile(user_id, profile_data)
+    return await run_in_db_pool(MenteeService.create_mentee_profile, user_id, profile_data)
 
 
 @router.put("/me", response_model=MenteeProfileResponse)
@@ -33,7 +35,7 @@ async def update_mentee_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Update current user's mentee profile."""
-    return MenteeService.update_mentee_profile(user_id, profile_data)
+    return await run_in_db_pool(MenteeService.update_mentee_profile, user_id, profile_data)
 
 
 @router.get("", response_model=List[MenteeProfileResponse])
@@ -44,7 +46,8 @@ async def browse_mentees(
     user_id: UUID = Depends(get_current_user)
 ):
     """Browse all mentees. Available to both mentors and mentees."""
-    return MenteeService.browse_mentees(user_id, help_needed, limit, offset)
+    mentees = await run_in_db_pool(MenteeService.browse_mentees, user_id, help_needed, limit, offset)
+    return trusted_json(mentees, List[MenteeProfileResponse])
 
 
 @router.get("/{mentee_id}", response_model=MenteeProfileResponse)
@@ -53,5 +56,5 @@ async def get_mentee_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Get public mentee profile by ID."""
-    return MenteeService.get_mentee_profile_by_id(mentee_id)
+    return await run_in_db_pool(MenteeService.get_mentee_profile_by_id, mentee_id)
 
@@ -6,6 +6,8 @@ from middleware.auth import get_current_user
 from schemas.mentor import MentorProfileCreate, MentorProfileUpdate, MentorProfileResponse
 from models.common import HelpType
 from services.mentor import MentorService
+from services.database import run_in_db_pool
+from routes.responses import trusted_json
 
 router = APIRouter()
 
@@ -15,7 +17,7 @@ async def get_my_mentor_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Get current user's mentor profile."""
-    return MentorService.get_mentor_profile(user_id)
+    return await run_in_db_pool(MentorService.get_mentor_profile, user_id)
 
 
 @router.post("/me", response_model=MentorProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -24,7 +26,7 @@ async def create_mentor_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Create mentor profile for current user."""
-    return MentorService.create_mentor_profile(user_id, profile_data)
+    return await run_in_db_pool(MentorService.create_mentor_profile, user_id, profile_data)
 
 
 @router.put("/me", response_model=MentorProfileResponse)
@@ -33,7 +35,7 @@ async def update_mentor_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Update current user's mentor profile."""
-    return MentorService.update_mentor_profile(user_id, profile_data)
+    return await run_in_db_pool(MentorService.update_mentor_profile, user_id, profile_data)
 
 
 @router.get("", response_model=List[MentorProfileResponse])
@@ -45,7 +47,8 @@ async def browse_mentors(
     user_id: UUID = Depends(get_current_user)
 ):
     """Browse all active mentors. Available to both mentors and mentees."""
-    return MentorService.browse_mentors(user_id, help_type, industry, limit, offset)
+    mentors = await run_in_db_pool(MentorService.browse_mentors, user_id, help_type, industry, limit, offset)
+    return trusted_json(mentors, List[MentorProfileResponse])
 
 
 @router.get("/{mentor_id}", response_model=MentorProfileResponse)
@@ -54,5 +57,5 @@ async def get_mentor_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Get public mentor profile by ID."""
-    return MentorService.get_mentor_profile_by_id(mentor_id)
+    return await run_in_db_pool(MentorService.get_mentor_profile_by_id, mentor_id)
 
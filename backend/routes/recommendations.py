@@ -6,6 +6,8 @@ from middleware.auth import get_current_user
 from schemas.mentor import MentorProfileResponse
 from models.common import HelpType
 from services.recommendation import RecommendationService
+from services.database import run_in_db_pool
+from routes.responses import trusted_json
 
 router = APIRouter()
 
@@ -23,7 +25,8 @@ async def get_recommended_mentors(
     Returns personalized mentor recommendations based on mentee's profile,
     interests, and help needed. This is the swipeable feed for mentees.
     """
-    return RecommendationService.get_recommended_mentors(user_id, help_type, limit, offset)
+    mentors = await run_in_db_pool(RecommendationService.get_recommended_mentors, user_id, help_type, limit, offset)
+    return trusted_json(mentors, List[MentorProfileResponse])
 
 
 
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
 from uuid import UUID
 
 from middleware.auth import get_current_user
+from models.common import RequestStatus
 from schemas.request import (
     MentorshipRequestCreate,
     MentorshipRequestResponse,
-    MentorshipRequestListResponse
+    MentorshipRequestListResponse,
+    MentorshipRequestBatchRespond,
+    MentorshipRequestBatchRespondResponse
 )
 from services.request import RequestService
+from services.database import run_in_db_pool
+from routes.responses import trusted_json
 
 router = APIRouter()
 
@@ -18,15 +25,43 @@ async def create_mentorship_request(
     user_id: UUID = Depends(get_current_user)
 ):
     """Create a mentorship request (mentee only)."""
-    return RequestService.create_request(user_id, request_data)
+    return await run_in_db_pool(RequestService.create_request, user_id, request_data)
 
 
 @router.get("", response_model=MentorshipRequestListResponse)
 async def get_my_requests(
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Number of requests per page (omit limit and cursor to get every request)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    status_filter: Optional[RequestStatus] = Query(None, alias="status", description="Filter by request status"),
     user_id: UUID = Depends(get_current_user)
 ):
-    """Get user's mentorship requests (different for mentors vs mentees)."""
-    return RequestService.get_requests_for_user(user_id)
+    """
+    Get user's mentorship requests, newest first (different for mentors vs mentees).
+    
+    Paginated when limit or cursor is given (limit defaults to 50 then);
+    otherwise every request is returned in one response.
+    """
+    page = await run_in_db_pool(RequestService.get_requests_for_user, user_id, limit, cursor, status_filter)
+    return trusted_json(page, MentorshipRequestListResponse)
+
+
+@router.get("/export")
+async def export_my_requests(
+    status_filter: Optional[RequestStatus] = Query(None, alias="status", description="Filter by request status"),
+    user_id: UUID = Depends(get_current_user)
+):
+    """Stream all of the user's mentorship requests as NDJSON (one request per line)."""
+    lines = await RequestService.export_requests(user_id, status_filter)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@router.patch("/batch", response_model=MentorshipRequestBatchRespondResponse)
+async def respond_to_requests(
+    batch: MentorshipRequestBatchRespond,
+    user_id: UUID = Depends(get_current_user)
+):
+    """Accept/decline several requests at once (mentor only); returns one result per decision."""
+    return await run_in_db_pool(RequestService.respond_to_requests, user_id, batch)
 
 
 @router.get("/{request_id}", response_model=MentorshipRequestResponse)
@@ -35,7 +70,7 @@ async def get_request(
     user_id: UUID = Depends(get_current_user)
 ):
     """Get specific mentorship request (must be involved as mentor or mentee)."""
-    return RequestService.get_request(request_id, user_id)
+    return await run_in_db_pool(RequestService.get_request, request_id, user_id)
 
 
 @router.patch("/{request_id}/accept", response_model=MentorshipRequestResponse)
@@ -44,7 +79,7 @@ async def accept_request(
     user_id: UUID = Depends(get_current_user)
 ):
     """Accept a mentorship request (mentor only)."""
-    return RequestService.accept_request(request_id, user_id)
+    return await run_in_db_pool(RequestService.accept_request, request_id, user_id)
 
 
 @router.patch("/{request_id}/decline", response_model=MentorshipRequestResponse)
@@ -53,5 +88,5 @@ async def decline_request(
     user_id: UUID = Depends(get_current_user)
 ):
     """Decline a mentorship request (mentor only)."""
-    return RequestService.decline_request(request_id, user_id)
+    return await run_in_db_pool(RequestService.decline_request, request_id, user_id)
 
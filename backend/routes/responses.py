@@ -0,0 +1,38 @@
+"""
+Fast JSON responses for payloads the services already validated.
+
+Routes keep `response_model=...`, so the OpenAPI schema is unchanged, but
+list endpoints return a TrustedJSONResponse instead of the models: FastAPI
+passes Response instances through untouched, skipping the response_model
+re-validation, and the body is written by pydantic-core's dump_json straight
+from the models (no intermediate dicts, no json.dumps).
+
+Only use this for values built by services.decoding or other validated
+models; anything else should go through response_model as usual.
+"""
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+class TrustedJSONResponse(Response):
+    """A response whose body is already-serialized JSON."""
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def trusted_json(
+    content: Any,
+    response_type: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> TrustedJSONResponse:
+    """Serialize validated models of response_type (e.g. List[MentorProfileResponse]) to a response."""
+    body = _adapter(response_type).dump_json(content)
+    return TrustedJSONResponse(body, status_code=status_code, headers=headers)
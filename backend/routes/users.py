@@ -4,6 +4,7 @@ from uuid import UUID
 from middleware.auth import get_current_user
 from schemas.user import UserProfileUpdate, UserProfileResponse
 from services.user import UserService
+from services.database import run_in_db_pool
 
 router = APIRouter()
 
@@ -13,7 +14,7 @@ async def get_my_user_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Get current user's profile."""
-    return UserService.get_user_profile(user_id)
+    return await run_in_db_pool(UserService.get_user_profile, user_id)
 
 
 @router.put("/me", response_model=UserProfileResponse)
@@ -22,5 +23,5 @@ async def update_user_profile(
     user_id: UUID = Depends(get_current_user)
 ):
     """Update current user's profile."""
-    return UserService.update_user_profile(user_id, profile_data)
+    return await run_in_db_pool(UserService.update_user_profile, user_id, profile_data)
 
@@ -5,9 +5,19 @@ from schemas.mentee import MenteeProfileCreate, MenteeProfileUpdate, MenteeProfi
 from schemas.request import (
     MentorshipRequestCreate,
     MentorshipRequestResponse,
-    MentorshipRequestListResponse
+    MentorshipRequestListResponse,
+    MentorshipRequestDecision,
+    MentorshipRequestBatchRespond,
+    MentorshipRequestDecisionResult,
+    MentorshipRequestBatchRespondResponse
 )
 from schemas.ai import RequestRewriteRequest, RequestRewriteResponse
+from schemas.profile_import import (
+    MentorImportRow,
+    MenteeImportRow,
+    ProfileImportError,
+    ProfileImportResult
+)
 
 __all__ = [
     # User schemas
@@ -25,8 +35,17 @@ __all__ = [
     "MentorshipRequestCreate",
     "MentorshipRequestResponse",
     "MentorshipRequestListResponse",
+    "MentorshipRequestDecision",
+    "MentorshipRequestBatchRespond",
+    "MentorshipRequestDecisionResult",
+    "MentorshipRequestBatchRespondResponse",
     # AI schemas
     "RequestRewriteRequest",
     "RequestRewriteResponse",
+    # Admin import schemas
+    "MentorImportRow",
+    "MenteeImportRow",
+    "ProfileImportError",
+    "ProfileImportResult",
 ]
 
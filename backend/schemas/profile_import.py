@@ -0,0 +1,58 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator
+from uuid import UUID
+from models.common import HelpType
+
+
+def _split_list(value):
+    """Accept list cells as a JSON array or a ';'-separated string (CSV)."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(";") if item.strip()]
+    return value
+
+
+class MentorImportRow(BaseModel):
+    """One mentor profile in a bulk import (CSV row or NDJSON line)."""
+    user_id: UUID  # Existing auth user / user_profiles ID
+    industry: Optional[str] = None
+    job_title: Optional[str] = None
+    help_types_offered: List[HelpType]
+    max_requests_per_week: int = Field(3, gt=0)
+    interests: List[str] = []  # Interest names, resolved against the interest catalog
+    profile_picture_url: Optional[str] = None
+    is_active: bool = True
+
+    _split_lists = field_validator("help_types_offered", "interests", mode="before")(_split_list)
+
+
+class MenteeImportRow(BaseModel):
+    """One mentee profile in a bulk import (CSV row or NDJSON line)."""
+    user_id: UUID  # Existing auth user / user_profiles ID
+    industry: Optional[str] = None
+    goals: Optional[str] = None
+    help_needed: List[HelpType]
+    background: Optional[str] = None
+    interests: List[str] = []  # Interest names, resolved against the interest catalog
+    profile_picture_url: Optional[str] = None
+
+    _split_lists = field_validator("help_needed", "interests", mode="before")(_split_list)
+
+
+class ProfileImportError(BaseModel):
+    """A row that was not imported."""
+    line: int  # 1-based line number in the upload (where the record starts)
+    user_id: Optional[str] = None
+    detail: str
+
+
+class ProfileImportResult(BaseModel):
+    """Summary of a bulk profile import."""
+    kind: Literal["mentors", "mentees"]
+    format: Literal["csv", "ndjson"]
+    rows: int  # Data rows read (excluding the CSV header and blank lines)
+    imported: int
+    failed: int
+    errors: List[ProfileImportError]  # Capped; see errors_truncated
+    errors_truncated: bool = False
+    elapsed_seconds: float
+    rows_per_second: float
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
 from models.common import HelpType, RequestStatus
@@ -35,5 +35,38 @@ class MentorshipRequestResponse(BaseModel):
 class MentorshipRequestListResponse(BaseModel):
     """Schema for list of mentorship requests."""
     requests: List[MentorshipRequestResponse]
-    total: int
+    total: int  # Number of requests in this response (all of them when not paginated)
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
 
+
+
+# Upper bound on decisions per batch request
+MAX_BATCH_DECISIONS = 100
+
+
+class MentorshipRequestDecision(BaseModel):
+    """One accept/decline decision in a batch."""
+    request_id: UUID
+    action: Literal["accept", "decline"]
+
+
+class MentorshipRequestBatchRespond(BaseModel):
+    """Schema for accepting/declining several requests at once."""
+    decisions: List[MentorshipRequestDecision] = Field(..., min_length=1, max_length=MAX_BATCH_DECISIONS)
+
+
+class MentorshipRequestDecisionResult(BaseModel):
+    """Outcome of one decision in a batch."""
+    request_id: UUID
+    action: Literal["accept", "decline"]
+    success: bool
+    status_code: int  # Status the single accept/decline endpoint would have returned
+    detail: Optional[str] = None  # Error message when success is False
+    request: Optional[MentorshipRequestResponse] = None  # Updated request when success is True
+
+
+class MentorshipRequestBatchRespondResponse(BaseModel):
+    """Schema for batch accept/decline results (one per decision, in input order)."""
+    results: List[MentorshipRequestDecisionResult]
+    succeeded: int
+    failed: int
@@ -0,0 +1,127 @@
+"""
+Small in-process caching utilities.
+
+TTLCache is a bounded LRU cache whose entries expire after a per-entry
+time-to-live. It keeps hit/miss counters and can collapse concurrent async
+loads of the same key into a single in-flight call.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """Bounded LRU cache with per-entry TTL. Safe to use from threads."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value. ttl_seconds is capped at the cache's default TTL."""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_for: Optional[Callable[[Any], Optional[float]]] = None
+    ) -> Any:
+        """
+        Return the cached value for key, loading it on a miss.
+
+        Concurrent callers missing on the same key share one loader call.
+        The load runs in its own task, so a cancelled caller (e.g. a client
+        disconnecting) only cancels its own wait; the other callers still
+        get the value. Exceptions from the loader propagate to every waiter
+        and are not cached.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value
+            ttl_for: Optional function computing the entry TTL from the value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, ttl_for))
+            task.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_for: Optional[Callable[[Any], Optional[float]]]
+    ) -> Any:
+        try:
+            value = await loader()
+            self.set(key, value, ttl_for(value) if ttl_for else None)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Current size and hit/miss counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Mark a failed load retrieved so it doesn't log a warning when every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
@@ -4,21 +4,94 @@ Supabase database client singleton.
 This module provides a shared Supabase client instance that all services
 can import and use. The client uses the service role key to bypass RLS
 and perform administrative operations.
+
+The client is created on first use (the app lifespan creates it at startup),
+so importing services does not import the supabase package or require
+credentials. `supabase` is a proxy that forwards to the real client;
+get_supabase() returns the client itself.
+
+The client is synchronous, so async code must not call .execute() directly:
+that would stall the event loop for the whole round trip. Routes run service
+calls through run_in_db_pool, and async services await execute_async, both of
+which offload the blocking work to a bounded thread pool.
+
+Every PostgREST round trip goes through QueryStatsTransport, which counts
+queries and their time per HTTP request (see services.query_stats).
 """
-import sys
-from pathlib import Path
-from supabase import create_client, Client
+import threading
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
-# Add backend directory to Python path for config import
-backend_dir = Path(__file__).parent.parent
-if str(backend_dir) not in sys.path:
-    sys.path.insert(0, str(backend_dir))
+import anyio
+import anyio.to_thread
 
 from config import settings
+from services.query_stats import QueryStatsTransport
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+_client: Optional["Client"] = None
+_client_lock = threading.Lock()
+
+
+def get_supabase() -> "Client":
+    """Return the shared Supabase client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_client()
+    return _client
+
+
+def _create_client() -> "Client":
+    import httpx
+    from supabase import create_client, ClientOptions
+
+    settings.validate()
+    # Same behaviour as the client postgrest-py builds by default, plus query accounting
+    http_client = httpx.Client(
+        transport=QueryStatsTransport(httpx.HTTPTransport(http2=settings.HTTP2_ENABLED)),
+        timeout=120,
+        follow_redirects=True
+    )
+    return create_client(
+        settings.SUPABASE_URL,
+        settings.SUPABASE_SERVICE_ROLE_KEY,
+        options=ClientOptions(httpx_client=http_client)
+    )
+
+
+class _LazySupabase:
+    """Stand-in for the client at import time; attribute access creates and forwards to it."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_supabase(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_supabase(), name, value)
+
+
+supabase: "Client" = _LazySupabase()
+
+
+# Caps how many blocking DB calls run at once across the worker
+db_limiter = anyio.CapacityLimiter(settings.DB_THREAD_POOL_SIZE)
+
+T = TypeVar("T")
+
+
+async def run_in_db_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking function (typically a sync service method) in the DB thread pool.
+
+    Context variables are propagated to the worker thread. Exceptions,
+    including HTTPException, propagate to the caller unchanged.
+    """
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=db_limiter)
 
-# Create Supabase client singleton
-supabase: Client = create_client(
-    settings.SUPABASE_URL,
-    settings.SUPABASE_SERVICE_ROLE_KEY
-)
 
+async def execute_async(query: Any) -> Any:
+    """Execute a PostgREST query builder without blocking the event loop."""
+    return await run_in_db_pool(query.execute)
@@ -0,0 +1,61 @@
+"""
+Single-pass decoding of database rows into response models.
+
+Supabase returns rows as JSON-decoded dicts (ISO timestamps, UUID and enum
+values as strings). Building a domain model field by field and then
+converting it with `Response.from_model(...)` validated every row twice and
+copied it through an intermediate dict. The helpers here hand the row
+straight to a precompiled pydantic-core validator, which parses timestamps,
+UUIDs and enums and builds the response model in one pass. Extra columns
+(embedded relations, counters) are ignored by the validators.
+"""
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from pydantic import TypeAdapter
+
+from models.interest import Interest
+from schemas.mentee import MenteeProfileResponse
+from schemas.mentor import MentorProfileResponse
+from schemas.request import MentorshipRequestResponse
+from schemas.user import UserProfileResponse
+
+_request_list = TypeAdapter(List[MentorshipRequestResponse])
+_interest_list = TypeAdapter(List[Interest])
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a PostgREST timestamptz string (Python < 3.11 rejects a trailing Z)."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def decode_request(row: dict) -> MentorshipRequestResponse:
+    """mentorship_requests row -> MentorshipRequestResponse."""
+    return MentorshipRequestResponse.model_validate(row)
+
+
+def decode_requests(rows: Iterable[dict]) -> List[MentorshipRequestResponse]:
+    """Decode a list of mentorship_requests rows in a single validator call."""
+    return _request_list.validate_python(rows)
+
+
+def decode_user(row: dict) -> UserProfileResponse:
+    """user_profiles row -> UserProfileResponse."""
+    return UserProfileResponse.model_validate(row)
+
+
+def decode_mentor(row: dict, interests: List[Interest]) -> MentorProfileResponse:
+    """mentor_profiles row plus its resolved interests -> MentorProfileResponse."""
+    return MentorProfileResponse.model_validate({**row, "interests": interests})
+
+
+def decode_mentee(row: dict, interests: List[Interest]) -> MenteeProfileResponse:
+    """mentee_profiles row plus its resolved interests -> MenteeProfileResponse."""
+    return MenteeProfileResponse.model_validate({**row, "interests": interests})
+
+
+def decode_interests(rows: Iterable[dict]) -> List[Interest]:
+    """Decode interests rows in a single validator call."""
+    return _interest_list.validate_python(rows)
@@ -4,17 +4,48 @@ Discovery service for browsing mentors.
 Implements the browse-and-request model where mentees can discover
 mentors in their industry with random shuffle (dating app style).
 """
-from typing import Optional, List, Dict
+import asyncio
+import hashlib
+import secrets
+from typing import Optional, List, Tuple
 from uuid import UUID
 from fastapi import HTTPException, status
-from collections import Counter
 
-from services.database import supabase
+from config import settings
+from services.cache import TTLCache
+from services.database import supabase, execute_async
+from services.loaders import get_loaders
 from services.profile_service import ProfileService
 from models.mentor import MentorProfile
-from models.interest import Interest
 from models.common import HelpType
 
+# IDs read per round trip when snapshotting a feed session
+_SNAPSHOT_PAGE_SIZE = 1000
+
+# Shuffled candidate IDs per feed session, keyed by (mentee, session, industry, help type)
+feed_sessions = TTLCache(
+    max_size=settings.DISCOVERY_SESSION_MAX_SIZE,
+    ttl_seconds=settings.DISCOVERY_SESSION_TTL_SECONDS
+)
+
+
+def _pending_requests(data: dict) -> int:
+    """
+    The mentor row's maintained pending request counter.
+
+    Raises instead of assuming 0 when the column is missing, which would
+    show every mentor as available.
+
+    Raises:
+        HTTPException(500): database/add_pending_request_counters.sql not applied
+    """
+    if 'pending_requests' not in data:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="mentor_profiles.pending_requests is missing; apply database/add_pending_request_counters.sql"
+        )
+    return data['pending_requests']
+
 
 class DiscoveryService:
     """Service for mentor discovery and browsing."""
@@ -25,20 +56,33 @@ class DiscoveryService:
         help_type: Optional[HelpType] = None,
         available_only: bool = False,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        session_id: Optional[str] = None
     ) -> dict:
         """
         Browse mentors with random shuffle (dating app style).
 
+        The order is fixed per feed session. The first page (no session_id)
+        snapshots the IDs of every matching mentor, orders them by a hash of
+        each ID keyed with a seed derived from a new session ID and caches
+        the list for DISCOVERY_SESSION_TTL_SECONDS. Later pages pass the
+        returned session_id and only slice the cached list, so pages never
+        overlap or skip mentors and each page loads just the mentors it
+        shows (one query). An expired session is rebuilt with the same seed;
+        a mentor's sort key depends only on the seed and its own ID, so
+        mentors that still match keep their relative order (offsets only
+        shift by the mentors that joined or left before them).
+
         Args:
             mentee_user_id: UUID of the browsing mentee
             help_type: Optional filter for help type offered
             available_only: If True, only show mentors accepting requests
             limit: Max mentors to return (pagination)
             offset: Offset for pagination
+            session_id: Feed session from a previous page (None starts a new one)
 
         Returns:
-            Dict with mentors list and total count
+            Dict with mentors list, total mentors in the session and session_id
 
         Raises:
             HTTPException(404): Mentee profile not found
@@ -60,58 +104,28 @@ class DiscoveryService:
                 detail="Please set your industry in your profile first"
             )
 
-        # Query mentor profiles with interests
-        query = supabase.table('mentor_profiles')\
-            .select('*, mentor_interests(interest:interests(*))')\
-            .eq('is_active', True)
-
-        # HARD FILTER: Industry match (case-insensitive)
-        query = query.ilike('industry', mentee_industry)
-
-        # OPTIONAL FILTER: Help type
-        if help_type:
-            query = query.contains('help_types_offered', [help_type.value])
-
-        # Pagination
-        query = query.range(offset, offset + limit - 1)
+        if session_id is None:
+            session_id = secrets.token_urlsafe(12)
+        candidate_ids = await DiscoveryService._feed_candidates(
+            mentee_user_id, session_id, mentee_industry, help_type
+        )
 
-        # Execute query
-        result = query.execute()
+        # Hydrate only this page (one batched query, interests from the catalog)
+        rows = await get_loaders().mentor_profiles.load_many(candidate_ids[offset:offset + limit])
 
-        # Transform mentors (flatten interests)
-        mentors = []
-        for data in result.data:
-            interest_relations = data.get('mentor_interests', [])
-            interests = [
-                Interest(**item['interest'])
-                for item in interest_relations
-                if item.get('interest')
-            ]
+        # Build response with availability indicators
+        mentor_list = []
+        for data in rows:
+            # Deleted or deactivated since the snapshot was taken
+            if not data or not data.get('is_active'):
+                continue
 
-            # Remove nested field and add flattened interests
             profile_data = {k: v for k, v in data.items() if k != 'mentor_interests'}
-            profile_data['interests'] = interests
-
+            profile_data['interests'] = await ProfileService._load_interests(data.get('mentor_interests'))
             mentor = MentorProfile(**profile_data)
-            mentors.append(mentor)
-
-        # Batch check availability for all mentors
-        mentor_ids = [m.user_id for m in mentors]
 
-        # Single query to count pending requests for ALL mentors
-        pending_result = supabase.table('mentorship_requests')\
-            .select('mentor_id')\
-            .eq('status', 'pending')\
-            .in_('mentor_id', [str(mid) for mid in mentor_ids])\
-            .execute()
-
-        # Count pending requests per mentor
-        pending_counts = Counter([r['mentor_id'] for r in pending_result.data])
-
-        # Build response with availability indicators
-        mentor_list = []
-        for mentor in mentors:
-            pending_count = pending_counts.get(str(mentor.user_id), 0)
+            # Pending requests are maintained on the profile row (see add_pending_request_counters.sql)
+            pending_count = _pending_requests(data)
             is_available = pending_count < mentor.max_requests_per_week
 
             # Filter out unavailable if requested
@@ -127,9 +141,59 @@ class DiscoveryService:
 
         return {
             "mentors": mentor_list,
-            "total": len(mentor_list)
+            "total": len(candidate_ids),
+            "session_id": session_id
         }
 
+    @staticmethod
+    async def _feed_candidates(
+        mentee_user_id: UUID,
+        session_id: str,
+        industry: str,
+        help_type: Optional[HelpType]
+    ) -> Tuple[str, ...]:
+        """Shuffled candidate mentor profile IDs of a feed session (cached, built on first use)."""
+        key = (str(mentee_user_id), session_id, industry.lower(), help_type.value if help_type else None)
+        return await feed_sessions.get_or_load(
+            key,
+            lambda: DiscoveryService._snapshot_candidates(mentee_user_id, session_id, industry, help_type)
+        )
+
+    @staticmethod
+    async def _snapshot_candidates(
+        mentee_user_id: UUID,
+        session_id: str,
+        industry: str,
+        help_type: Optional[HelpType]
+    ) -> Tuple[str, ...]:
+        """Read the IDs of every matching mentor (keyset-paginated) and order them by the session's keyed hash."""
+        candidate_ids: List[str] = []
+        last_id = None
+        while True:
+            # HARD FILTER: Industry match (case-insensitive)
+            query = supabase.table('mentor_profiles')\
+                .select('id')\
+                .eq('is_active', True)\
+                .ilike('industry', industry)
+
+            # OPTIONAL FILTER: Help type
+            if help_type:
+                query = query.contains('help_types_offered', [help_type.value])
+
+            if last_id is not None:
+                query = query.gt('id', last_id)
+            rows = (await execute_async(query.order('id').limit(_SNAPSHOT_PAGE_SIZE))).data
+            candidate_ids.extend(row['id'] for row in rows)
+            if len(rows) < _SNAPSHOT_PAGE_SIZE:
+                break
+            last_id = rows[-1]['id']
+
+        # Each ID's position depends only on the seed and the ID itself (unlike a seeded
+        # shuffle), so a rebuilt session keeps surviving mentors in the same relative order
+        seed = f"{mentee_user_id}:{session_id}"
+        candidate_ids.sort(key=lambda mentor_id: hashlib.sha256(f"{seed}:{mentor_id}".encode()).digest())
+        return tuple(candidate_ids)
+
 #This is for when a mentee clicks on a mentor to see their full profile before sending a request.
 
     @staticmethod
@@ -150,15 +214,17 @@ class DiscoveryService:
         Raises:
             HTTPException(404): Mentor or mentee profile not found
         """
-        # Get mentor and mentee
-        mentor = await ProfileService.get_mentor_profile(mentor_id)
+        # Get mentor and mentee together so their lookups share batched queries
+        mentor, mentee = await asyncio.gather(
+            ProfileService.get_mentor_profile(mentor_id),
+            ProfileService.get_mentee_profile(mentee_user_id)
+        )
         if not mentor or not mentor.is_active:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Mentor not found or inactive"
             )
 
-        mentee = await ProfileService.get_mentee_profile(mentee_user_id)
         if not mentee:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -176,14 +242,8 @@ class DiscoveryService:
         shared_interests = [i for i in mentor.interests if i.id in shared_interest_ids]
 
 
-        # Count pending requests for this mentor
-        pending_result = supabase.table('mentorship_requests')\
-        .select('id')\
-        .eq('mentor_id', str(mentor_id))\
-        .eq('status', 'pending')\
-        .execute()
-
-        pending_count = len(pending_result.data)
+        # Pending request counter from the (already loaded) profile row
+        pending_count = await DiscoveryService._pending_request_count(mentor_id)
         is_available = pending_count < mentor.max_requests_per_week
 
         return {
@@ -217,17 +277,29 @@ class DiscoveryService:
                 detail="Mentor not found"
             )
 
-        # Count pending requests
-        result = supabase.table('mentorship_requests')\
-            .select('id')\
-            .eq('mentor_id', str(mentor_id))\
-            .eq('status', 'pending')\
-            .execute()
-
-        pending_count = len(result.data)
+        pending_count = await DiscoveryService._pending_request_count(mentor_id)
 
         return {
             "is_available": pending_count < mentor.max_requests_per_week,
             "pending_count": pending_count,
             "max_requests": mentor.max_requests_per_week
         }
+
+    @staticmethod
+    async def _pending_request_count(mentor_id: UUID) -> int:
+        """
+        Read a mentor's maintained pending request counter.
+
+        The mentor_profiles row is served by the request's batch loader, so
+        after ProfileService.get_mentor_profile this costs no extra query.
+
+        Args:
+            mentor_id: User ID of the mentor
+
+        Returns:
+            Number of pending requests addressed to the mentor
+        """
+        data = await get_loaders().mentor_profiles_by_user.load(mentor_id)
+        if not data:
+            return 0
+        return _pending_requests(data)
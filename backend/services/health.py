@@ -0,0 +1,174 @@
+"""
+Background dependency checks for the readiness probe.
+
+Orchestrator probes can poll /health/ready as often as they like: the
+endpoint only reads the result cached here. HealthChecker refreshes that
+result every HEALTH_CHECK_INTERVAL_SECONDS (as a lifespan task) by pinging:
+
+- the Supabase REST API (a one-row read of interests),
+- the Supabase auth server (/auth/v1/health).
+
+Both go through the shared async HTTP client with a short timeout, so a
+hanging dependency neither blocks a DB pool thread nor stalls the probe.
+Readiness also requires the in-memory interest catalog and recommendation
+index to be warm (READINESS_REQUIRE_WARM_CACHES), so traffic is only
+routed to an instance once it serves from memory. Caches whose startup
+load failed are retried on every check until they are warm, so one
+transient database error at boot does not leave the instance unready.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from config import Settings, get_settings
+from services.database import run_in_db_pool
+from services.http_client import http_clients
+from services.interest_catalog import interest_catalog
+from services.recommendation_index import recommendation_index
+
+logger = logging.getLogger(__name__)
+
+# A cached result older than this many intervals no longer counts as healthy
+STALE_AFTER_INTERVALS = 3
+
+
+class CheckResult:
+    """Outcome of one dependency check."""
+
+    def __init__(self, ok: bool, latency_seconds: float, error: Optional[str] = None):
+        self.ok = ok
+        self.latency_seconds = latency_seconds
+        self.error = error
+        self.checked_at = time.time()
+
+    def to_dict(self) -> Dict[str, object]:
+        result = {"ok": self.ok, "latency_ms": round(self.latency_seconds * 1000, 1), "checked_at": self.checked_at}
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+class HealthChecker:
+    """Periodically checks Supabase and caches the results for the readiness probe."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.interval_seconds = settings.HEALTH_CHECK_INTERVAL_SECONDS
+        self.timeout_seconds = settings.HEALTH_CHECK_TIMEOUT_SECONDS
+        self.results: Dict[str, CheckResult] = {}
+        self._checked_at: Optional[float] = None
+
+    async def check_supabase(self) -> None:
+        """One cheap read through PostgREST (service role, so RLS does not matter)."""
+        await self._get(
+            f"{self.settings.SUPABASE_URL}/rest/v1/interests",
+            params={"select": "id", "limit": "1"},
+            headers={"Authorization": f"Bearer {self.settings.SUPABASE_SERVICE_ROLE_KEY}"}
+        )
+
+    async def check_auth(self) -> None:
+        await self._get(f"{self.settings.SUPABASE_URL}/auth/v1/health")
+
+    async def _get(self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> None:
+        response = await http_clients.get("supabase").get(
+            url,
+            params=params,
+            headers={"apikey": self.settings.SUPABASE_SERVICE_ROLE_KEY, **(headers or {})},
+            timeout=self.timeout_seconds
+        )
+        response.raise_for_status()
+
+    async def check_once(self) -> None:
+        """Run every check concurrently and replace the cached results."""
+        checks = {"supabase": self.check_supabase, "auth": self.check_auth}
+        outcomes = await asyncio.gather(*(self._timed(check) for check in checks.values()))
+        for name, result in zip(checks, outcomes):
+            previous = self.results.get(name)
+            if previous is not None and previous.ok != result.ok:
+                log = logger.info if result.ok else logger.warning
+                log("Health check %s is now %s%s", name, "up" if result.ok else "down",
+                    f": {result.error}" if result.error else "")
+            self.results[name] = result
+        if self.results["supabase"].ok:
+            await self.warm_caches()
+        self._checked_at = time.monotonic()
+
+    @staticmethod
+    async def warm_caches() -> None:
+        """Retry loading whichever in-memory cache is not warm yet."""
+        if not interest_catalog.is_loaded:
+            try:
+                await run_in_db_pool(interest_catalog.refresh_if_stale)
+                logger.info("Interest catalog loaded with %d interests", len(interest_catalog))
+            except Exception as e:
+                logger.warning("Interest catalog load failed: %s", e)
+        # A build already in progress (the index's own maintain task) will set is_ready itself
+        if not recommendation_index.is_ready and not recommendation_index.is_building:
+            try:
+                await run_in_db_pool(recommendation_index.build)
+                logger.info("Recommendation index built with %d mentors", len(recommendation_index))
+            except Exception as e:
+                logger.warning("Recommendation index build failed: %s", e)
+
+    async def _timed(self, check) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            await check()
+        except httpx.HTTPStatusError as e:
+            return CheckResult(False, time.perf_counter() - started, f"HTTP {e.response.status_code}")
+        except Exception as e:
+            return CheckResult(False, time.perf_counter() - started, f"{type(e).__name__}: {e}")
+        return CheckResult(True, time.perf_counter() - started)
+
+    async def maintain(self) -> None:
+        """Check now, then every interval_seconds (runs as a lifespan task)."""
+        while True:
+            try:
+                await self.check_once()
+            except Exception as e:
+                logger.warning("Health checks failed to run: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+    @staticmethod
+    def warmup() -> Dict[str, bool]:
+        """Whether each in-memory cache has been loaded."""
+        return {
+            "interest_catalog": interest_catalog.is_loaded,
+            "recommendation_index": recommendation_index.is_ready,
+        }
+
+    def is_stale(self) -> bool:
+        if self._checked_at is None:
+            return True
+        return time.monotonic() - self._checked_at > STALE_AFTER_INTERVALS * self.interval_seconds
+
+    def readiness(self) -> Dict[str, object]:
+        """Cached readiness report; never performs a check itself."""
+        warmup = self.warmup()
+        dependencies_ok = bool(self.results) and all(result.ok for result in self.results.values())
+        warm = all(warmup.values()) or not self.settings.READINESS_REQUIRE_WARM_CACHES
+
+        if self._checked_at is None:
+            state = "starting"
+        elif self.is_stale():
+            state = "stale"
+        elif not dependencies_ok:
+            state = "unavailable"
+        elif not warm:
+            state = "warming_up"
+        else:
+            state = "ready"
+
+        return {
+            "status": state,
+            "ready": state == "ready",
+            "checks": {name: result.to_dict() for name, result in self.results.items()},
+            "warmup": warmup,
+        }
+
+
+# Global checker instance
+health_checker = HealthChecker(get_settings())
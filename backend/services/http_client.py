@@ -0,0 +1,110 @@
+"""
+Shared outbound HTTP clients.
+
+The registry owns long-lived httpx.AsyncClient instances (keep-alive,
+HTTP/2, bounded connection pools) so callers such as the auth middleware
+reuse connections instead of paying a TCP+TLS handshake per request.
+main.py starts and closes it in the application lifespan.
+"""
+from typing import Dict
+
+import httpx
+
+from config import settings
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Wraps an AsyncHTTPTransport and counts requests for pool metrics."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self._transport = transport
+        self.in_flight = 0
+        self.requests_total = 0
+        self.errors_total = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.requests_total += 1
+        try:
+            return await self._transport.handle_async_request(request)
+        except Exception:
+            self.errors_total += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Connection counts from the underlying httpcore pool."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for c in connections if c.is_idle())
+        return {
+            "connections": len(connections),
+            "idle_connections": idle,
+            "active_connections": len(connections) - idle,
+            "in_flight_requests": self.in_flight,
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+        }
+
+
+class HTTPClientRegistry:
+    """Named, application-scoped httpx.AsyncClient instances."""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, _CountingTransport] = {}
+
+    def get(self, name: str = "default") -> httpx.AsyncClient:
+        """
+        Return the shared client for name, creating it on first use.
+
+        Clients are normally created at startup, but lazily creating one here
+        keeps callers working outside the app lifespan (scripts, benchmarks).
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create(name)
+        return client
+
+    def _create(self, name: str) -> httpx.AsyncClient:
+        transport = _CountingTransport(httpx.AsyncHTTPTransport(
+            http2=settings.HTTP2_ENABLED,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+            )
+        ))
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                settings.HTTP_TIMEOUT_SECONDS,
+                connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS
+            )
+        )
+        self._clients[name] = client
+        self._transports[name] = transport
+        return client
+
+    async def start(self) -> None:
+        """Create the clients used on the request path."""
+        self.get("supabase")
+
+    async def close(self) -> None:
+        """Close every client and release pooled connections."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        self._transports.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Pool usage per named client."""
+        return {name: transport.pool_stats() for name, transport in self._transports.items()}
+
+
+# Global registry instance
+http_clients = HTTPClientRegistry()
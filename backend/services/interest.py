@@ -1,38 +1,23 @@
+import logging
 from typing import List, Optional
 from fastapi import HTTPException, status
-from datetime import datetime
 from uuid import UUID
 
 from services.database import supabase
+from services.interest_catalog import interest_catalog
 from models.interest import Interest
 
+logger = logging.getLogger(__name__)
+
 
 class InterestService:
     """Service for interest operations."""
     
     @staticmethod
     def get_all_interests(category: Optional[str] = None) -> List[Interest]:
-        """Get all interests, optionally filtered by category."""
+        """Get all interests, optionally filtered by category (served from the in-memory catalog)."""
         try:
-            query = supabase.table("interests").select("*")
-            
-            if category:
-                query = query.eq("category", category)
-            
-            query = query.order("name")
-            result = query.execute()
-            
-            interests = []
-            for data in result.data:
-                interest = Interest(
-                    id=UUID(data["id"]),
-                    name=data["name"],
-                    category=data.get("category"),
-                    created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
-                )
-                interests.append(interest)
-            
-            return interests
+            return interest_catalog.all(category)
             
         except Exception as e:
             raise HTTPException(
@@ -42,28 +27,49 @@ class InterestService:
     
     @staticmethod
     def get_interests_by_ids(interest_ids: List[UUID]) -> List[Interest]:
-        """Get interests by their IDs."""
+        """Get interests by their IDs (resolved from the in-memory catalog)."""
         if not interest_ids:
             return []
         
         try:
-            result = supabase.table("interests").select("*").in_("id", [str(id) for id in interest_ids]).execute()
-            
-            interests = []
-            for data in result.data:
-                interest = Interest(
-                    id=UUID(data["id"]),
-                    name=data["name"],
-                    category=data.get("category"),
-                    created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
-                )
-                interests.append(interest)
-            
-            return interests
+            return interest_catalog.get_by_ids(interest_ids)
             
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error fetching interests: {str(e)}"
             )
-
+    
+    @staticmethod
+    def sync_profile_interests(
+        profile_type: str,
+        profile_id: UUID,
+        current_links: List[dict],
+        interest_ids: List[UUID]
+    ) -> int:
+        """
+        Make a profile's interest links match interest_ids, writing only the difference.
+        
+        Args:
+            profile_type: "mentor" or "mentee"
+            profile_id: Mentor/mentee profile ID
+            current_links: The profile's embedded {profile_type}_interests rows
+            interest_ids: The complete new interest set
+        
+        Returns:
+            Number of link rows written (deleted + inserted); 0 when the set
+            is unchanged, in which case the database is not touched.
+        """
+        current = {str(link["interest_id"]) for link in current_links}
+        wanted = list(dict.fromkeys(str(iid) for iid in interest_ids))
+        if current == set(wanted):
+            return 0
+        
+        # sync_*_interests (database/sync_profile_interests.sql) applies the diff in one transaction
+        result = supabase.rpc(f"sync_{profile_type}_interests", {
+            "p_profile_id": str(profile_id),
+            "p_interest_ids": wanted
+        }).execute()
+        rows_written = result.data or 0
+        logger.info("Synced %s %s interests: %d rows written", profile_type, profile_id, rows_written)
+        return rows_written
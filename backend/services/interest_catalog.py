@@ -0,0 +1,166 @@
+"""
+Process-wide, in-memory copy of the interests master list.
+
+The interests table is a small, nearly static catalog (see
+database/seed_interests.sql) that every profile hydration needs. Instead of
+querying it per request, the catalog is loaded once at startup and interest
+IDs are resolved from memory. After INTEREST_CATALOG_TTL_SECONDS a cheap
+version probe (row count + newest updated_at) decides whether the full list
+must be reloaded. updated_at is bumped by a trigger on every edit
+(database/add_interest_updated_at.sql), so inserts, in-place edits and
+deletes all change the version. The content hash doubles as a strong ETag for
+GET /api/interests, and the serialized JSON body is cached per category
+(for categories the catalog contains) until the next load.
+"""
+import hashlib
+import json
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from config import settings
+from services.database import supabase
+from services.decoding import decode_interests
+from models.interest import Interest
+
+_interest_list = TypeAdapter(List[Interest])
+
+
+class InterestCatalog:
+    """Thread-safe in-memory interest catalog with TTL-based version checks."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.etag: Optional[str] = None
+        self._interests: List[Interest] = []
+        self._by_id: Dict[UUID, Interest] = {}
+        self._by_name: Dict[str, Interest] = {}
+        self._categories: frozenset = frozenset()
+        self._version: Optional[Tuple[int, Optional[str]]] = None
+        self._checked_at: Optional[float] = None
+        self._json: Dict[Optional[str], bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._version is not None
+
+    def __len__(self) -> int:
+        return len(self._interests)
+
+    def needs_refresh(self) -> bool:
+        """Whether the next read has to touch the database."""
+        return self._checked_at is None or time.monotonic() - self._checked_at > self.ttl_seconds
+
+    def contains_all(self, interest_ids: Iterable[UUID]) -> bool:
+        """Whether every ID can be resolved without touching the database."""
+        return all(UUID(str(iid)) in self._by_id for iid in interest_ids)
+
+    def load(self) -> None:
+        """Fetch the full catalog (one query) and swap it in."""
+        result = supabase.table("interests").select("*").order("name").execute()
+
+        interests = decode_interests(result.data)
+        payload = json.dumps(result.data, sort_keys=True, default=str).encode()
+        newest = max((data["updated_at"] for data in result.data), default=None)
+
+        with self._lock:
+            self._interests = interests
+            self._by_id = {interest.id: interest for interest in interests}
+            self._by_name = {interest.name.lower(): interest for interest in interests}
+            self._categories = frozenset(interest.category for interest in interests if interest.category)
+            self._version = (len(interests), newest)
+            self.etag = f'"{hashlib.sha256(payload).hexdigest()[:32]}"'
+            self._json = {}
+            self._checked_at = time.monotonic()
+
+    def refresh_if_stale(self) -> None:
+        """Reload when never loaded, or when the TTL expired and the version changed."""
+        if not self.needs_refresh():
+            return
+        if self._version is None:
+            self.load()
+            return
+
+        # Cheap probe: only pull the whole list when the catalog actually changed
+        probe = supabase.table("interests").select("updated_at", count="exact").order("updated_at", desc=True).limit(1).execute()
+        newest = probe.data[0]["updated_at"] if probe.data else None
+        if (probe.count, newest) != self._version:
+            self.load()
+        else:
+            self._checked_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force a version check on the next read."""
+        self._checked_at = None
+
+    def all(self, category: Optional[str] = None) -> List[Interest]:
+        """All interests ordered by name, optionally filtered by category."""
+        self.refresh_if_stale()
+        interests = self._interests
+        if category:
+            return [interest for interest in interests if interest.category == category]
+        return list(interests)
+
+    def to_json(self, category: Optional[str] = None) -> bytes:
+        """
+        JSON body for all(category), serialized once per catalog load.
+
+        Only the full list and categories present in the catalog are cached,
+        so clients can't grow the cache by requesting arbitrary categories.
+        """
+        self.refresh_if_stale()
+        category = category or None
+        if category is not None and category not in self._categories:
+            # Nothing matches an unknown category
+            return b"[]"
+        # Bound to this load's cache, so a concurrent reload can't store a stale body in the new one
+        cache = self._json
+        body = cache.get(category)
+        if body is None:
+            body = _interest_list.dump_json(self.all(category))
+            cache[category] = body
+        return body
+
+    def get_by_ids(self, interest_ids: Iterable[UUID]) -> List[Interest]:
+        """
+        Resolve interest IDs from memory, preserving input order.
+
+        An ID missing from the catalog triggers one forced version check
+        (it may have been added since the last load); IDs still unknown
+        afterwards are skipped.
+        """
+        self.refresh_if_stale()
+        interest_ids = [UUID(str(iid)) for iid in interest_ids]
+        if not self.contains_all(interest_ids):
+            self.invalidate()
+            self.refresh_if_stale()
+
+        by_id = self._by_id
+        return [by_id[iid] for iid in dict.fromkeys(interest_ids) if iid in by_id]
+
+    def get_by_names(self, names: Iterable[str]) -> Tuple[List[Interest], List[str]]:
+        """
+        Resolve interest names (case-insensitive) from memory.
+
+        Never touches the database, so bulk callers can resolve many rows
+        after a single refresh_if_stale(). Returns the resolved interests in
+        input order (without duplicates) and the names that are unknown.
+        """
+        by_name = self._by_name
+        resolved: Dict[UUID, Interest] = {}
+        unknown = []
+        for name in names:
+            interest = by_name.get(name.strip().lower())
+            if interest is None:
+                unknown.append(name)
+            else:
+                resolved.setdefault(interest.id, interest)
+        return list(resolved.values()), unknown
+
+
+# Global catalog instance
+interest_catalog = InterestCatalog(ttl_seconds=settings.INTEREST_CATALOG_TTL_SECONDS)
@@ -0,0 +1,187 @@
+"""
+Request-scoped batching and de-duplication of row lookups.
+
+A BatchLoader collects the keys requested for one table and fetches them
+with a single `in_()` query, caching rows for the rest of the request:
+
+- Async callers (ProfileService, DiscoveryService) use `load`/`load_many`.
+  All keys requested within the same event-loop tick are combined into one
+  query, so `asyncio.gather` over several lookups costs one round trip per
+  table.
+- Sync services (running in the DB thread pool) use `load_sync`/
+  `load_many_sync`, which batch every key passed in one call and reuse rows
+  already fetched earlier in the request.
+
+The loaders live in a context variable that LoaderScopeMiddleware resets for
+every HTTP request, so cached rows never leak between requests. Outside a
+request, get_loaders() returns a fresh, unshared set.
+"""
+import asyncio
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional
+
+from services.database import supabase, execute_async
+
+# Sentinel for "fetched, no row"
+_MISSING = object()
+
+
+class BatchLoader:
+    """Loads rows of one table by one key column, batched and cached."""
+
+    def __init__(self, table: str, key_column: str, select: str = "*"):
+        """
+        Args:
+            table: Table to query
+            key_column: Unique column the keys are matched against
+            select: PostgREST select expression (may embed related tables)
+        """
+        self.table = table
+        self.key_column = key_column
+        self.select = select
+        self._cache: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._tasks: set = set()
+
+    # ----- async API -----
+
+    async def load(self, key: Any) -> Any:
+        """Load one key. Returns the row, or None if absent."""
+        key = str(key)
+        with self._lock:
+            if key in self._cache:
+                return self._result(self._cache[key])
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+
+        return self._result(await asyncio.shield(future))
+
+    async def load_many(self, keys: Iterable[Any]) -> List[Any]:
+        """Load several keys, preserving order."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        """Fetch every key queued during the last tick in one query."""
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+        if pending:
+            task = asyncio.ensure_future(self._fetch_pending(pending))
+            # Hold a reference until the fetch finishes
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_pending(self, pending: Dict[str, asyncio.Future]) -> None:
+        try:
+            result = await execute_async(self._query(list(pending)))
+            values = self._store(list(pending), result.data)
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(values[key])
+
+    # ----- sync API -----
+
+    def load_sync(self, key: Any) -> Any:
+        """Load one key from a sync service."""
+        return self.load_many_sync([key])[str(key)]
+
+    def load_many_sync(self, keys: Iterable[Any]) -> Dict[str, Any]:
+        """Load several keys with at most one query. Returns {str(key): value}."""
+        keys = [str(key) for key in keys]
+        with self._lock:
+            missing = [key for key in dict.fromkeys(keys) if key not in self._cache]
+
+        if missing:
+            result = self._query(missing).execute()
+            self._store(missing, result.data)
+
+        with self._lock:
+            return {key: self._result(self._cache[key]) for key in keys}
+
+    # ----- cache management -----
+
+    def prime(self, key: Any, value: Any) -> None:
+        """Seed the cache with a row already in hand (e.g. returned by an insert)."""
+        with self._lock:
+            self._cache[str(key)] = _MISSING if value is None else value
+
+    def clear(self, key: Any) -> None:
+        """Forget a key after it was written."""
+        with self._lock:
+            self._cache.pop(str(key), None)
+
+    # ----- helpers -----
+
+    def _query(self, keys: List[str]):
+        return supabase.table(self.table).select(self.select).in_(self.key_column, keys)
+
+    def _store(self, keys: List[str], rows: List[dict]) -> Dict[str, Any]:
+        """Group fetched rows by key and cache them (absent keys included)."""
+        grouped: Dict[str, Any] = {key: _MISSING for key in keys}
+        for row in rows:
+            grouped[str(row[self.key_column])] = row
+
+        with self._lock:
+            self._cache.update(grouped)
+        return grouped
+
+    @staticmethod
+    def _result(value: Any) -> Any:
+        return None if value is _MISSING else value
+
+
+class RequestLoaders:
+    """The set of loaders shared by every service within one request."""
+
+    def __init__(self):
+        self.user_profiles = BatchLoader("user_profiles", "id")
+        self.mentor_profiles = BatchLoader("mentor_profiles", "id", "*, mentor_interests(interest_id)")
+        self.mentor_profiles_by_user = BatchLoader("mentor_profiles", "user_id", "*, mentor_interests(interest_id)")
+        self.mentee_profiles = BatchLoader("mentee_profiles", "id", "*, mentee_interests(interest_id)")
+        self.mentee_profiles_by_user = BatchLoader("mentee_profiles", "user_id", "*, mentee_interests(interest_id)")
+
+    def forget_mentor(self, row: Optional[dict]) -> None:
+        """Drop a mentor profile from both mentor caches after a write."""
+        if row:
+            self.mentor_profiles.clear(row["id"])
+            self.mentor_profiles_by_user.clear(row["user_id"])
+
+    def forget_mentee(self, row: Optional[dict]) -> None:
+        """Drop a mentee profile from both mentee caches after a write."""
+        if row:
+            self.mentee_profiles.clear(row["id"])
+            self.mentee_profiles_by_user.clear(row["user_id"])
+
+
+_request_loaders: ContextVar[Optional[RequestLoaders]] = ContextVar("request_loaders", default=None)
+
+
+def get_loaders() -> RequestLoaders:
+    """Loaders for the current request (a fresh, unshared set outside one)."""
+    loaders = _request_loaders.get()
+    return loaders if loaders is not None else RequestLoaders()
+
+
+def begin_request_scope():
+    """Install a fresh set of loaders for the current context. Returns a reset token."""
+    return _request_loaders.set(RequestLoaders())
+
+
+def end_request_scope(token) -> None:
+    """Restore the loaders that were active before begin_request_scope."""
+    _request_loaders.reset(token)
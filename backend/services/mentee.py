@@ -4,8 +4,10 @@ from fastapi import HTTPException, status
 from datetime import datetime
 
 from services.database import supabase
+from services.decoding import decode_mentee
 from services.interest import InterestService
-from models.mentee import MenteeProfile
+from services.loaders import get_loaders
+from services.role_resolver import role_resolver
 from models.common import HelpType
 from schemas.mentee import MenteeProfileCreate, MenteeProfileUpdate, MenteeProfileResponse
 
@@ -17,36 +19,16 @@ class MenteeService:
     def get_mentee_profile(user_id: UUID) -> MenteeProfileResponse:
         """Get mentee profile by user ID."""
         try:
-            result = supabase.table("mentee_profiles").select("*").eq("user_id", str(user_id)).execute()
+            # Get mentee profile (with interest IDs embedded)
+            data = get_loaders().mentee_profiles_by_user.load_sync(user_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentee profile not found"
                 )
             
-            data = result.data[0]
-            mentee_id = UUID(data["id"])
-            
-            # Get interests
-            interests_result = supabase.table("mentee_interests").select("interest_id").eq("mentee_profile_id", str(mentee_id)).execute()
-            interest_ids = [UUID(row["interest_id"]) for row in interests_result.data]
-            interests = InterestService.get_interests_by_ids(interest_ids)
-            
-            mentee_profile = MenteeProfile(
-                id=mentee_id,
-                user_id=UUID(data["user_id"]),
-                industry=data.get("industry"),
-                goals=data.get("goals"),
-                help_needed=[HelpType(hn) for hn in data.get("help_needed", [])],
-                background=data.get("background"),
-                interests=interests,
-                profile_picture_url=data.get("profile_picture_url"),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            )
-            
-            return MenteeProfileResponse.from_model(mentee_profile)
+            return MenteeService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -60,36 +42,15 @@ class MenteeService:
     def get_mentee_profile_by_id(mentee_id: UUID) -> MenteeProfileResponse:
         """Get mentee profile by mentee profile ID."""
         try:
-            result = supabase.table("mentee_profiles").select("*").eq("id", str(mentee_id)).execute()
+            data = get_loaders().mentee_profiles.load_sync(mentee_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentee profile not found"
                 )
             
-            data = result.data[0]
-            profile_id = UUID(data["id"])
-            
-            # Get interests
-            interests_result = supabase.table("mentee_interests").select("interest_id").eq("mentee_profile_id", str(profile_id)).execute()
-            interest_ids = [UUID(row["interest_id"]) for row in interests_result.data]
-            interests = InterestService.get_interests_by_ids(interest_ids)
-            
-            mentee_profile = MenteeProfile(
-                id=profile_id,
-                user_id=UUID(data["user_id"]),
-                industry=data.get("industry"),
-                goals=data.get("goals"),
-                help_needed=[HelpType(hn) for hn in data.get("help_needed", [])],
-                background=data.get("background"),
-                interests=interests,
-                profile_picture_url=data.get("profile_picture_url"),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            )
-            
-            return MenteeProfileResponse.from_model(mentee_profile)
+            return MenteeService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -104,8 +65,8 @@ class MenteeService:
         """Create mentee profile for user."""
         try:
             # Check if profile already exists
-            existing = supabase.table("mentee_profiles").select("id").eq("user_id", str(user_id)).execute()
-            if existing.data:
+            existing = get_loaders().mentee_profiles_by_user.load_sync(user_id)
+            if existing:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Mentee profile already exists for this user"
@@ -129,15 +90,19 @@ class MenteeService:
                     detail="Failed to create mentee profile"
                 )
             
-            mentee_id = UUID(result.data[0]["id"])
+            data = result.data[0]
+            mentee_id = UUID(data["id"])
             
             # Add interests
             if profile_data.interest_ids:
                 interest_rows = [{"mentee_profile_id": str(mentee_id), "interest_id": str(iid)} for iid in profile_data.interest_ids]
                 supabase.table("mentee_interests").insert(interest_rows).execute()
             
-            # Return created profile
-            return MenteeService.get_mentee_profile_by_id(mentee_id)
+            # Return created profile from the inserted row instead of re-reading it
+            data["mentee_interests"] = [{"interest_id": str(iid)} for iid in profile_data.interest_ids]
+            MenteeService._prime(data)
+            role_resolver.invalidate(user_id)
+            return MenteeService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -152,15 +117,16 @@ class MenteeService:
         """Update mentee profile."""
         try:
             # Get existing profile
-            result = supabase.table("mentee_profiles").select("id").eq("user_id", str(user_id)).execute()
+            data = get_loaders().mentee_profiles_by_user.load_sync(user_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentee profile not found"
                 )
             
-            mentee_id = UUID(result.data[0]["id"])
+            mentee_id = UUID(data["id"])
+            interest_links = data.get("mentee_interests") or []
             
             # Build update dict
             update_dict = {}
@@ -177,20 +143,19 @@ class MenteeService:
             
             if update_dict:
                 update_dict["updated_at"] = datetime.utcnow().isoformat()
-                supabase.table("mentee_profiles").update(update_dict).eq("id", str(mentee_id)).execute()
+                updated_result = supabase.table("mentee_profiles").update(update_dict).eq("id", str(mentee_id)).execute()
+                if updated_result.data:
+                    data = updated_result.data[0]
             
-            # Update interests if provided
+            # Update interests if provided (only the added/removed links are written)
             if update_data.interest_ids is not None:
-                # Delete existing interests
-                supabase.table("mentee_interests").delete().eq("mentee_profile_id", str(mentee_id)).execute()
-                
-                # Add new interests
-                if update_data.interest_ids:
-                    interest_rows = [{"mentee_profile_id": str(mentee_id), "interest_id": str(iid)} for iid in update_data.interest_ids]
-                    supabase.table("mentee_interests").insert(interest_rows).execute()
+                InterestService.sync_profile_interests("mentee", mentee_id, interest_links, update_data.interest_ids)
+                interest_links = [{"interest_id": str(iid)} for iid in dict.fromkeys(update_data.interest_ids)]
             
-            # Return updated profile
-            return MenteeService.get_mentee_profile_by_id(mentee_id)
+            # Return updated profile from the written row instead of re-reading it
+            data = {**data, "mentee_interests": interest_links}
+            MenteeService._prime(data)
+            return MenteeService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -209,7 +174,8 @@ class MenteeService:
     ) -> List[MenteeProfileResponse]:
         """Browse all mentees."""
         try:
-            query = supabase.table("mentee_profiles").select("id")
+            # Embed interest IDs so the page hydrates without per-row queries
+            query = supabase.table("mentee_profiles").select("*, mentee_interests(interest_id)")
             
             if help_needed:
                 query = query.contains("help_needed", [help_needed.value])
@@ -217,17 +183,42 @@ class MenteeService:
             query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
             result = query.execute()
             
-            mentees = []
-            for data in result.data:
-                mentee_id = UUID(data["id"])
-                mentee = MenteeService.get_mentee_profile_by_id(mentee_id)
-                mentees.append(mentee)
-            
-            return mentees
+            return MenteeService.hydrate_profiles(result.data)
             
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error browsing mentees: {str(e)}"
             )
-
+    
+    @staticmethod
+    def hydrate_profiles(rows: List[dict]) -> List[MenteeProfileResponse]:
+        """
+        Build responses for mentee rows carrying an embedded mentee_interests(interest_id).
+        
+        Interests for all rows are resolved with a single query.
+        """
+        interest_ids = {
+            UUID(link["interest_id"])
+            for data in rows
+            for link in data.get("mentee_interests") or []
+        }
+        interests_by_id = {interest.id: interest for interest in InterestService.get_interests_by_ids(list(interest_ids))}
+        
+        mentees = []
+        for data in rows:
+            interests = [
+                interests_by_id[UUID(link["interest_id"])]
+                for link in data.get("mentee_interests") or []
+                if UUID(link["interest_id"]) in interests_by_id
+            ]
+            mentees.append(decode_mentee(data, interests))
+        
+        return mentees
+    
+    @staticmethod
+    def _prime(data: dict) -> None:
+        """Cache a freshly written mentee row for the rest of the request."""
+        loaders = get_loaders()
+        loaders.mentee_profiles.prime(data["id"], data)
+        loaders.mentee_profiles_by_user.prime(data["user_id"], data)
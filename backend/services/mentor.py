@@ -1,11 +1,14 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Set
 from fastapi import HTTPException, status
 from datetime import datetime
 
 from services.database import supabase
+from services.decoding import decode_mentor
 from services.interest import InterestService
-from models.mentor import MentorProfile
+from services.loaders import get_loaders
+from services.recommendation_index import recommendation_index
+from services.role_resolver import role_resolver
 from models.common import HelpType
 from schemas.mentor import MentorProfileCreate, MentorProfileUpdate, MentorProfileResponse
 
@@ -17,38 +20,16 @@ class MentorService:
     def get_mentor_profile(user_id: UUID) -> MentorProfileResponse:
         """Get mentor profile by user ID."""
         try:
-            # Get mentor profile
-            result = supabase.table("mentor_profiles").select("*").eq("user_id", str(user_id)).execute()
+            # Get mentor profile (with interest IDs embedded)
+            data = get_loaders().mentor_profiles_by_user.load_sync(user_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentor profile not found"
                 )
             
-            data = result.data[0]
-            mentor_id = UUID(data["id"])
-            
-            # Get interests
-            interests_result = supabase.table("mentor_interests").select("interest_id").eq("mentor_profile_id", str(mentor_id)).execute()
-            interest_ids = [UUID(row["interest_id"]) for row in interests_result.data]
-            interests = InterestService.get_interests_by_ids(interest_ids)
-            
-            mentor_profile = MentorProfile(
-                id=mentor_id,
-                user_id=UUID(data["user_id"]),
-                industry=data.get("industry"),
-                job_title=data.get("job_title"),
-                help_types_offered=[HelpType(ht) for ht in data.get("help_types_offered", [])],
-                max_requests_per_week=data["max_requests_per_week"],
-                interests=interests,
-                profile_picture_url=data.get("profile_picture_url"),
-                is_active=data.get("is_active", True),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            )
-            
-            return MentorProfileResponse.from_model(mentor_profile)
+            return MentorService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -62,37 +43,15 @@ class MentorService:
     def get_mentor_profile_by_id(mentor_id: UUID) -> MentorProfileResponse:
         """Get mentor profile by mentor profile ID."""
         try:
-            result = supabase.table("mentor_profiles").select("*").eq("id", str(mentor_id)).execute()
+            data = get_loaders().mentor_profiles.load_sync(mentor_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentor profile not found"
                 )
             
-            data = result.data[0]
-            profile_id = UUID(data["id"])
-            
-            # Get interests
-            interests_result = supabase.table("mentor_interests").select("interest_id").eq("mentor_profile_id", str(profile_id)).execute()
-            interest_ids = [UUID(row["interest_id"]) for row in interests_result.data]
-            interests = InterestService.get_interests_by_ids(interest_ids)
-            
-            mentor_profile = MentorProfile(
-                id=profile_id,
-                user_id=UUID(data["user_id"]),
-                industry=data.get("industry"),
-                job_title=data.get("job_title"),
-                help_types_offered=[HelpType(ht) for ht in data.get("help_types_offered", [])],
-                max_requests_per_week=data["max_requests_per_week"],
-                interests=interests,
-                profile_picture_url=data.get("profile_picture_url"),
-                is_active=data.get("is_active", True),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            )
-            
-            return MentorProfileResponse.from_model(mentor_profile)
+            return MentorService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -106,9 +65,11 @@ class MentorService:
     def create_mentor_profile(user_id: UUID, profile_data: MentorProfileCreate) -> MentorProfileResponse:
         """Create mentor profile for user."""
         try:
+            loaders = get_loaders()
+            
             # Check if profile already exists
-            existing = supabase.table("mentor_profiles").select("id").eq("user_id", str(user_id)).execute()
-            if existing.data:
+            existing = loaders.mentor_profiles_by_user.load_sync(user_id)
+            if existing:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Mentor profile already exists for this user"
@@ -133,15 +94,20 @@ class MentorService:
                     detail="Failed to create mentor profile"
                 )
             
-            mentor_id = UUID(result.data[0]["id"])
+            data = result.data[0]
+            mentor_id = UUID(data["id"])
             
             # Add interests
             if profile_data.interest_ids:
                 interest_rows = [{"mentor_profile_id": str(mentor_id), "interest_id": str(iid)} for iid in profile_data.interest_ids]
                 supabase.table("mentor_interests").insert(interest_rows).execute()
             
-            # Return created profile
-            return MentorService.get_mentor_profile_by_id(mentor_id)
+            # Return created profile from the inserted row instead of re-reading it
+            data["mentor_interests"] = [{"interest_id": str(iid)} for iid in profile_data.interest_ids]
+            MentorService._prime(data)
+            recommendation_index.upsert(data)
+            role_resolver.invalidate(user_id)
+            return MentorService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -156,15 +122,16 @@ class MentorService:
         """Update mentor profile."""
         try:
             # Get existing profile
-            result = supabase.table("mentor_profiles").select("id").eq("user_id", str(user_id)).execute()
+            data = get_loaders().mentor_profiles_by_user.load_sync(user_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentor profile not found"
                 )
             
-            mentor_id = UUID(result.data[0]["id"])
+            mentor_id = UUID(data["id"])
+            interest_links = data.get("mentor_interests") or []
             
             # Build update dict
             update_dict = {}
@@ -183,20 +150,20 @@ class MentorService:
             
             if update_dict:
                 update_dict["updated_at"] = datetime.utcnow().isoformat()
-                supabase.table("mentor_profiles").update(update_dict).eq("id", str(mentor_id)).execute()
+                updated_result = supabase.table("mentor_profiles").update(update_dict).eq("id", str(mentor_id)).execute()
+                if updated_result.data:
+                    data = updated_result.data[0]
             
-            # Update interests if provided
+            # Update interests if provided (only the added/removed links are written)
             if update_data.interest_ids is not None:
-                # Delete existing interests
-                supabase.table("mentor_interests").delete().eq("mentor_profile_id", str(mentor_id)).execute()
-                
-                # Add new interests
-                if update_data.interest_ids:
-                    interest_rows = [{"mentor_profile_id": str(mentor_id), "interest_id": str(iid)} for iid in update_data.interest_ids]
-                    supabase.table("mentor_interests").insert(interest_rows).execute()
+                InterestService.sync_profile_interests("mentor", mentor_id, interest_links, update_data.interest_ids)
+                interest_links = [{"interest_id": str(iid)} for iid in dict.fromkeys(update_data.interest_ids)]
             
-            # Return updated profile
-            return MentorService.get_mentor_profile_by_id(mentor_id)
+            # Return updated profile from the written row instead of re-reading it
+            data = {**data, "mentor_interests": interest_links}
+            MentorService._prime(data)
+            recommendation_index.upsert(data)
+            return MentorService.hydrate_profiles([data])[0]
             
         except HTTPException:
             raise
@@ -216,17 +183,10 @@ class MentorService:
     ) -> List[MentorProfileResponse]:
         """Browse active mentors, excluding those with existing connections/requests."""
         try:
-            # Get user_ids of mentors that user already has pending/accepted requests with
-            # Note: mentor_id in requests/connections tables is already a user_id
-            requests_result = supabase.table("mentorship_requests").select("mentor_id").eq("mentee_id", str(user_id)).in_("status", ["pending", "accepted"]).execute()
-            excluded_user_ids = {UUID(row["mentor_id"]) for row in requests_result.data}
+            excluded_user_ids = MentorService.excluded_mentor_user_ids(user_id)
             
-            # Also check connections
-            connections_result = supabase.table("connections").select("mentor_id").eq("mentee_id", str(user_id)).execute()
-            excluded_user_ids.update({UUID(row["mentor_id"]) for row in connections_result.data})
-            
-            # Build query for active mentors
-            query = supabase.table("mentor_profiles").select("id").eq("is_active", True)
+            # Build query for active mentors, embedding interest IDs from the junction table
+            query = supabase.table("mentor_profiles").select("*, mentor_interests(interest_id)").eq("is_active", True)
             
             if help_type:
                 query = query.contains("help_types_offered", [help_type.value])
@@ -241,17 +201,55 @@ class MentorService:
             query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
             result = query.execute()
             
-            mentors = []
-            for data in result.data:
-                mentor_id = UUID(data["id"])
-                mentor = MentorService.get_mentor_profile_by_id(mentor_id)
-                mentors.append(mentor)
-            
-            return mentors
+            return MentorService.hydrate_profiles(result.data)
             
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error browsing mentors: {str(e)}"
             )
-
+    
+    @staticmethod
+    def excluded_mentor_user_ids(user_id: UUID) -> Set[UUID]:
+        """User IDs of mentors the mentee already has a pending/accepted request or connection with."""
+        # Note: mentor_id in requests/connections tables is already a user_id
+        requests_result = supabase.table("mentorship_requests").select("mentor_id").eq("mentee_id", str(user_id)).in_("status", ["pending", "accepted"]).execute()
+        excluded_user_ids = {UUID(row["mentor_id"]) for row in requests_result.data}
+        
+        # Also check connections
+        connections_result = supabase.table("connections").select("mentor_id").eq("mentee_id", str(user_id)).execute()
+        excluded_user_ids.update({UUID(row["mentor_id"]) for row in connections_result.data})
+        return excluded_user_ids
+    
+    @staticmethod
+    def hydrate_profiles(rows: List[dict]) -> List[MentorProfileResponse]:
+        """
+        Build responses for mentor rows carrying an embedded mentor_interests(interest_id).
+        
+        Interests for the whole page are resolved with a single query, so
+        hydration costs one round trip regardless of page size.
+        """
+        interest_ids = {
+            UUID(link["interest_id"])
+            for data in rows
+            for link in data.get("mentor_interests") or []
+        }
+        interests_by_id = {interest.id: interest for interest in InterestService.get_interests_by_ids(list(interest_ids))}
+        
+        mentors = []
+        for data in rows:
+            interests = [
+                interests_by_id[UUID(link["interest_id"])]
+                for link in data.get("mentor_interests") or []
+                if UUID(link["interest_id"]) in interests_by_id
+            ]
+            mentors.append(decode_mentor(data, interests))
+        
+        return mentors
+    
+    @staticmethod
+    def _prime(data: dict) -> None:
+        """Cache a freshly written mentor row for the rest of the request."""
+        loaders = get_loaders()
+        loaders.mentor_profiles.prime(data["id"], data)
+        loaders.mentor_profiles_by_user.prime(data["user_id"], data)
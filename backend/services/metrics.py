@@ -0,0 +1,279 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+A deliberately small subset of the Prometheus client model, so the API
+does not need another dependency:
+
+- Counter and Histogram are updated on the request path. An update is a
+  dict lookup and a few additions under a lock (histograms use bisect
+  over the bucket bounds).
+- Gauges that mirror state owned elsewhere (cache sizes, pool usage) are
+  callback metrics, read only when /metrics is scraped.
+
+Metric names and labels follow the Prometheus conventions. Label values
+must have bounded cardinality, so route labels are path templates,
+never raw paths.
+"""
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latency buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+Samples = Union[float, Dict[LabelValues, float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, set directly on the request path."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._bounds = tuple(_format_value(bound) for bound in self.buckets + (float("inf"),))
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self._series: Dict[LabelValues, list] = {}
+        # labels -> sample name prefixes, formatted once per series
+        self._prefixes: Dict[LabelValues, Tuple[List[str], str, str]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def _series_prefixes(self, labels: LabelValues) -> Tuple[List[str], str, str]:
+        prefixes = self._prefixes.get(labels)
+        if prefixes is None:
+            bucket_names = self.labelnames + ("le",)
+            label_text = _format_labels(self.labelnames, labels)
+            prefixes = self._prefixes[labels] = (
+                [f"{self.name}_bucket{_format_labels(bucket_names, labels + (bound,))} " for bound in self._bounds],
+                f"{self.name}_sum{label_text} ",
+                f"{self.name}_count{label_text} ",
+            )
+        return prefixes
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        lines = self.header()
+        for labels, counts, total in series:
+            bucket_prefixes, sum_prefix, count_prefix = self._series_prefixes(labels)
+            cumulative = 0
+            for prefix, count in zip(bucket_prefixes, counts):
+                cumulative += count
+                lines.append(f"{prefix}{cumulative}")
+            lines.append(f"{sum_prefix}{_format_value(total)}")
+            lines.append(f"{count_prefix}{cumulative}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """Counter or gauge whose samples are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Samples],
+        labelnames: Tuple[str, ...] = (),
+        type_name: str = "gauge"
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type_name = type_name
+        self._collect = collect
+
+    def render(self) -> List[str]:
+        samples = self._collect()
+        if not isinstance(samples, dict):
+            samples = {(): samples}
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in samples.items()
+        ]
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together at /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Samples],
+        labelnames: Tuple[str, ...] = (),
+        type_name: str = "gauge"
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, collect, labelnames, type_name))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text format (0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                # A failing collector must not take the whole scrape down
+                continue
+        return "\n".join(lines) + "\n"
+
+
+# Global registry instance
+registry = MetricsRegistry()
+
+# ----- request path metrics (updated by middleware.metrics and friends) -----
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status.",
+    ("method", "route", "status")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served."
+)
+auth_validations = registry.counter(
+    "auth_validations_total",
+    "Access token validations by verification path (local, remote) and result (ok, rejected).",
+    ("path", "result")
+)
+db_queries = registry.counter(
+    "db_queries_total",
+    "Supabase (PostgREST) round trips made while serving HTTP requests, by table.",
+    ("table",)
+)
+db_query_seconds = registry.counter(
+    "db_query_seconds_total",
+    "Time spent in Supabase round trips made while serving HTTP requests, by table.",
+    ("table",)
+)
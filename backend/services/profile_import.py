@@ -0,0 +1,268 @@
+"""
+Streaming bulk import of mentor and mentee profiles (admin only).
+
+Onboarding a partner organization's roster through the profile endpoints
+costs an existence check, a profile insert, an interest insert and a
+re-read per person. ProfileImporter instead reads a CSV or NDJSON upload
+as it arrives and, for every PROFILE_IMPORT_CHUNK_SIZE valid rows, makes
+two round trips:
+
+1. one read of user_profiles to reject unknown users,
+2. one import_*_profiles RPC (database/import_profiles.sql) inserting the
+   profiles (ON CONFLICT (user_id) DO NOTHING, so users that already have
+   a profile are reported instead of failing the chunk) and their interest
+   links in one transaction.
+
+A chunk is therefore imported completely or not at all: when the RPC
+fails, its rows are reported as failed and none of them was created, so
+they can be uploaded again. Interest names are resolved against the
+in-memory interest catalog. Rows that cannot be imported are reported
+with their line number and do not stop the import; chunks are not
+transactional with each other. Duplicate user IDs are caught within a
+chunk; a user repeated in a later chunk is reported as already having a
+profile.
+
+CSV uploads need a header row naming the fields of MentorImportRow /
+MenteeImportRow. List cells (help types, interests) are ';'-separated and
+empty cells fall back to the field default. NDJSON lines are JSON objects
+with the same fields.
+"""
+import codecs
+import csv
+import json
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from services.database import supabase, run_in_db_pool
+from services.interest_catalog import interest_catalog
+from services.recommendation_index import recommendation_index
+from services.role_resolver import role_resolver
+from schemas.profile_import import (
+    MentorImportRow,
+    MenteeImportRow,
+    ProfileImportError,
+    ProfileImportResult
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows listed in ProfileImportResult.errors (failed is always the full count)
+MAX_REPORTED_ERRORS = 1000
+
+
+class _ImportTarget:
+    """Tables and row model for one kind of profile."""
+
+    def __init__(self, label: str, row_model: Type[BaseModel], table: str, link_table: str):
+        self.label = label
+        self.row_model = row_model
+        self.table = table
+        # Embedded relation name on created rows (the shape the recommendation index reads)
+        self.link_table = link_table
+
+
+TARGETS = {
+    "mentors": _ImportTarget("Mentor", MentorImportRow, "mentor_profiles", "mentor_interests"),
+    "mentees": _ImportTarget("Mentee", MenteeImportRow, "mentee_profiles", "mentee_interests"),
+}
+
+
+class ProfileImporter:
+    """One bulk import run: parses, validates and inserts profiles chunk by chunk."""
+
+    def __init__(self, kind: str, import_format: str, chunk_size: int):
+        self.kind = kind
+        self.format = import_format
+        self.chunk_size = chunk_size
+        self.target = TARGETS[kind]
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[ProfileImportError] = []
+        # User IDs in the chunk being collected (earlier chunks are checked by the database)
+        self._chunk_user_ids: set = set()
+
+    async def run(self, body: AsyncIterator[bytes]) -> ProfileImportResult:
+        """Consume the upload stream and return the import summary."""
+        started = time.perf_counter()
+        # Resolve every row's interest names against one catalog version
+        await run_in_db_pool(interest_catalog.refresh_if_stale)
+
+        records = self._csv_records(body) if self.format == "csv" else self._ndjson_records(body)
+        chunk: List[Tuple[int, dict, List[dict]]] = []
+        async for line, record in records:
+            self.rows += 1
+            prepared = self._prepare(line, record)
+            if prepared is not None:
+                chunk.append(prepared)
+            if len(chunk) >= self.chunk_size:
+                await run_in_db_pool(self._insert_chunk, chunk)
+                chunk = []
+                self._chunk_user_ids.clear()
+        if chunk:
+            await run_in_db_pool(self._insert_chunk, chunk)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Imported %d/%d %s in %.2fs (%d failed)",
+            self.imported, self.rows, self.kind, elapsed, self.failed
+        )
+        return ProfileImportResult(
+            kind=self.kind,
+            format=self.format,
+            rows=self.rows,
+            imported=self.imported,
+            failed=self.failed,
+            errors=sorted(self.errors, key=lambda error: error.line),
+            errors_truncated=self.failed > len(self.errors),
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(self.rows / elapsed, 1) if elapsed > 0 else 0.0
+        )
+
+    # ----- parsing -----
+
+    @staticmethod
+    async def _lines(body: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+        """Decode the byte stream into (line number, line) pairs without buffering the upload."""
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        pending = ""
+        line_number = 0
+        async for data in body:
+            pending += decoder.decode(data)
+            *complete, pending = pending.split("\n")
+            for text in complete:
+                line_number += 1
+                yield line_number, text.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield line_number + 1, pending.rstrip("\r")
+
+    async def _ndjson_records(self, body: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+        async for line_number, text in self._lines(body):
+            if not text.strip():
+                continue
+            try:
+                yield line_number, json.loads(text)
+            except ValueError as e:
+                yield line_number, ValueError(f"Invalid JSON: {e}")
+
+    async def _csv_records(self, body: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+        header: Optional[List[str]] = None
+        record, start = "", 0
+        async for line_number, text in self._lines(body):
+            if not record:
+                if not text.strip():
+                    continue
+                start = line_number
+                record = text
+            else:
+                record += "\n" + text
+            # An odd number of quotes means a quoted field continues on the next line
+            if record.count('"') % 2:
+                continue
+
+            values = next(csv.reader([record]))
+            record = ""
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            if len(values) > len(header):
+                yield start, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+                continue
+            yield start, {name: value for name, value in zip(header, values) if value.strip()}
+
+        if record:
+            yield start, ValueError("Unterminated quoted field")
+
+    # ----- validation -----
+
+    def _prepare(self, line: int, record: object) -> Optional[Tuple[int, dict, List[dict]]]:
+        """Validate one record; returns (line, profile row, interests) or records an error."""
+        if isinstance(record, Exception):
+            self._fail(line, None, str(record))
+            return None
+        if not isinstance(record, dict):
+            self._fail(line, None, "Expected a JSON object")
+            return None
+
+        try:
+            row = self.target.row_model.model_validate(record)
+        except ValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            )
+            self._fail(line, record.get("user_id"), detail)
+            return None
+
+        user_id = str(row.user_id)
+        if user_id in self._chunk_user_ids:
+            self._fail(line, user_id, "Duplicate user_id in upload")
+            return None
+        self._chunk_user_ids.add(user_id)
+
+        interests, unknown = interest_catalog.get_by_names(row.interests)
+        if unknown:
+            self._fail(line, user_id, f"Unknown interests: {', '.join(unknown)}")
+            return None
+
+        profile = row.model_dump(mode="json", exclude={"interests"})
+        return line, profile, [{"interest_id": str(interest.id)} for interest in interests]
+
+    def _fail(self, line: int, user_id: Optional[object], detail: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ProfileImportError(
+                line=line,
+                user_id=str(user_id) if user_id is not None else None,
+                detail=detail
+            ))
+
+    # ----- writes -----
+
+    def _insert_chunk(self, chunk: List[Tuple[int, dict, List[dict]]]) -> None:
+        """Insert one chunk of validated rows (runs in the DB thread pool)."""
+        target = self.target
+        # Rows not yet reported as failed; all of them fail if a round trip errors
+        remaining = chunk
+        try:
+            user_ids = [profile["user_id"] for _, profile, _ in chunk]
+            known = supabase.table("user_profiles").select("id").in_("id", user_ids).execute()
+            known_ids = {row["id"] for row in known.data}
+
+            remaining = []
+            for line, profile, links in chunk:
+                if profile["user_id"] in known_ids:
+                    remaining.append((line, profile, links))
+                else:
+                    self._fail(line, profile["user_id"], "User not found")
+            if not remaining:
+                return
+
+            # Profiles and interest links in one transaction: a failure creates nothing
+            result = supabase.rpc(f"import_{target.table}", {
+                "p_profiles": [
+                    {**profile, "interest_ids": [link["interest_id"] for link in links]}
+                    for _, profile, links in remaining
+                ]
+            }).execute()
+        except Exception as e:
+            for line, profile, _ in remaining:
+                self._fail(line, profile["user_id"], f"Chunk insert failed: {str(e)}")
+            return
+
+        created: Dict[str, dict] = {row["user_id"]: row for row in result.data}
+        for line, profile, links in remaining:
+            data = created.get(profile["user_id"])
+            if data is None:
+                self._fail(line, profile["user_id"], f"{target.label} profile already exists for this user")
+                continue
+            data[target.link_table] = links
+
+        for data in created.values():
+            if target.table == "mentor_profiles":
+                recommendation_index.upsert(data)
+            role_resolver.invalidate(data["user_id"])
+        self.imported += len(created)
@@ -4,11 +4,13 @@ Profile service for fetching mentor and mentee profiles.
 This service provides utilities for retrieving user profiles with their interests,
 which are used by both the matching and request services.
 """
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 
-from services.database import supabase
+from services.database import run_in_db_pool
+from services.interest_catalog import interest_catalog
+from services.loaders import get_loaders
 from models.mentor import MentorProfile
 from models.mentee import MenteeProfile
 from models.user import UserProfile
@@ -23,86 +25,48 @@ class ProfileService:
         """
         Fetch mentee profile with interests joined.
 
+        Lookups go through the request's batch loaders, so profiles and
+        interests requested concurrently are fetched with one query per table.
+
         Args:
             user_id: UUID of the user
 
         Returns:
             MenteeProfile or None if not found
         """
-        try:
-            # Query mentee profile with interests
-            result = supabase.table('mentee_profiles')\
-                .select('*, mentee_interests(interest:interests(*))')\
-                .eq('user_id', str(user_id))\
-                .single()\
-                .execute()
-
-            if not result.data:
-                return None
-
-            # Transform nested interests structure
-            data = result.data
-            interest_relations = data.get('mentee_interests', [])
-            interests = [
-                Interest(**item['interest'])
-                for item in interest_relations
-                if item.get('interest')
-            ]
-
-            # Remove the nested field and add flattened interests
-            profile_data = {k: v for k, v in data.items() if k != 'mentee_interests'}
-            profile_data['interests'] = interests
-
-            return MenteeProfile(**profile_data)
-
-        except Exception as e:
-            # If record not found, return None
-            if 'PGRST116' in str(e) or 'not found' in str(e).lower():
-                return None
-            raise
+        data = await get_loaders().mentee_profiles_by_user.load(user_id)
+        if not data:
+            return None
+
+        # Remove the nested junction rows and add resolved interests
+        profile_data = {k: v for k, v in data.items() if k != 'mentee_interests'}
+        profile_data['interests'] = await ProfileService._load_interests(data.get('mentee_interests'))
+
+        return MenteeProfile(**profile_data)
 
     @staticmethod
     async def get_mentor_profile(user_id: UUID) -> Optional[MentorProfile]:
         """
         Fetch mentor profile with interests joined.
 
+        Lookups go through the request's batch loaders, so profiles and
+        interests requested concurrently are fetched with one query per table.
+
         Args:
             user_id: UUID of the user
 
         Returns:
             MentorProfile or None if not found
         """
-        try:
-            # Query mentor profile with interests
-            result = supabase.table('mentor_profiles')\
-                .select('*, mentor_interests(interest:interests(*))')\
-                .eq('user_id', str(user_id))\
-                .single()\
-                .execute()
-
-            if not result.data:
-                return None
-
-            # Transform nested interests structure
-            data = result.data
-            interest_relations = data.get('mentor_interests', [])
-            interests = [
-                Interest(**item['interest'])
-                for item in interest_relations
-                if item.get('interest')
-            ]
-
-            # Remove the nested field and add flattened interests
-            profile_data = {k: v for k, v in data.items() if k != 'mentor_interests'}
-            profile_data['interests'] = interests
-
-            return MentorProfile(**profile_data)
-
-        except Exception as e:
-            # If record not found, return None
-            if 'PGRST116' in str(e) or 'not found' in str(e).lower():
-                return None
-            raise
+        data = await get_loaders().mentor_profiles_by_user.load(user_id)
+        if not data:
+            return None
+
+        # Remove the nested junction rows and add resolved interests
+        profile_data = {k: v for k, v in data.items() if k != 'mentor_interests'}
+        profile_data['interests'] = await ProfileService._load_interests(data.get('mentor_interests'))
+
+        return MentorProfile(**profile_data)
 
     @staticmethod
     async def get_user_profile(user_id: UUID) -> Optional[UserProfile]:
@@ -115,23 +79,22 @@ class ProfileService:
         Returns:
             UserProfile or None if not found
         """
-        try:
-            result = supabase.table('user_profiles')\
-                .select('*')\
-                .eq('id', str(user_id))\
-                .single()\
-                .execute()
-
-            if not result.data:
-                return None
-
-            return UserProfile(**result.data)
-
-        except Exception as e:
-            # If record not found, return None
-            if 'PGRST116' in str(e) or 'not found' in str(e).lower():
-                return None
-            raise
+        data = await get_loaders().user_profiles.load(user_id)
+        if not data:
+            return None
+
+        return UserProfile(**data)
+
+    @staticmethod
+    async def _load_interests(interest_links: Optional[List[dict]]) -> List[Interest]:
+        """Resolve embedded {interest_id} junction rows from the interest catalog."""
+        interest_ids = [link['interest_id'] for link in interest_links or []]
+        if not interest_ids:
+            return []
+        if interest_catalog.needs_refresh() or not interest_catalog.contains_all(interest_ids):
+            # Only a stale catalog or an unknown ID touches the database; keep that off the event loop
+            return await run_in_db_pool(interest_catalog.get_by_ids, interest_ids)
+        return interest_catalog.get_by_ids(interest_ids)
 
     @staticmethod
     async def verify_user_role(user_id: UUID, required_role: str) -> None:
@@ -0,0 +1,135 @@
+"""
+Request profilers used by ProfilingMiddleware.
+
+Two profilers are available:
+
+- "sample": a background thread snapshots the stacks of the event loop
+  thread and the DB thread pool workers every PROFILING_INTERVAL_MS. It
+  writes them in the folded format ("frame;frame;frame count") that
+  flamegraph.pl, inferno and speedscope read. Overhead does not depend on
+  how many calls the request makes, and time spent in sync service
+  methods running in the DB thread pool is included.
+- "cprofile": deterministic cProfile of the event loop thread, written as
+  a pstats file (snakeviz, `python -m pstats`). It counts every call, so
+  it is slower, and it does not see the DB thread pool.
+
+Both record whatever else the process is doing while the request runs,
+so profile on a worker that is not serving other traffic where possible.
+Only one profile runs at a time per process.
+"""
+import cProfile
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+PROFILE_MODES = ("sample", "cprofile")
+
+# DB thread pool threads (services.database.run_in_db_pool runs on anyio's workers)
+_WORKER_THREAD_PREFIX = "AnyIO worker thread"
+
+# Serializes profiles: cProfile allows one active profiler per interpreter
+_active = threading.Lock()
+
+
+def _fold(frame, root: str) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    names.append(root)
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Periodically samples the stacks of the loop thread and the DB pool workers."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.samples: Counter = Counter()
+        self._loop_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                if ident == self._loop_thread:
+                    root = "event-loop"
+                elif names.get(ident, "").startswith(_WORKER_THREAD_PREFIX):
+                    root = "db-pool"
+                else:
+                    continue
+                self.samples[_fold(frame, root)] += 1
+
+    def write(self, path: Path) -> None:
+        """Write the samples in folded-stack format."""
+        with open(path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RequestProfile:
+    """
+    One profiling session; start() on the event loop thread, stop() when the request ends.
+
+    start() returns False when another profile is already running.
+    """
+
+    def __init__(self, mode: str, interval_seconds: float):
+        self.mode = mode
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._sampler = StackSampler(interval_seconds) if mode == "sample" else None
+        self._profiler = cProfile.Profile() if mode == "cprofile" else None
+
+    @property
+    def suffix(self) -> str:
+        return ".folded" if self.mode == "sample" else ".prof"
+
+    def start(self) -> bool:
+        if not _active.acquire(blocking=False):
+            return False
+        self.started_at = time.perf_counter()
+        try:
+            if self._sampler is not None:
+                self._sampler.start()
+            else:
+                self._profiler.enable()
+        except Exception:
+            _active.release()
+            raise
+        return True
+
+    def stop(self) -> None:
+        try:
+            if self._sampler is not None:
+                self._sampler.stop()
+            else:
+                self._profiler.disable()
+        finally:
+            self.duration = time.perf_counter() - self.started_at
+            _active.release()
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._sampler is not None:
+            self._sampler.write(path)
+        else:
+            self._profiler.dump_stats(str(path))
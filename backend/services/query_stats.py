@@ -0,0 +1,148 @@
+"""
+Per-request accounting of Supabase (PostgREST) round trips.
+
+The shared supabase client in services.database sends every query through
+QueryStatsTransport, which records the table and wall time of each
+/rest/v1 request into the QueryStats of the current HTTP request.
+QueryStatsMiddleware opens a QueryStats per request and reports it in the
+Server-Timing header and the request log, so N+1 patterns show up as a
+query count instead of only as latency.
+
+The stats object lives in a context variable. run_in_db_pool copies the
+context into its worker threads, so queries made from the DB thread pool
+(including concurrent ones) are recorded against the request that issued
+them. Queries made outside a request (startup, background tasks) are not
+recorded.
+"""
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Callable, Dict, Iterator, Optional
+
+import httpx
+
+_REST_PREFIX = "/rest/v1/"
+
+
+class QueryStats:
+    """Query count and cumulative time for one HTTP request, by table."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.seconds = 0.0
+        self.by_table: Dict[str, Dict[str, float]] = {}
+
+    def record(self, table: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            entry = self.by_table.get(table)
+            if entry is None:
+                entry = self.by_table[table] = {"count": 0, "seconds": 0.0}
+            entry["count"] += 1
+            entry["seconds"] += seconds
+
+    def server_timing(self, per_table: bool = True) -> str:
+        """Server-Timing header value: total DB time, then one metric per table."""
+        metrics = [_timing_metric("db", self.count, self.seconds)]
+        if per_table:
+            for table, entry in sorted(self.by_table.items(), key=lambda item: -item[1]["seconds"]):
+                metrics.append(_timing_metric(f"db.{table}", entry["count"], entry["seconds"]))
+        return ", ".join(metrics)
+
+    def summary(self) -> Dict[str, object]:
+        """JSON-friendly totals for structured logging."""
+        return {
+            "db_queries": self.count,
+            "db_ms": round(self.seconds * 1000, 2),
+            "tables": {
+                table: {"queries": entry["count"], "ms": round(entry["seconds"] * 1000, 2)}
+                for table, entry in self.by_table.items()
+            },
+        }
+
+
+def _timing_metric(name: str, count: int, seconds: float) -> str:
+    plural = "query" if count == 1 else "queries"
+    return f'{name};dur={seconds * 1000:.1f};desc="{count} {plural}"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def begin_query_stats() -> Token:
+    """Start recording queries for the current request."""
+    return _current_stats.set(QueryStats())
+
+
+def end_query_stats(token: Token) -> None:
+    _current_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def table_for_path(path: str) -> Optional[str]:
+    """PostgREST table (or rpc/<function>) addressed by a request path; None for non-REST paths."""
+    index = path.find(_REST_PREFIX)
+    if index < 0:
+        return None
+    return path[index + len(_REST_PREFIX):].strip("/") or None
+
+
+class _TimedStream(httpx.SyncByteStream):
+    """Response body wrapper that reports once the body has been read and closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]):
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class QueryStatsTransport(httpx.BaseTransport):
+    """
+    Wraps the transport of the supabase client's httpx.Client.
+
+    A query is timed from sending the request until its response body has
+    been read, and is recorded only while a request's QueryStats is active.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        stats = _current_stats.get()
+        table = table_for_path(request.url.path) if stats is not None else None
+        if table is None:
+            return self._transport.handle_request(request)
+
+        started = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            stats.record(table, time.perf_counter() - started)
+            raise
+        if response.is_closed:
+            # Body already in memory (e.g. a mock transport)
+            stats.record(table, time.perf_counter() - started)
+        else:
+            response.stream = _TimedStream(
+                response.stream,
+                lambda: stats.record(table, time.perf_counter() - started)
+            )
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
@@ -1,9 +1,14 @@
+import heapq
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Set
 from fastapi import HTTPException, status
 
 from services.database import supabase
+from services.decoding import parse_timestamp
+from services.loaders import get_loaders
 from services.mentor import MentorService
+from services.recommendation_index import recommendation_index
+from services.role_resolver import role_resolver
 from models.common import HelpType
 from schemas.mentor import MentorProfileResponse
 
@@ -22,40 +27,27 @@ class RecommendationService:
         Get recommended mentors for "For You" feed (mentees only).
         
         Returns personalized mentor recommendations based on mentee's profile,
-        interests, and help needed. Uses simple interest matching algorithm.
+        interests, and help needed. Every eligible mentor is ranked by shared
+        interests, then newest first; the in-memory recommendation index is
+        used when ready, with a database-backed ranking as fallback.
         """
         try:
-            # Verify user is a mentee
-            mentee_profile = supabase.table("mentee_profiles").select("id, user_id").eq("user_id", str(user_id)).execute()
-            if not mentee_profile.data:
+            # Verify user is a mentee (cached), then load the profile row with its interest IDs
+            is_mentee = role_resolver.resolve(user_id).is_mentee
+            mentee_profile = get_loaders().mentee_profiles_by_user.load_sync(user_id) if is_mentee else None
+            if not mentee_profile:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Only mentees can get mentor recommendations"
                 )
             
-            mentee_id = mentee_profile.data[0]["id"]
-            
             # Get mentee's interests
-            mentee_interests_result = supabase.table("mentee_interests").select("interest_id").eq("mentee_profile_id", str(mentee_id)).execute()
-            mentee_interest_ids = {UUID(row["interest_id"]) for row in mentee_interests_result.data}
-            
-            # Get mentors using browse_mentors (excludes existing connections/requests)
-            mentors = MentorService.browse_mentors(user_id, help_type, None, limit * 2, offset)  # Get more to filter by interests
-            
-            # Score mentors by shared interests
-            scored_mentors = []
-            for mentor in mentors:
-                mentor_interest_ids = {interest.id for interest in mentor.interests}
-                shared_count = len(mentee_interest_ids & mentor_interest_ids)
-                scored_mentors.append((shared_count, mentor))
-            
-            # Sort by shared interest count (descending), then by created_at
-            scored_mentors.sort(key=lambda x: (x[0], x[1].created_at), reverse=True)
+            mentee_interest_ids = {UUID(row["interest_id"]) for row in mentee_profile.get("mentee_interests") or []}
             
-            # Return top mentors up to limit
-            recommended = [mentor for _, mentor in scored_mentors[:limit]]
+            if recommendation_index.is_ready:
+                return RecommendationService._rank_with_index(user_id, mentee_interest_ids, help_type, limit, offset)
             
-            return recommended
+            return RecommendationService._rank_from_database(user_id, mentee_interest_ids, help_type, limit, offset)
             
         except HTTPException:
             raise
@@ -64,4 +56,114 @@ class RecommendationService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error getting recommended mentors: {str(e)}"
             )
-
+    
+    @staticmethod
+    def _rank_with_index(
+        user_id: UUID,
+        mentee_interest_ids: Set[UUID],
+        help_type: Optional[HelpType],
+        limit: int,
+        offset: int
+    ) -> List[MentorProfileResponse]:
+        """
+        Rank all eligible mentors in memory, then fetch only the page's profiles.
+        
+        The index may lag writes from other workers, so the fresh rows are
+        trusted: mentors deleted or deactivated since the index saw them are
+        dropped and the page is filled from the next ranked mentors (one more
+        query per refill, only when something was dropped).
+        """
+        excluded_user_ids = [str(uid) for uid in MentorService.excluded_mentor_user_ids(user_id)]
+        interest_ids = [str(iid) for iid in mentee_interest_ids]
+        
+        page = []
+        index_offset = offset
+        while len(page) < limit:
+            wanted = limit - len(page)
+            mentor_ids = recommendation_index.top_k(interest_ids, help_type, excluded_user_ids, wanted, index_offset)
+            if not mentor_ids:
+                break
+        
+            rows = get_loaders().mentor_profiles.load_many_sync(mentor_ids)
+            page += [rows[mid] for mid in mentor_ids if rows[mid] and rows[mid].get("is_active", True)]
+            if len(mentor_ids) < wanted:
+                break
+            index_offset += len(mentor_ids)
+        
+        if not page:
+            return []
+        return MentorService.hydrate_profiles(page)
+    
+    @staticmethod
+    def _rank_from_database(
+        user_id: UUID,
+        mentee_interest_ids: Set[UUID],
+        help_type: Optional[HelpType],
+        limit: int,
+        offset: int
+    ) -> List[MentorProfileResponse]:
+        """
+        Global top-k ranking without the in-memory index.
+        
+        Candidates are the mentors sharing at least one interest with the
+        mentee, fetched through the mentor_interests.interest_id index with
+        only the matching links embedded (so the embed size is the score).
+        A bounded heap keeps the best offset + limit of them, ordered by
+        (shared interests, created_at, id) so pages never overlap or skip.
+        Once the matching candidates are exhausted the feed continues with
+        the remaining mentors, newest first.
+        """
+        excluded_user_ids = MentorService.excluded_mentor_user_ids(user_id)
+        window = offset + limit
+        
+        candidates = []
+        if mentee_interest_ids:
+            query = (
+                supabase.table("mentor_profiles")
+                .select("id, created_at, mentor_interests!inner(interest_id)")
+                .in_("mentor_interests.interest_id", [str(iid) for iid in mentee_interest_ids])
+                .eq("is_active", True)
+            )
+            if help_type:
+                query = query.contains("help_types_offered", [help_type.value])
+            if excluded_user_ids:
+                query = query.not_.in_("user_id", [str(uid) for uid in excluded_user_ids])
+            candidates = query.execute().data
+        
+        top = heapq.nlargest(
+            window,
+            candidates,
+            key=lambda row: (
+                len(row["mentor_interests"]),
+                parse_timestamp(row["created_at"]),
+                row["id"]
+            )
+        )
+        page_ids = [row["id"] for row in top[offset:window]]
+        
+        # Past the last matching candidate: mentors with no shared interests, newest first
+        if len(page_ids) < limit:
+            fill_offset = max(0, offset - len(candidates))
+            query = supabase.table("mentor_profiles").select("id").eq("is_active", True)
+            if mentee_interest_ids:
+                # Anti-join: keep mentors whose filtered mentor_interests embed is empty
+                query = (
+                    supabase.table("mentor_profiles")
+                    .select("id, mentor_interests(interest_id)")
+                    .in_("mentor_interests.interest_id", [str(iid) for iid in mentee_interest_ids])
+                    .is_("mentor_interests", "null")
+                    .eq("is_active", True)
+                )
+            if help_type:
+                query = query.contains("help_types_offered", [help_type.value])
+            if excluded_user_ids:
+                query = query.not_.in_("user_id", [str(uid) for uid in excluded_user_ids])
+            fill_limit = limit - len(page_ids)
+            query = query.order("created_at", desc=True).order("id", desc=True).range(fill_offset, fill_offset + fill_limit - 1)
+            page_ids += [row["id"] for row in query.execute().data]
+        
+        if not page_ids:
+            return []
+        
+        rows = get_loaders().mentor_profiles.load_many_sync(page_ids)
+        return MentorService.hydrate_profiles([rows[mid] for mid in page_ids if rows[mid]])
@@ -0,0 +1,266 @@
+"""
+In-memory mentor x interest index for the "For You" feed.
+
+Every mentor profile occupies one row ("slot") of a set of NumPy arrays:
+
+- a bitset of the mentor's interests (one bit per interest, packed into
+  uint64 words),
+- a help-type bitmask (one bit per HelpType),
+- the is_active flag and created_at timestamp.
+
+Scoring a mentee against every mentor is then a single vectorized
+AND + popcount, and the top-k is selected with argpartition instead of
+sorting the whole catalog. The index is built from the database at startup
+(and rebuilt every RECOMMENDATION_INDEX_REFRESH_SECONDS to pick up writes
+made by other workers); MentorService upserts rows in place on every
+profile write made by this process.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from services.database import supabase, run_in_db_pool
+from services.decoding import parse_timestamp
+from models.common import HelpType
+
+logger = logging.getLogger(__name__)
+
+HELP_TYPE_BITS: Dict[str, int] = {ht.value: 1 << i for i, ht in enumerate(HelpType)}
+
+# Preselection key = score * SCORE_WEIGHT + created_at (epoch seconds), so one
+# float comparison orders by shared interests, then by newest profile
+SCORE_WEIGHT = 1e11
+
+_BUILD_PAGE_SIZE = 1000
+_INITIAL_CAPACITY = 1024
+
+
+def _timestamp(value: Optional[str]) -> float:
+    return parse_timestamp(value).timestamp() if value else 0.0
+
+
+class _MentorMatrix:
+    """Column-oriented arrays holding one slot per mentor profile."""
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self.size = 0
+        self.profile_ids: List[str] = []
+        self.slot_by_profile: Dict[str, int] = {}
+        self.slot_by_user: Dict[str, int] = {}
+        self.interest_columns: Dict[str, int] = {}
+        self.bits = np.zeros((capacity, 1), dtype=np.uint64)
+        self.help = np.zeros(capacity, dtype=np.uint8)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.created = np.zeros(capacity, dtype=np.float64)
+
+    def upsert(self, row: dict) -> None:
+        """Insert or overwrite the slot of a mentor_profiles row (with embedded mentor_interests)."""
+        profile_id = str(row["id"])
+        slot = self.slot_by_profile.get(profile_id)
+        if slot is None:
+            slot = self._append(profile_id)
+        self.slot_by_user[str(row["user_id"])] = slot
+
+        help_mask = 0
+        for help_type in row.get("help_types_offered") or []:
+            help_mask |= HELP_TYPE_BITS.get(help_type, 0)
+
+        self.bits[slot] = 0
+        for link in row.get("mentor_interests") or []:
+            column = self._column(str(link["interest_id"]))
+            self.bits[slot, column >> 6] |= np.uint64(1 << (column & 63))
+
+        self.help[slot] = help_mask
+        self.active[slot] = row.get("is_active", True) is not False
+        self.created[slot] = _timestamp(row.get("created_at"))
+
+    def query_bits(self, interest_ids: Iterable[str]) -> np.ndarray:
+        """Bitset for a mentee's interests (IDs no mentor has are dropped)."""
+        query = np.zeros(self.bits.shape[1], dtype=np.uint64)
+        for interest_id in interest_ids:
+            column = self.interest_columns.get(str(interest_id))
+            if column is not None:
+                query[column >> 6] |= np.uint64(1 << (column & 63))
+        return query
+
+    def _append(self, profile_id: str) -> int:
+        slot = self.size
+        if slot == len(self.help):
+            self._grow_rows(2 * len(self.help))
+        self.size += 1
+        self.profile_ids.append(profile_id)
+        self.slot_by_profile[profile_id] = slot
+        return slot
+
+    def _column(self, interest_id: str) -> int:
+        column = self.interest_columns.get(interest_id)
+        if column is None:
+            column = len(self.interest_columns)
+            self.interest_columns[interest_id] = column
+            if column >> 6 >= self.bits.shape[1]:
+                extra = np.zeros((self.bits.shape[0], 1), dtype=np.uint64)
+                self.bits = np.hstack([self.bits, extra])
+        return column
+
+    def _grow_rows(self, capacity: int) -> None:
+        bits = np.zeros((capacity, self.bits.shape[1]), dtype=np.uint64)
+        bits[:self.size] = self.bits[:self.size]
+        self.bits = bits
+        for name in ("help", "active", "created"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+
+class RecommendationIndex:
+    """Thread-safe, incrementally updated mentor recommendation index."""
+
+    def __init__(self):
+        self._matrix = _MentorMatrix()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._building = False
+        self._pending_upserts: List[dict] = []
+        self.built_at: Optional[float] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    @property
+    def is_building(self) -> bool:
+        return self._building
+
+    def __len__(self) -> int:
+        return self._matrix.size
+
+    def build(self) -> None:
+        """Load every mentor profile (keyset-paginated by id) and swap in a fresh matrix."""
+        with self._lock:
+            self._building = True
+            self._pending_upserts = []
+
+        try:
+            matrix = _MentorMatrix()
+            last_id = None
+            while True:
+                query = supabase.table("mentor_profiles").select(
+                    "id, user_id, help_types_offered, is_active, created_at, mentor_interests(interest_id)"
+                )
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                rows = query.order("id").limit(_BUILD_PAGE_SIZE).execute().data
+                for row in rows:
+                    matrix.upsert(row)
+                if len(rows) < _BUILD_PAGE_SIZE:
+                    break
+                last_id = rows[-1]["id"]
+        except Exception:
+            with self._lock:
+                self._building = False
+                self._pending_upserts = []
+            raise
+
+        with self._lock:
+            # Writes that landed while the build was reading stay applied
+            for row in self._pending_upserts:
+                matrix.upsert(row)
+            self._matrix = matrix
+            self._building = False
+            self._pending_upserts = []
+            self._ready = True
+            self.built_at = time.time()
+
+    def upsert(self, row: dict) -> None:
+        """Apply a mentor profile write (row must embed mentor_interests)."""
+        with self._lock:
+            self._matrix.upsert(row)
+            if self._building:
+                self._pending_upserts.append(row)
+
+    def top_k(
+        self,
+        interest_ids: Iterable[str],
+        help_type: Optional[HelpType] = None,
+        excluded_user_ids: Iterable[str] = (),
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[str]:
+        """
+        Rank every eligible mentor for a mentee and return one page of profile IDs.
+
+        Eligible mentors are active, offer help_type (if given) and are not in
+        excluded_user_ids. Order is shared-interest count descending, then
+        newest profile first, then profile ID descending, the same total order
+        as the database fallback, so pages never overlap or skip on ties.
+
+        Args:
+            interest_ids: The mentee's interest IDs
+            help_type: Optional help type the mentor must offer
+            excluded_user_ids: Mentor user IDs to skip (existing requests/connections)
+            limit: Page size
+            offset: Number of ranked mentors to skip
+
+        Returns:
+            Mentor profile IDs in rank order
+        """
+        with self._lock:
+            matrix = self._matrix
+            n = matrix.size
+            if n == 0 or limit <= 0:
+                return []
+
+            query = matrix.query_bits(interest_ids)
+            scores = np.bitwise_count(matrix.bits[:n] & query).sum(axis=1, dtype=np.int64)
+            keys = scores * SCORE_WEIGHT + matrix.created[:n]
+
+            eligible = matrix.active[:n].copy()
+            if help_type is not None:
+                eligible &= (matrix.help[:n] & HELP_TYPE_BITS[help_type.value]) != 0
+            excluded_slots = [
+                slot for slot in (matrix.slot_by_user.get(str(uid)) for uid in excluded_user_ids)
+                if slot is not None
+            ]
+            eligible[excluded_slots] = False
+            keys[~eligible] = -np.inf
+
+            needed = min(offset + limit, int(np.count_nonzero(eligible)))
+            if needed <= offset:
+                return []
+
+            if needed < n:
+                # Everyone at least as good as the needed-th best key, ties at the cutoff included
+                threshold = -np.partition(-keys, needed - 1)[needed - 1]
+                top = np.flatnonzero(keys >= threshold)
+            else:
+                top = np.flatnonzero(eligible)
+
+            # Exact, total order over the survivors (the float key can't tell the ID apart)
+            created, profile_ids = matrix.created, matrix.profile_ids
+            ranked = sorted(
+                top.tolist(),
+                key=lambda slot: (scores[slot], created[slot], profile_ids[slot]),
+                reverse=True
+            )
+            return [profile_ids[slot] for slot in ranked[offset:needed]]
+
+    async def maintain(self, interval_seconds: float) -> None:
+        """Build now, then rebuild every interval_seconds (runs as a lifespan task)."""
+        while True:
+            try:
+                await run_in_db_pool(self.build)
+                logger.info("Recommendation index built with %d mentors", len(self))
+            except Exception as e:
+                logger.warning("Recommendation index build failed: %s", e)
+            if interval_seconds <= 0:
+                return
+            await asyncio.sleep(interval_seconds)
+
+
+# Global index instance
+recommendation_index = RecommendationIndex()
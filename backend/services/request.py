@@ -1,17 +1,39 @@
+import base64
+import json
 from uuid import UUID
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 from fastapi import HTTPException, status
-from datetime import datetime
 
-from services.database import supabase
-from models.request import MentorshipRequest
-from models.common import RequestStatus, HelpType
+from services.database import supabase, run_in_db_pool
+from services.decoding import decode_request, decode_requests, parse_timestamp
+from services.role_resolver import role_resolver
+from models.common import RequestStatus
 from schemas.request import (
     MentorshipRequestCreate,
     MentorshipRequestResponse,
-    MentorshipRequestListResponse
+    MentorshipRequestListResponse,
+    MentorshipRequestBatchRespond,
+    MentorshipRequestDecisionResult,
+    MentorshipRequestBatchRespondResponse
 )
 
+# Rows fetched per round trip when streaming an export or listing every request
+EXPORT_PAGE_SIZE = 500
+
+# Page size of GET /api/requests when a cursor is given without a limit
+DEFAULT_PAGE_SIZE = 50
+
+# Batch decision action -> status passed to respond_to_requests
+_ACTION_STATUS = {"accept": RequestStatus.ACCEPTED, "decline": RequestStatus.DECLINED}
+
+# respond_to_requests failure outcome -> (HTTP status, detail) matching the single-request endpoints
+_FAILED_OUTCOMES = {
+    "not_found": (status.HTTP_404_NOT_FOUND, "Mentorship request not found"),
+    "forbidden": (status.HTTP_403_FORBIDDEN, "Only the mentor can {action} this request"),
+    "already_responded": (status.HTTP_400_BAD_REQUEST, "Request has already been responded to"),
+    "invalid_status": (status.HTTP_400_BAD_REQUEST, "Invalid response status"),
+}
+
 
 class RequestService:
     """Service for mentorship request operations."""
@@ -21,8 +43,7 @@ class RequestService:
         """Create a mentorship request (mentee only)."""
         try:
             # Verify user is a mentee
-            mentee_profile = supabase.table("mentee_profiles").select("id").eq("user_id", str(user_id)).execute()
-            if not mentee_profile.data:
+            if not role_resolver.resolve(user_id).is_mentee:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Only mentees can create mentorship requests"
@@ -55,19 +76,7 @@ class RequestService:
                 )
             
             data = result.data[0]
-            request = MentorshipRequest(
-                id=UUID(data["id"]),
-                mentee_id=UUID(data["mentee_id"]),
-                mentor_id=UUID(data["mentor_id"]),
-                help_type=HelpType(data["help_type"]),
-                context=data["context"],
-                key_questions=data.get("key_questions") or [],
-                status=RequestStatus(data["status"]),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                responded_at=datetime.fromisoformat(data["responded_at"].replace("Z", "+00:00")) if data.get("responded_at") else None
-            )
-            
-            return MentorshipRequestResponse.from_model(request)
+            return decode_request(data)
             
         except HTTPException:
             raise
@@ -78,44 +87,41 @@ class RequestService:
             )
     
     @staticmethod
-    def get_requests_for_user(user_id: UUID) -> MentorshipRequestListResponse:
-        """Get user's mentorship requests (different for mentors vs mentees)."""
+    def get_requests_for_user(
+        user_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status_filter: Optional[RequestStatus] = None
+    ) -> MentorshipRequestListResponse:
+        """
+        Get the user's mentorship requests, newest first.
+        
+        Mentors see requests they received, mentees requests they sent.
+        Without limit and cursor every request is returned (as before
+        pagination existed, for clients that don't page). Otherwise pages
+        are keyset-paginated on (created_at, id); pass the returned
+        next_cursor to get the following page.
+        """
         try:
-            # Determine if user is mentor or mentee
-            mentor_check = supabase.table("mentor_profiles").select("id").eq("user_id", str(user_id)).execute()
-            mentee_check = supabase.table("mentee_profiles").select("id").eq("user_id", str(user_id)).execute()
+            column = RequestService._owner_column(user_id)
             
-            is_mentor = bool(mentor_check.data)
-            is_mentee = bool(mentee_check.data)
+            if limit is None and cursor is None:
+                rows = RequestService._fetch_all(column, user_id, status_filter)
+                requests = decode_requests(rows)
+                return MentorshipRequestListResponse(requests=requests, total=len(requests))
             
-            if not is_mentor and not is_mentee:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User profile not found"
-                )
+            limit = limit or DEFAULT_PAGE_SIZE
+            after = RequestService._decode_cursor(cursor) if cursor else None
             
-            # Get requests based on role
-            if is_mentor:
-                result = supabase.table("mentorship_requests").select("*").eq("mentor_id", str(user_id)).order("created_at", desc=True).execute()
-            else:
-                result = supabase.table("mentorship_requests").select("*").eq("mentee_id", str(user_id)).order("created_at", desc=True).execute()
+            # Fetch one extra row to learn whether another page exists
+            rows = RequestService._fetch_page(column, user_id, status_filter, after, limit + 1)
+            has_more = len(rows) > limit
+            rows = rows[:limit]
             
-            requests = []
-            for data in result.data:
-                request = MentorshipRequest(
-                    id=UUID(data["id"]),
-                    mentee_id=UUID(data["mentee_id"]),
-                    mentor_id=UUID(data["mentor_id"]),
-                    help_type=HelpType(data["help_type"]),
-                    context=data["context"],
-                    key_questions=data.get("key_questions") or [],
-                    status=RequestStatus(data["status"]),
-                    created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                    responded_at=datetime.fromisoformat(data["responded_at"].replace("Z", "+00:00")) if data.get("responded_at") else None
-                )
-                requests.append(MentorshipRequestResponse.from_model(request))
+            requests = decode_requests(rows)
+            next_cursor = RequestService._encode_cursor(rows[-1]) if has_more else None
             
-            return MentorshipRequestListResponse(requests=requests, total=len(requests))
+            return MentorshipRequestListResponse(requests=requests, total=len(requests), next_cursor=next_cursor)
             
         except HTTPException:
             raise
@@ -125,6 +131,94 @@ class RequestService:
                 detail=f"Error fetching mentorship requests: {str(e)}"
             )
     
+    @staticmethod
+    async def export_requests(
+        user_id: UUID,
+        status_filter: Optional[RequestStatus] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream all of the user's requests as NDJSON, newest first.
+        
+        The role check runs before the first byte is sent; rows are then
+        fetched EXPORT_PAGE_SIZE at a time, so memory stays constant
+        regardless of history length.
+        """
+        column = await run_in_db_pool(RequestService._owner_column, user_id)
+        
+        async def lines() -> AsyncIterator[bytes]:
+            after = None
+            while True:
+                rows = await run_in_db_pool(
+                    RequestService._fetch_page, column, user_id, status_filter, after, EXPORT_PAGE_SIZE
+                )
+                for data in rows:
+                    yield decode_request(data).model_dump_json().encode() + b"\n"
+                if len(rows) < EXPORT_PAGE_SIZE:
+                    return
+                after = (rows[-1]["created_at"], rows[-1]["id"])
+        
+        return lines()
+    
+    @staticmethod
+    def _owner_column(user_id: UUID) -> str:
+        """Requests column matching the user's role: mentor_id for mentors, else mentee_id."""
+        # Determine if user is mentor or mentee
+        roles = role_resolver.resolve(user_id)
+        if not roles.is_mentor and not roles.is_mentee:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User profile not found"
+            )
+        return "mentor_id" if roles.is_mentor else "mentee_id"
+    
+    @staticmethod
+    def _fetch_page(
+        column: str,
+        user_id: UUID,
+        status_filter: Optional[RequestStatus],
+        after: Optional[Tuple[str, str]],
+        limit: int
+    ) -> List[dict]:
+        """One keyset page ordered by (created_at, id) descending, starting after the given key."""
+        query = supabase.table("mentorship_requests").select("*").eq(column, str(user_id))
+        if status_filter:
+            query = query.eq("status", status_filter.value)
+        if after:
+            created_at, request_id = after
+            query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{request_id})')
+        return query.order("created_at", desc=True).order("id", desc=True).limit(limit).execute().data
+    
+    @staticmethod
+    def _fetch_all(column: str, user_id: UUID, status_filter: Optional[RequestStatus]) -> List[dict]:
+        """Every matching request, newest first, read EXPORT_PAGE_SIZE rows per round trip."""
+        rows: List[dict] = []
+        after = None
+        while True:
+            page = RequestService._fetch_page(column, user_id, status_filter, after, EXPORT_PAGE_SIZE)
+            rows.extend(page)
+            if len(page) < EXPORT_PAGE_SIZE:
+                return rows
+            after = (page[-1]["created_at"], page[-1]["id"])
+    
+    @staticmethod
+    def _encode_cursor(data: dict) -> str:
+        """Opaque cursor for the position just after this row."""
+        raw = json.dumps([data["created_at"], data["id"]]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, str]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            created_at, request_id = json.loads(raw)
+            parse_timestamp(created_at)
+            return created_at, str(UUID(request_id))
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
     @staticmethod
     def get_request(request_id: UUID, user_id: UUID) -> MentorshipRequestResponse:
         """Get specific mentorship request (must be involved as mentor or mentee)."""
@@ -148,19 +242,7 @@ class RequestService:
                     detail="You do not have access to this request"
                 )
             
-            request = MentorshipRequest(
-                id=UUID(data["id"]),
-                mentee_id=request_mentee_id,
-                mentor_id=request_mentor_id,
-                help_type=HelpType(data["help_type"]),
-                context=data["context"],
-                key_questions=data.get("key_questions") or [],
-                status=RequestStatus(data["status"]),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                responded_at=datetime.fromisoformat(data["responded_at"].replace("Z", "+00:00")) if data.get("responded_at") else None
-            )
-            
-            return MentorshipRequestResponse.from_model(request)
+            return decode_request(data)
             
         except HTTPException:
             raise
@@ -172,75 +254,9 @@ class RequestService:
     
     @staticmethod
     def accept_request(request_id: UUID, user_id: UUID) -> MentorshipRequestResponse:
-        """Accept a mentorship request (mentor only)."""
+        """Accept a mentorship request (mentor only) and create the connection."""
         try:
-            # Get the request
-            result = supabase.table("mentorship_requests").select("*").eq("id", str(request_id)).execute()
-            
-            if not result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Mentorship request not found"
-                )
-            
-            data = result.data[0]
-            
-            # Verify user is the mentor for this request
-            if UUID(data["mentor_id"]) != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Only the mentor can accept this request"
-                )
-            
-            # Check if already responded
-            if data["status"] != "pending":
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Request has already been responded to"
-                )
-            
-            # Update request status
-            update_dict = {
-                "status": "accepted",
-                "responded_at": datetime.utcnow().isoformat()
-            }
-            
-            updated_result = supabase.table("mentorship_requests").update(update_dict).eq("id", str(request_id)).execute()
-            
-            if not updated_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to accept request"
-                )
-            
-            updated_data = updated_result.data[0]
-            
-            # Create connection
-            connection_dict = {
-                "mentor_id": str(user_id),
-                "mentee_id": updated_data["mentee_id"],
-                "request_id": str(request_id)
-            }
-            
-            # Check if connection already exists (shouldn't, but be safe)
-            existing_connection = supabase.table("connections").select("id").eq("mentor_id", str(user_id)).eq("mentee_id", updated_data["mentee_id"]).execute()
-            if not existing_connection.data:
-                supabase.table("connections").insert(connection_dict).execute()
-            
-            request = MentorshipRequest(
-                id=UUID(updated_data["id"]),
-                mentee_id=UUID(updated_data["mentee_id"]),
-                mentor_id=UUID(updated_data["mentor_id"]),
-                help_type=HelpType(updated_data["help_type"]),
-                context=updated_data["context"],
-                key_questions=updated_data.get("key_questions") or [],
-                status=RequestStatus(updated_data["status"]),
-                created_at=datetime.fromisoformat(updated_data["created_at"].replace("Z", "+00:00")),
-                responded_at=datetime.fromisoformat(updated_data["responded_at"].replace("Z", "+00:00")) if updated_data.get("responded_at") else None
-            )
-            
-            return MentorshipRequestResponse.from_model(request)
-            
+            return RequestService._respond(request_id, user_id, RequestStatus.ACCEPTED, "accept")
         except HTTPException:
             raise
         except Exception as e:
@@ -253,66 +269,128 @@ class RequestService:
     def decline_request(request_id: UUID, user_id: UUID) -> MentorshipRequestResponse:
         """Decline a mentorship request (mentor only)."""
         try:
-            # Get the request
-            result = supabase.table("mentorship_requests").select("*").eq("id", str(request_id)).execute()
-            
-            if not result.data:
+            return RequestService._respond(request_id, user_id, RequestStatus.DECLINED, "decline")
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error declining mentorship request: {str(e)}"
+            )
+    
+    @staticmethod
+    def _respond(request_id: UUID, user_id: UUID, new_status: RequestStatus, action: str) -> MentorshipRequestResponse:
+        """
+        Run the pending -> accepted/declined transition in one round trip.
+        
+        respond_to_request (database/respond_to_request.sql) updates the row
+        only while it is still pending and, on accept, inserts the connection
+        in the same transaction, so concurrent responses cannot both succeed.
+        """
+        # Imported here: postgrest is loaded with the Supabase client, not at app import
+        from postgrest.exceptions import APIError
+        
+        try:
+            result = supabase.rpc("respond_to_request", {
+                "p_request_id": str(request_id),
+                "p_mentor_id": str(user_id),
+                "p_status": new_status.value
+            }).execute()
+        except APIError as e:
+            if e.code == "P0002":
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Mentorship request not found"
                 )
-            
-            data = result.data[0]
-            
-            # Verify user is the mentor for this request
-            if UUID(data["mentor_id"]) != user_id:
+            if e.code == "42501":
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Only the mentor can decline this request"
+                    detail=f"Only the mentor can {action} this request"
                 )
-            
-            # Check if already responded
-            if data["status"] != "pending":
+            if e.code == "P0001":
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Request has already been responded to"
                 )
-            
-            # Update request status
-            update_dict = {
-                "status": "declined",
-                "responded_at": datetime.utcnow().isoformat()
-            }
-            
-            updated_result = supabase.table("mentorship_requests").update(update_dict).eq("id", str(request_id)).execute()
-            
-            if not updated_result.data:
+            raise
+        
+        updated_data = result.data
+        if not updated_data:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to {action} request"
+            )
+        
+        return decode_request(updated_data)
+    
+    @staticmethod
+    def respond_to_requests(
+        user_id: UUID,
+        batch: MentorshipRequestBatchRespond
+    ) -> MentorshipRequestBatchRespondResponse:
+        """
+        Accept/decline several requests (mentor only) in one round trip.
+        
+        respond_to_requests (database/respond_to_requests.sql) classifies
+        every decision with one read, applies all status changes with one
+        UPDATE and creates the connections with one INSERT, in a single
+        transaction. Decisions that cannot be applied are reported per item
+        with the status code the single-request endpoint would have used;
+        they do not fail the rest of the batch.
+        """
+        try:
+            request_ids = [decision.request_id for decision in batch.decisions]
+            if len(set(request_ids)) != len(request_ids):
                 raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to decline request"
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Each request can only appear once per batch"
                 )
             
-            updated_data = updated_result.data[0]
-            
-            request = MentorshipRequest(
-                id=UUID(updated_data["id"]),
-                mentee_id=UUID(updated_data["mentee_id"]),
-                mentor_id=UUID(updated_data["mentor_id"]),
-                help_type=HelpType(updated_data["help_type"]),
-                context=updated_data["context"],
-                key_questions=updated_data.get("key_questions") or [],
-                status=RequestStatus(updated_data["status"]),
-                created_at=datetime.fromisoformat(updated_data["created_at"].replace("Z", "+00:00")),
-                responded_at=datetime.fromisoformat(updated_data["responded_at"].replace("Z", "+00:00")) if updated_data.get("responded_at") else None
+            result = supabase.rpc("respond_to_requests", {
+                "p_mentor_id": str(user_id),
+                "p_items": [
+                    {"request_id": str(decision.request_id), "status": _ACTION_STATUS[decision.action].value}
+                    for decision in batch.decisions
+                ]
+            }).execute()
+            rows = {row["request_id"]: row for row in result.data or []}
+            
+            results = []
+            for decision in batch.decisions:
+                row = rows.get(str(decision.request_id))
+                if row is not None and row.get("request"):
+                    results.append(MentorshipRequestDecisionResult(
+                        request_id=decision.request_id,
+                        action=decision.action,
+                        success=True,
+                        status_code=status.HTTP_200_OK,
+                        request=decode_request(row["request"])
+                    ))
+                    continue
+                
+                status_code, detail = _FAILED_OUTCOMES.get(
+                    row["outcome"] if row else None,
+                    (status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to {action} request")
+                )
+                results.append(MentorshipRequestDecisionResult(
+                    request_id=decision.request_id,
+                    action=decision.action,
+                    success=False,
+                    status_code=status_code,
+                    detail=detail.format(action=decision.action)
+                ))
+            
+            succeeded = sum(1 for item in results if item.success)
+            return MentorshipRequestBatchRespondResponse(
+                results=results,
+                succeeded=succeeded,
+                failed=len(results) - succeeded
             )
             
-            return MentorshipRequestResponse.from_model(request)
-            
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error declining mentorship request: {str(e)}"
+                detail=f"Error responding to mentorship requests: {str(e)}"
             )
-
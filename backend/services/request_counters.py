@@ -0,0 +1,39 @@
+"""
+Reconciliation of the maintained per-mentor pending request counters.
+
+mentor_profiles.pending_requests is updated by a trigger on
+mentorship_requests (database/add_pending_request_counters.sql) in the same
+transaction that creates, accepts, declines or deletes a request. The
+reconciliation recomputes the counters server-side to repair any drift.
+
+It is best scheduled in the database (pg_cron, see the migration). Setting
+PENDING_COUNTER_RECONCILE_SECONDS runs it from the API instead; the SQL
+function takes an advisory lock, so when several workers do this only one
+run at a time does any work.
+"""
+import asyncio
+import logging
+
+from services.database import supabase, run_in_db_pool
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_pending_request_counts() -> int:
+    """Recompute every counter in one RPC. Returns the number of corrected mentors."""
+    result = supabase.rpc("reconcile_pending_request_counts").execute()
+    return result.data or 0
+
+
+async def maintain_pending_request_counts(interval_seconds: float) -> None:
+    """Reconcile every interval_seconds (runs as a lifespan task; the migration backfills)."""
+    if interval_seconds <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            corrected = await run_in_db_pool(reconcile_pending_request_counts)
+            if corrected:
+                logger.warning("Reconciled pending request counters for %d mentors", corrected)
+        except Exception as e:
+            logger.warning("Pending request counter reconciliation failed: %s", e)
@@ -0,0 +1,72 @@
+"""
+Cached resolution of a user's mentor/mentee profile IDs.
+
+Several services need to know whether the caller is a mentor, a mentee or
+both before doing any real work. Profiles are created once and almost never
+change, so the answer is cached per user for ROLE_CACHE_TTL_SECONDS.
+MentorService/MenteeService invalidate on profile creation and UserService
+on role updates; other workers pick up changes when their entry expires.
+"""
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from config import settings
+from services.cache import TTLCache
+from services.loaders import get_loaders
+
+
+class UserRoles(NamedTuple):
+    """Profile IDs a user holds (None when the profile does not exist)."""
+    mentor_profile_id: Optional[UUID]
+    mentee_profile_id: Optional[UUID]
+
+    @property
+    def is_mentor(self) -> bool:
+        return self.mentor_profile_id is not None
+
+    @property
+    def is_mentee(self) -> bool:
+        return self.mentee_profile_id is not None
+
+
+class RoleResolver:
+    """TTL-cached lookup of UserRoles by user ID."""
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def resolve(self, user_id: UUID) -> UserRoles:
+        """
+        Return the user's profile IDs, querying only on a cache miss.
+
+        Misses go through the request's batch loaders, so the profile rows
+        fetched here are reused by the rest of the request. Users without
+        any profile are not cached, so a profile created through another
+        worker is seen immediately.
+        """
+        key = str(user_id)
+        roles = self.cache.get(key)
+        if roles is not None:
+            return roles
+
+        loaders = get_loaders()
+        mentor = loaders.mentor_profiles_by_user.load_sync(user_id)
+        mentee = loaders.mentee_profiles_by_user.load_sync(user_id)
+        roles = UserRoles(
+            mentor_profile_id=UUID(mentor["id"]) if mentor else None,
+            mentee_profile_id=UUID(mentee["id"]) if mentee else None
+        )
+        if roles.is_mentor or roles.is_mentee:
+            self.cache.set(key, roles)
+        return roles
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget a user's cached roles after a profile or role write."""
+        self.cache.invalidate(str(user_id))
+
+
+# Global resolver instance
+role_resolver = RoleResolver(
+    ttl_seconds=settings.ROLE_CACHE_TTL_SECONDS,
+    max_size=settings.ROLE_CACHE_MAX_SIZE
+)
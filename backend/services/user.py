@@ -3,7 +3,9 @@ from fastapi import HTTPException, status
 from datetime import datetime
 
 from services.database import supabase
-from models.user import UserProfile
+from services.decoding import decode_user
+from services.loaders import get_loaders
+from services.role_resolver import role_resolver
 from schemas.user import UserProfileUpdate, UserProfileResponse
 
 
@@ -14,24 +16,15 @@ class UserService:
     def get_user_profile(user_id: UUID) -> UserProfileResponse:
         """Get user profile by ID."""
         try:
-            result = supabase.table("user_profiles").select("*").eq("id", str(user_id)).execute()
+            data = get_loaders().user_profiles.load_sync(user_id)
             
-            if not result.data:
+            if not data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="User profile not found"
                 )
             
-            data = result.data[0]
-            user_profile = UserProfile(
-                id=UUID(data["id"]),
-                full_name=data.get("full_name"),
-                role=data["role"],
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            )
-            
-            return UserProfileResponse.from_model(user_profile)
+            return decode_user(data)
             
         except HTTPException:
             raise
@@ -57,9 +50,10 @@ class UserService:
                 return UserService.get_user_profile(user_id)
 
             # Check if profile exists
-            check_result = supabase.table("user_profiles").select("id").eq("id", str(user_id)).execute()
+            loaders = get_loaders()
+            existing = loaders.user_profiles.load_sync(user_id)
 
-            if check_result.data:
+            if existing:
                 # Profile exists, update it
                 update_dict["updated_at"] = datetime.utcnow().isoformat()
                 result = supabase.table("user_profiles").update(update_dict).eq("id", str(user_id)).execute()
@@ -82,15 +76,9 @@ class UserService:
                 )
 
             data = result.data[0]
-            user_profile = UserProfile(
-                id=UUID(data["id"]),
-                full_name=data.get("full_name"),
-                role=data["role"],
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00"))
-            )
-
-            return UserProfileResponse.from_model(user_profile)
+            loaders.user_profiles.prime(user_id, data)
+            role_resolver.invalidate(user_id)
+            return decode_user(data)
 
         except HTTPException:
             raise
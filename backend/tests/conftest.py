@@ -0,0 +1,32 @@
+"""
+Shared fixtures.
+
+Services run against benchmarks.fake_postgrest, the in-memory PostgREST
+stand-in, plugged into a real supabase client. Every round trip is counted
+by the fake, so tests can assert on query counts.
+"""
+import os
+
+os.environ.setdefault("SUPABASE_URL", "http://fake-postgrest.local")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-service-role-key")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from supabase import ClientOptions, create_client  # noqa: E402
+
+from benchmarks.fake_postgrest import FakePostgREST  # noqa: E402
+from config import settings  # noqa: E402
+from services import database  # noqa: E402
+
+
+@pytest.fixture
+def fake(monkeypatch) -> FakePostgREST:
+    """A fresh fake database, used by every service for the test's duration."""
+    fake = FakePostgREST()
+    client = create_client(
+        settings.SUPABASE_URL,
+        settings.SUPABASE_SERVICE_ROLE_KEY,
+        options=ClientOptions(httpx_client=httpx.Client(transport=fake.transport()))
+    )
+    monkeypatch.setattr(database, "_client", client)
+    return fake
@@ -0,0 +1,69 @@
+import time
+import uuid
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from config import Settings, get_settings
+from middleware.auth import get_current_user, require_admin
+
+
+SECRET = "test-jwt-secret"
+
+
+def _settings(**overrides) -> Settings:
+    settings = Settings()
+    settings.AUTH_VERIFICATION_MODE = "local"
+    settings.SUPABASE_JWT_SECRET = SECRET
+    settings.ADMIN_USER_IDS = []
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return settings
+
+
+def _token(user_id: str) -> str:
+    claims = {"sub": user_id, "aud": "authenticated", "exp": int(time.time()) + 300}
+    return jwt.encode(claims, SECRET, algorithm="HS256")
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(user_id=Depends(get_current_user)):
+        return {"user_id": str(user_id)}
+
+    @app.get("/admin")
+    async def admin(user_id=Depends(require_admin)):
+        return {"user_id": str(user_id)}
+
+    return app
+
+
+def test_overridden_settings_verify_tokens_locally(app):
+    user_id = str(uuid.uuid4())
+    app.dependency_overrides[get_settings] = lambda: _settings()
+    client = TestClient(app)
+
+    response = client.get("/me", headers={"Authorization": f"Bearer {_token(user_id)}"})
+    assert response.status_code == 200
+    assert response.json() == {"user_id": user_id}
+
+    forged = jwt.encode({"sub": user_id, "aud": "authenticated"}, "wrong-secret", algorithm="HS256")
+    response = client.get("/me", headers={"Authorization": f"Bearer {forged}"})
+    assert response.status_code == 401
+
+
+def test_overridden_settings_decide_admin_access(app):
+    user_id = str(uuid.uuid4())
+    headers = {"Authorization": f"Bearer {_token(user_id)}"}
+    client = TestClient(app)
+
+    app.dependency_overrides[get_settings] = lambda: _settings()
+    assert client.get("/admin", headers=headers).status_code == 403
+
+    app.dependency_overrides[get_settings] = lambda: _settings(ADMIN_USER_IDS=[user_id])
+    assert client.get("/admin", headers=headers).status_code == 200
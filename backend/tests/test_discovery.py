@@ -0,0 +1,80 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.database import supabase
+from services.discovery_service import DiscoveryService, feed_sessions
+from services.interest_catalog import interest_catalog
+
+MENTORS = 30
+PAGE = 10
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _mentor(i: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": str(uuid.uuid4()),
+        "industry": "Engineering",
+        "help_types_offered": ["resume_review"],
+        "created_at": (START + timedelta(minutes=i)).isoformat(),
+    }
+
+
+@pytest.fixture
+def mentee_id(fake) -> uuid.UUID:
+    mentee = uuid.uuid4()
+    fake.insert_rows("mentor_profiles", [_mentor(i) for i in range(MENTORS)])
+    fake.insert_rows("mentee_profiles", [
+        {"id": str(uuid.uuid4()), "user_id": str(mentee), "industry": "engineering", "created_at": START.isoformat()}
+    ])
+    interest_catalog.load()
+    feed_sessions.clear()
+    return mentee
+
+
+def _page(mentee_id, offset: int = 0, session_id=None) -> dict:
+    return asyncio.run(DiscoveryService.browse_mentors(mentee_id, limit=PAGE, offset=offset, session_id=session_id))
+
+
+def _ids(page: dict) -> list:
+    return [str(entry["mentor"].id) for entry in page["mentors"]]
+
+
+def _candidates(mentee_id, session_id: str) -> tuple:
+    return asyncio.run(DiscoveryService._feed_candidates(mentee_id, session_id, "engineering", None))
+
+
+def test_rebuilt_session_keeps_surviving_mentors_in_order(fake, mentee_id):
+    session_id = _page(mentee_id)["session_id"]
+    before = _candidates(mentee_id, session_id)
+
+    # The session expires while one mentor leaves and another joins
+    feed_sessions.clear()
+    supabase.table("mentor_profiles").update({"is_active": False}).eq("id", before[5]).execute()
+    fake.insert_rows("mentor_profiles", [_mentor(MENTORS)])
+    after = _candidates(mentee_id, session_id)
+
+    survivors = [mentor_id for mentor_id in before if mentor_id != before[5]]
+    assert [mentor_id for mentor_id in after if mentor_id in set(before)] == survivors
+    assert len(after) == MENTORS
+
+
+def test_paging_across_a_rebuilt_session_neither_overlaps_nor_skips(fake, mentee_id):
+    first = _page(mentee_id)
+    session_id = first["session_id"]
+    order = _candidates(mentee_id, session_id)
+
+    # Expire the session, and drop a mentor the client has not reached yet
+    feed_sessions.clear()
+    removed = order[-1]
+    supabase.table("mentor_profiles").update({"is_active": False}).eq("id", removed).execute()
+
+    seen = _ids(first)
+    for offset in range(PAGE, MENTORS, PAGE):
+        seen += _ids(_page(mentee_id, offset, session_id))
+
+    assert len(seen) == len(set(seen))
+    assert set(seen) == set(order) - {removed}
@@ -0,0 +1,57 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from config import Settings
+from services import health
+from services.health import HealthChecker
+from services.interest_catalog import InterestCatalog
+from services.recommendation_index import RecommendationIndex
+
+
+@pytest.fixture
+def checker(fake, monkeypatch) -> HealthChecker:
+    fake.insert_rows("interests", [{"id": str(uuid.uuid4()), "name": "Python", "category": "technology"}])
+    monkeypatch.setattr(health, "interest_catalog", InterestCatalog(ttl_seconds=300))
+    monkeypatch.setattr(health, "recommendation_index", RecommendationIndex())
+
+    settings = Settings()
+    settings.READINESS_REQUIRE_WARM_CACHES = True
+    checker = HealthChecker(settings)
+
+    async def reachable() -> None:
+        pass
+
+    monkeypatch.setattr(checker, "check_supabase", reachable)
+    monkeypatch.setattr(checker, "check_auth", reachable)
+    return checker
+
+
+def test_failed_startup_load_is_retried_until_ready(fake, checker, monkeypatch):
+    handle = fake._handle
+    monkeypatch.setattr(fake, "_handle", lambda request: httpx.Response(500, json={"message": "connection refused"}))
+    with pytest.raises(Exception):
+        health.interest_catalog.load()
+
+    asyncio.run(checker.check_once())
+    report = checker.readiness()
+    assert report["status"] == "warming_up"
+    assert report["warmup"] == {"interest_catalog": False, "recommendation_index": False}
+
+    monkeypatch.setattr(fake, "_handle", handle)
+    asyncio.run(checker.check_once())
+    report = checker.readiness()
+    assert report["status"] == "ready"
+    assert report["warmup"] == {"interest_catalog": True, "recommendation_index": True}
+
+
+def test_warm_caches_are_not_reloaded(fake, checker):
+    asyncio.run(checker.check_once())
+    fake.reset_counters()
+
+    asyncio.run(checker.check_once())
+
+    assert checker.readiness()["status"] == "ready"
+    assert fake.request_count == 0
@@ -0,0 +1,46 @@
+import uuid
+
+import pytest
+
+from services.database import supabase
+from services.interest_catalog import InterestCatalog
+
+
+@pytest.fixture
+def catalog(fake) -> InterestCatalog:
+    fake.insert_rows("interests", [
+        {"id": str(uuid.uuid4()), "name": "Python", "category": "technology"},
+        {"id": str(uuid.uuid4()), "name": "Painting", "category": "arts"},
+    ])
+    catalog = InterestCatalog(ttl_seconds=300)
+    catalog.load()
+    return catalog
+
+
+def test_in_place_edit_is_picked_up_after_ttl(fake, catalog):
+    etag = catalog.etag
+    supabase.table("interests").update({"name": "Watercolor"}).eq("name", "Painting").execute()
+
+    catalog.invalidate()
+    names = {interest.name for interest in catalog.all()}
+
+    assert names == {"Python", "Watercolor"}
+    assert catalog.etag != etag
+
+
+def test_unchanged_catalog_is_not_reloaded(fake, catalog):
+    catalog.invalidate()
+    fake.reset_counters()
+
+    catalog.all()
+
+    # Only the version probe
+    assert fake.request_count == 1
+
+
+def test_unknown_categories_are_not_cached(catalog):
+    assert catalog.to_json("no-such-category") == b"[]"
+    catalog.to_json("arts")
+    catalog.to_json()
+
+    assert set(catalog._json) == {"arts", None}
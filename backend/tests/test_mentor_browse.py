@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.interest_catalog import interest_catalog
+from services.mentor import MentorService
+
+MENTORS = 60
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mentee_id(fake) -> uuid.UUID:
+    interests = [{"id": str(uuid.uuid4()), "name": f"interest{i}", "category": "technology"} for i in range(10)]
+    mentors = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": str(uuid.uuid4()),
+            "industry": "Engineering",
+            "help_types_offered": ["resume_review"],
+            "created_at": (START + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(MENTORS)
+    ]
+    links = [
+        {"mentor_profile_id": mentor["id"], "interest_id": interests[(i + k) % len(interests)]["id"]}
+        for i, mentor in enumerate(mentors)
+        for k in range(3)
+    ]
+    mentee = uuid.uuid4()
+    fake.insert_rows("interests", interests)
+    fake.insert_rows("mentor_profiles", mentors)
+    fake.insert_rows("mentor_interests", links)
+    # One mentor already requested, one already connected: both are excluded from browse
+    fake.insert_rows("mentorship_requests", [
+        {"id": str(uuid.uuid4()), "mentee_id": str(mentee), "mentor_id": mentors[0]["user_id"], "status": "pending"}
+    ])
+    fake.insert_rows("connections", [
+        {"id": str(uuid.uuid4()), "mentee_id": str(mentee), "mentor_id": mentors[1]["user_id"]}
+    ])
+    interest_catalog.load()
+    return mentee
+
+
+@pytest.mark.parametrize("limit", [1, 5, 20, 50])
+def test_browse_query_count_does_not_grow_with_page_size(fake, mentee_id, limit):
+    fake.reset_counters()
+
+    mentors = MentorService.browse_mentors(mentee_id, limit=limit)
+
+    assert len(mentors) == limit
+    assert all(len(mentor.interests) == 3 for mentor in mentors)
+    # Request exclusions, connection exclusions, the page itself
+    assert fake.request_count == 3, dict(fake.requests_by_table)
+
+
+def test_browse_pages_do_not_overlap(fake, mentee_id):
+    first = MentorService.browse_mentors(mentee_id, limit=20)
+    second = MentorService.browse_mentors(mentee_id, limit=20, offset=20)
+
+    assert not {mentor.id for mentor in first} & {mentor.id for mentor in second}
@@ -0,0 +1,75 @@
+import asyncio
+import uuid
+
+import pytest
+
+from benchmarks.fake_postgrest import RPCError
+from services.interest_catalog import interest_catalog
+from services.profile_import import ProfileImporter
+
+
+@pytest.fixture
+def users(fake) -> list:
+    fake.insert_rows("interests", [
+        {"id": str(uuid.uuid4()), "name": "Python", "category": "technology"},
+        {"id": str(uuid.uuid4()), "name": "Design", "category": "arts"},
+    ])
+    users = [str(uuid.uuid4()) for _ in range(6)]
+    fake.insert_rows("user_profiles", [{"id": user, "full_name": "Mentor", "role": "mentor"} for user in users])
+    interest_catalog.load()
+    return users
+
+
+def _upload(users: list) -> bytes:
+    lines = ["user_id,industry,help_types_offered,interests"]
+    lines += [f"{user},Engineering,resume_review;career_advice,Python;Design" for user in users]
+    return "\n".join(lines).encode()
+
+
+def _run_import(body: bytes, chunk_size: int = 2):
+    async def stream():
+        yield body
+
+    importer = ProfileImporter("mentors", "csv", chunk_size)
+    return asyncio.run(importer.run(stream()))
+
+
+def test_import_creates_profiles_with_interest_links(fake, users):
+    result = _run_import(_upload(users))
+
+    assert (result.imported, result.failed) == (len(users), 0)
+    assert len(fake.tables["mentor_profiles"]) == len(users)
+    assert len(fake.tables["mentor_interests"]) == 2 * len(users)
+
+
+def test_failed_chunk_creates_nothing_and_can_be_retried(fake, users):
+    import_function = fake.rpc_functions["import_mentor_profiles"]
+    calls = []
+
+    def fail_second_chunk(params):
+        calls.append(params)
+        if len(calls) == 2:
+            raise RPCError("insert or update on table violates foreign key constraint", "23503")
+        return import_function(params)
+
+    fake.rpc_functions["import_mentor_profiles"] = fail_second_chunk
+    result = _run_import(_upload(users))
+
+    assert (result.imported, result.failed) == (4, 2)
+    assert all(error.detail.startswith("Chunk insert failed") for error in result.errors)
+    failed_users = [error.user_id for error in result.errors]
+    assert not any(row["user_id"] in failed_users for row in fake.tables["mentor_profiles"])
+
+    # Re-uploading the failed rows imports them instead of reporting "already exists"
+    fake.rpc_functions["import_mentor_profiles"] = import_function
+    retry = _run_import(_upload(failed_users))
+
+    assert (retry.imported, retry.failed) == (2, 0)
+    assert len(fake.tables["mentor_interests"]) == 2 * len(users)
+
+
+def test_duplicate_user_in_chunk_is_reported(fake, users):
+    result = _run_import(_upload([users[0], users[0], users[1]]), chunk_size=10)
+
+    assert (result.imported, result.failed) == (2, 1)
+    assert result.errors[0].detail == "Duplicate user_id in upload"
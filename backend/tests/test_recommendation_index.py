@@ -0,0 +1,33 @@
+import uuid
+
+from services.recommendation_index import RecommendationIndex
+
+INTERESTS = [str(uuid.uuid4()) for _ in range(4)]
+SAME_TIME = "2024-01-01T00:00:00+00:00"
+
+
+def _index_with_ties(count: int) -> RecommendationIndex:
+    """Mentors in a few score groups, all created at the same instant."""
+    index = RecommendationIndex()
+    for i in range(count):
+        index.upsert({
+            "id": str(uuid.uuid4()),
+            "user_id": str(uuid.uuid4()),
+            "help_types_offered": ["resume_review"],
+            "is_active": True,
+            "created_at": SAME_TIME,
+            "mentor_interests": [{"interest_id": interest} for interest in INTERESTS[:i % 3]],
+        })
+    return index
+
+
+def test_ties_are_broken_by_profile_id_across_pages():
+    index = _index_with_ties(90)
+    scores = {profile_id: slot % 3 for slot, profile_id in enumerate(index._matrix.profile_ids)}
+    expected = sorted(scores, key=lambda profile_id: (scores[profile_id], profile_id), reverse=True)
+
+    pages = [index.top_k(INTERESTS, limit=7, offset=offset) for offset in range(0, 90, 7)]
+
+    assert [profile_id for page in pages for profile_id in page] == expected
+    # Repeated queries return the same page
+    assert index.top_k(INTERESTS, limit=7, offset=14) == pages[2]
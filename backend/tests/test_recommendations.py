@@ -0,0 +1,60 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services import recommendation
+from services.database import supabase
+from services.interest_catalog import interest_catalog
+from services.recommendation import RecommendationService
+from services.recommendation_index import RecommendationIndex
+
+MENTORS = 12
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mentee_id(fake, monkeypatch) -> uuid.UUID:
+    interest = {"id": str(uuid.uuid4()), "name": "Python", "category": "technology"}
+    mentors = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": str(uuid.uuid4()),
+            "help_types_offered": ["resume_review"],
+            "created_at": (START + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(MENTORS)
+    ]
+    mentee, mentee_profile = uuid.uuid4(), str(uuid.uuid4())
+    fake.insert_rows("interests", [interest])
+    fake.insert_rows("mentor_profiles", mentors)
+    fake.insert_rows("mentor_interests", [
+        {"mentor_profile_id": mentor["id"], "interest_id": interest["id"]} for mentor in mentors
+    ])
+    fake.insert_rows("mentee_profiles", [{"id": mentee_profile, "user_id": str(mentee)}])
+    fake.insert_rows("mentee_interests", [{"mentee_profile_id": mentee_profile, "interest_id": interest["id"]}])
+    interest_catalog.load()
+
+    index = RecommendationIndex()
+    index.build()
+    monkeypatch.setattr(recommendation, "recommendation_index", index)
+    return mentee
+
+
+def test_mentors_dropped_since_the_index_was_built_are_backfilled(fake, mentee_id):
+    ranked = [mentor.id for mentor in RecommendationService.get_recommended_mentors(mentee_id, limit=MENTORS)]
+
+    # Another worker deactivates two mentors of the first page; this index never hears about it
+    gone = ranked[1:3]
+    for mentor_id in gone:
+        supabase.table("mentor_profiles").update({"is_active": False}).eq("id", str(mentor_id)).execute()
+
+    page = [mentor.id for mentor in RecommendationService.get_recommended_mentors(mentee_id, limit=5)]
+
+    assert page == [mentor_id for mentor_id in ranked if mentor_id not in gone][:5]
+
+
+def test_short_last_page_stops_at_the_end_of_the_ranking(fake, mentee_id):
+    page = RecommendationService.get_recommended_mentors(mentee_id, limit=5, offset=MENTORS - 2)
+
+    assert len(page) == 2
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.request import EXPORT_PAGE_SIZE, RequestService
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+REQUESTS = EXPORT_PAGE_SIZE + 20
+
+
+@pytest.fixture
+def mentor_id(fake) -> uuid.UUID:
+    mentor = uuid.uuid4()
+    fake.insert_rows("mentor_profiles", [{"user_id": str(mentor)}])
+    fake.insert_rows("mentorship_requests", [
+        {
+            "mentee_id": str(uuid.uuid4()),
+            "mentor_id": str(mentor),
+            "help_type": "resume_review",
+            "context": "hi",
+            # Pairs share a timestamp, so the id tiebreak is exercised
+            "created_at": (START + timedelta(minutes=i // 2)).isoformat(),
+        }
+        for i in range(REQUESTS)
+    ])
+    return mentor
+
+
+def test_unpaginated_call_returns_every_request(mentor_id):
+    page = RequestService.get_requests_for_user(mentor_id)
+
+    assert page.total == len(page.requests) == REQUESTS
+    assert page.next_cursor is None
+
+
+def test_pages_cover_every_request_once_in_order(mentor_id):
+    everything = [request.id for request in RequestService.get_requests_for_user(mentor_id).requests]
+
+    paged, cursor = [], None
+    while True:
+        page = RequestService.get_requests_for_user(mentor_id, limit=50, cursor=cursor)
+        paged += [request.id for request in page.requests]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert paged == everything
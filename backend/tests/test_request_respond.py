@@ -0,0 +1,126 @@
+"""
+Contract tests for the respond_to_request result codes.
+
+These run against the in-memory fake, which serializes every call, so they
+check how each outcome of the RPC surfaces (status change, connection, HTTP
+error) rather than the row locking in database/respond_to_request.sql that
+keeps concurrent responses apart.
+"""
+import uuid
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from middleware.auth import get_current_user
+from routes import requests as request_routes
+from services.request import RequestService
+
+
+@pytest.fixture
+def pending_request(fake) -> dict:
+    request = {
+        "id": str(uuid.uuid4()),
+        "mentee_id": str(uuid.uuid4()),
+        "mentor_id": str(uuid.uuid4()),
+        "help_type": "resume_review",
+        "context": "Could you review my resume?",
+    }
+    fake.insert_rows("mentorship_requests", [request])
+    return request
+
+
+def _ids(request: dict) -> tuple:
+    return uuid.UUID(request["id"]), uuid.UUID(request["mentor_id"])
+
+
+def test_accept_creates_one_connection_and_a_second_accept_is_rejected(fake, pending_request):
+    accepted = RequestService.accept_request(*_ids(pending_request))
+    assert accepted.status == "accepted"
+
+    with pytest.raises(HTTPException) as error:
+        RequestService.accept_request(*_ids(pending_request))
+
+    assert error.value.status_code == 400
+    assert len(fake.tables["connections"]) == 1
+
+
+def test_decline_after_accept_is_rejected_and_changes_nothing(fake, pending_request):
+    RequestService.accept_request(*_ids(pending_request))
+
+    with pytest.raises(HTTPException) as error:
+        RequestService.decline_request(*_ids(pending_request))
+
+    assert error.value.status_code == 400
+    assert fake.tables["mentorship_requests"][0]["status"] == "accepted"
+    assert len(fake.tables["connections"]) == 1
+
+
+@pytest.mark.parametrize("request_id, mentor_id, status_code", [
+    (uuid.uuid4(), None, 404),
+    (None, uuid.uuid4(), 403),
+])
+def test_unknown_request_and_other_mentor_are_rejected(fake, pending_request, request_id, mentor_id, status_code):
+    own_request_id, own_mentor_id = _ids(pending_request)
+
+    with pytest.raises(HTTPException) as error:
+        RequestService.accept_request(request_id or own_request_id, mentor_id or own_mentor_id)
+
+    assert error.value.status_code == status_code
+    assert fake.tables["mentorship_requests"][0]["status"] == "pending"
+    assert fake.tables.get("connections", []) == []
+
+
+def test_batch_reports_each_decision_and_applies_the_valid_ones(fake):
+    mentor, other_mentor = str(uuid.uuid4()), str(uuid.uuid4())
+
+    def request(mentor_id: str, status: str = "pending") -> dict:
+        return {
+            "id": str(uuid.uuid4()),
+            "mentee_id": str(uuid.uuid4()),
+            "mentor_id": mentor_id,
+            "help_type": "resume_review",
+            "context": "Could you review my resume?",
+            "status": status,
+        }
+
+    to_accept, to_decline, answered, foreign = request(mentor), request(mentor), request(mentor, "declined"), request(other_mentor)
+    fake.insert_rows("mentorship_requests", [to_accept, to_decline, answered, foreign])
+    missing = str(uuid.uuid4())
+
+    app = FastAPI()
+    app.include_router(request_routes.router, prefix="/api/requests")
+    app.dependency_overrides[get_current_user] = lambda: uuid.UUID(mentor)
+    response = TestClient(app).patch("/api/requests/batch", json={"decisions": [
+        {"request_id": to_accept["id"], "action": "accept"},
+        {"request_id": missing, "action": "accept"},
+        {"request_id": foreign["id"], "action": "decline"},
+        {"request_id": answered["id"], "action": "accept"},
+        {"request_id": to_decline["id"], "action": "decline"},
+    ]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (2, 3)
+    outcomes = [(item["request_id"], item["success"], item["status_code"]) for item in body["results"]]
+    assert outcomes == [
+        (to_accept["id"], True, 200),
+        (missing, False, 404),
+        (foreign["id"], False, 403),
+        (answered["id"], False, 400),
+        (to_decline["id"], True, 200),
+    ]
+    assert body["results"][0]["request"]["status"] == "accepted"
+    assert body["results"][4]["request"]["status"] == "declined"
+    assert body["results"][2]["detail"] == "Only the mentor can decline this request"
+    assert body["results"][3]["detail"] == "Request has already been responded to"
+
+    stored = {row["id"]: row["status"] for row in fake.tables["mentorship_requests"]}
+    assert stored == {
+        to_accept["id"]: "accepted",
+        to_decline["id"]: "declined",
+        answered["id"]: "declined",
+        foreign["id"]: "pending",
+    }
+    connections = fake.tables.get("connections", [])
+    assert [(c["mentor_id"], c["mentee_id"]) for c in connections] == [(mentor, to_accept["mentee_id"])]